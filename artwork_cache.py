@@ -0,0 +1,396 @@
+"""
+Downloaded artwork cache for iiSU Asset Tool.
+
+Downloads are stored once per distinct content: each image is a blob named by
+the SHA-256 of its bytes, sharded into two-level hex subdirectories of the
+cache directory (e.g. "ab/cd/abcd....bin"). A small SQLite index maps entry
+names (derived from the download URL) to blobs, and records each blob's size,
+last access time and image width/height/mime, so the same image served from
+several URLs is kept on disk once and can be filtered without decoding.
+
+When a byte budget is set, the least recently used blobs are evicted once the
+cache grows past it.
+
+Downloads can be streamed into an "incoming" file and renamed into place
+(put_file). Entries are read back as bytes, except large ones, which are
+returned as read-only memory maps so they are never held twice in Python
+memory. A blob that cannot be deleted while it is mapped (Windows) is dropped
+from the index and deleted on a later eviction pass.
+
+Caches from older versions (flat "<sha256-of-url>.bin" files, or the same
+files sharded by URL hash) are converted in place the first time the cache is
+opened.
+"""
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from PIL import Image
+
+INDEX_FILENAME = "cache_index.sqlite"
+
+# What a cache read returns: bytes, or a read-only mmap for large entries
+ArtworkData = Union[bytes, mmap.mmap]
+
+# Evict down to this fraction of the budget so a full cache does not evict on every write
+_EVICT_TARGET = 0.9
+
+# Partial downloads older than this are left over from a crash and removed on open
+_STALE_INCOMING_S = 24 * 3600
+
+# Entries at least this large are memory-mapped instead of read into bytes
+MAP_MIN_BYTES = 4 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash        TEXT PRIMARY KEY,
+    size        INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    width       INTEGER,
+    height      INTEGER,
+    mime        TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_blobs_last_access ON blobs(last_access);
+CREATE TABLE IF NOT EXISTS urls (
+    name TEXT PRIMARY KEY,
+    hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_urls_hash ON urls(hash);
+"""
+
+
+def probe_image(data: Union[bytes, Path]) -> Dict[str, Any]:
+    """Read width, height and mime type from an image header (no full decode)."""
+    try:
+        with Image.open(data if isinstance(data, Path) else BytesIO(data)) as im:
+            return {"width": im.width, "height": im.height, "mime": Image.MIME.get(im.format or "")}
+    except Exception:
+        return {"width": None, "height": None, "mime": None}
+
+
+def map_file(path: Path) -> ArtworkData:
+    """Map a file read-only. Returns an mmap (usable wherever bytes are read), or b"" for an empty file."""
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""
+
+
+def read_entry(path: Path) -> ArtworkData:
+    """Read a cached file: bytes below MAP_MIN_BYTES, otherwise a read-only mmap (see map_file)."""
+    if path.stat().st_size < MAP_MIN_BYTES:
+        return path.read_bytes()
+    return map_file(path)
+
+
+class ArtworkCache:
+    """Content-deduplicated, size-bounded cache of downloaded artwork.
+
+    Entries are addressed by name (e.g. "<sha256-of-url>.bin" or
+    "logo_<sha256-of-url>.bin"); several names can share one blob.
+    A single connection is shared between worker threads and guarded by a lock.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 0):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, int(max_bytes))
+        # Evicted blobs whose file could not be deleted yet (mapped elsewhere), retried on each eviction
+        self._unlink_pending: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.cache_dir / INDEX_FILENAME), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+            legacy = self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'entries'"
+            ).fetchone() is not None
+            indexed = int(self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0])
+
+        self._clean_incoming()
+        self.migrated = 0
+        if legacy:
+            self.migrated += self._migrate_url_shards()
+        elif indexed == 0:
+            self._reindex_blobs()
+        self.migrated += self.migrate_flat()
+        with self._lock:
+            self._total = int(self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0])
+        self.evict()
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def blob_path(self, content_hash: str) -> Path:
+        """Get the sharded path for a blob."""
+        return self.cache_dir / content_hash[:2] / content_hash[2:4] / f"{content_hash}.bin"
+
+    def contains(self, name: str) -> bool:
+        content_hash = self._lookup(name)
+        return content_hash is not None and self.blob_path(content_hash).exists()
+
+    def get(self, name: str) -> Optional[ArtworkData]:
+        """
+        Read an entry and mark its blob as recently used. Returns None on a miss.
+
+        Large entries come back as an mmap (see read_entry); it supports len(),
+        hashing, slicing and file-style read/seek, so it can be passed straight
+        to Image.open. Callers that keep one around should close it when done.
+        """
+        content_hash = self._lookup(name)
+        if content_hash is None:
+            return None
+        try:
+            data = read_entry(self.blob_path(content_hash))
+        except OSError:
+            self._drop_blob(content_hash)
+            return None
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE blobs SET last_access = ? WHERE hash = ?", (time.time(), content_hash))
+        return data
+
+    def put(self, name: str, data: bytes) -> str:
+        """Store data under name, writing the blob only if this content is new. Returns the content hash."""
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(content_hash)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        self._register(name, content_hash, len(data), probe_image(data))
+        self.evict()
+        return content_hash
+
+    def incoming_path(self) -> Path:
+        """Get a unique temp path inside the cache for a download in progress (see put_file)."""
+        incoming = self.cache_dir / "incoming"
+        incoming.mkdir(exist_ok=True)
+        return incoming / f"{os.getpid()}.{threading.get_ident()}.{time.time_ns()}.part"
+
+    def put_file(self, name: str, path: Path, content_hash: str) -> ArtworkData:
+        """
+        Move a fully written file (usually from incoming_path) into the cache under name.
+
+        Returns the entry as get() would.
+        """
+        dest = self.blob_path(content_hash)
+        size = path.stat().st_size
+        info = probe_image(path)
+        if dest.exists():
+            path.unlink()
+        else:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, dest)
+        self._register(name, content_hash, size, info)
+        # Read before evicting, so a download larger than the whole budget is still returned
+        data = read_entry(dest)
+        self.evict()
+        return data
+
+    def info(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get blob metadata (hash, size, width, height, mime) for an entry name."""
+        content_hash = self._lookup(name)
+        return self.info_for_hash(content_hash) if content_hash else None
+
+    def info_for_hash(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Get blob metadata (hash, size, width, height, mime) by content hash."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hash, size, width, height, mime FROM blobs WHERE hash = ?", (content_hash,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def evict(self) -> int:
+        """Remove least recently used blobs until the cache fits its budget. Returns bytes freed."""
+        self._retry_unlinks()
+        if not self.max_bytes or self._total <= self.max_bytes:
+            return 0
+
+        target = int(self.max_bytes * _EVICT_TARGET)
+        freed = 0
+        with self._lock:
+            rows = self._conn.execute("SELECT hash, size FROM blobs ORDER BY last_access").fetchall()
+            removed = []
+            for content_hash, size in rows:
+                if self._total <= target:
+                    break
+                path = self.blob_path(content_hash)
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    # Still mapped by a reader; forget it now and delete the file later
+                    self._unlink_pending[content_hash] = path
+                removed.append((content_hash,))
+                self._total -= size
+                freed += size
+            with self._conn:
+                self._conn.executemany("DELETE FROM blobs WHERE hash = ?", removed)
+                self._conn.executemany("DELETE FROM urls WHERE hash = ?", removed)
+        return freed
+
+    def _retry_unlinks(self) -> None:
+        with self._lock:
+            pending = list(self._unlink_pending.items())
+        for content_hash, path in pending:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            with self._lock:
+                self._unlink_pending.pop(content_hash, None)
+
+    def migrate_flat(self) -> int:
+        """Convert flat "<name>.bin" files from older caches into blobs. Returns files converted."""
+        moved = 0
+        with os.scandir(self.cache_dir) as it:
+            entries = [e for e in it if e.name.endswith(".bin") and e.is_file()]
+        for entry in entries:
+            if self._adopt(Path(entry.path), entry.name):
+                moved += 1
+        return moved
+
+    def _migrate_url_shards(self) -> int:
+        """Convert files sharded by URL hash (previous cache layout) into blobs."""
+        with self._lock:
+            rows = self._conn.execute("SELECT name, last_access FROM entries").fetchall()
+        moved = 0
+        for row in rows:
+            name = row["name"]
+            digest = Path(name).stem.rsplit("_", 1)[-1]
+            path = self.cache_dir / digest[:2] / digest[2:4] / name
+            if path.exists() and self._adopt(path, name, row["last_access"]):
+                moved += 1
+        with self._lock, self._conn:
+            self._conn.execute("DROP TABLE entries")
+        return moved
+
+    def _reindex_blobs(self) -> None:
+        """Register blobs already on disk (e.g. after the index was deleted) so eviction can reclaim them."""
+        rows = []
+        for first in self.cache_dir.iterdir():
+            if not first.is_dir() or len(first.name) != 2:
+                continue
+            for second in first.iterdir():
+                if not second.is_dir():
+                    continue
+                for f in second.iterdir():
+                    if f.is_file() and f.suffix == ".bin":
+                        st = f.stat()
+                        rows.append((f.stem, st.st_size, st.st_mtime))
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO blobs (hash, size, last_access) VALUES (?, ?, ?)", rows
+                )
+
+    def _adopt(self, path: Path, name: str, last_access: Optional[float] = None) -> bool:
+        """Turn an existing URL-keyed file into a blob plus name mapping."""
+        try:
+            data = path.read_bytes()
+            st = path.stat()
+        except OSError:
+            return False
+        content_hash = hashlib.sha256(data).hexdigest()
+        dest = self.blob_path(content_hash)
+        try:
+            if dest.exists():
+                path.unlink()
+            else:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(path, dest)
+        except OSError:
+            return False
+        info = probe_image(data)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO blobs (hash, size, last_access, width, height, mime) VALUES (?, ?, ?, ?, ?, ?)",
+                (content_hash, len(data), last_access or st.st_mtime, info["width"], info["height"], info["mime"]),
+            )
+            self._conn.execute("INSERT OR REPLACE INTO urls (name, hash) VALUES (?, ?)", (name, content_hash))
+        return True
+
+    def _register(self, name: str, content_hash: str, size: int, info: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            # Stored again before a pending delete went through: keep the file
+            self._unlink_pending.pop(content_hash, None)
+            row = self._conn.execute("SELECT size FROM blobs WHERE hash = ?", (content_hash,)).fetchone()
+            if row is None:
+                self._total += size
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs (hash, size, last_access, width, height, mime) VALUES (?, ?, ?, ?, ?, ?)",
+                (content_hash, size, time.time(), info["width"], info["height"], info["mime"]),
+            )
+            self._conn.execute("INSERT OR REPLACE INTO urls (name, hash) VALUES (?, ?)", (name, content_hash))
+
+    def _clean_incoming(self) -> None:
+        incoming = self.cache_dir / "incoming"
+        if not incoming.is_dir():
+            return
+        cutoff = time.time() - _STALE_INCOMING_S
+        for f in incoming.iterdir():
+            try:
+                if f.stat().st_mtime < cutoff:
+                    f.unlink()
+            except OSError:
+                pass
+
+    def _lookup(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT hash FROM urls WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _drop_blob(self, content_hash: str) -> None:
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT size FROM blobs WHERE hash = ?", (content_hash,)).fetchone()
+            if row:
+                self._total -= row[0]
+            self._conn.execute("DELETE FROM blobs WHERE hash = ?", (content_hash,))
+            self._conn.execute("DELETE FROM urls WHERE hash = ?", (content_hash,))
+
+
+_caches: Dict[str, ArtworkCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_artwork_cache(cache_dir: Path, max_bytes: Optional[int] = None) -> ArtworkCache:
+    """
+    Get the shared cache for a directory, opening (and migrating) it on first use.
+
+    Args:
+        cache_dir: Cache directory
+        max_bytes: Byte budget (0 = unlimited). None keeps the current budget.
+    """
+    key = str(Path(cache_dir).resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ArtworkCache(cache_dir, max_bytes or 0)
+            _caches[key] = cache
+            return cache
+    if max_bytes is not None and max_bytes != cache.max_bytes:
+        cache.max_bytes = max(0, int(max_bytes))
+        cache.evict()
+    return cache
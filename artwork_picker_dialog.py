@@ -19,7 +19,9 @@ from PIL import Image
 class ArtworkOption(QFrame):
     """Widget displaying a single artwork option with radio button."""
 
-    def __init__(self, image_data: bytes, source: str, index: int, parent=None):
+    def __init__(self, image_data: bytes, source: str, index: int, parent=None,
+                 width: Optional[int] = None, height: Optional[int] = None,
+                 duplicates: Optional[List[str]] = None):
         super().__init__(parent)
         self.image_data = image_data
         self.source = source
@@ -69,9 +71,14 @@ class ArtworkOption(QFrame):
         layout.addWidget(self.image_label)
 
         # Source label
-        source_label = QLabel(f"Source: {source}")
+        source_text = f"Source: {source}"
+        if width and height:
+            source_text += f" ({width}x{height})"
+        source_label = QLabel(source_text)
         source_label.setAlignment(Qt.AlignCenter)
         source_label.setStyleSheet("color: #00DDFF; font-weight: bold;")
+        if duplicates:
+            source_label.setToolTip("Also found at: " + ", ".join(duplicates))
         layout.addWidget(source_label)
 
         # Radio button
@@ -96,7 +103,8 @@ class ArtworkPickerDialog(QDialog):
         Args:
             title: Game title
             platform: Platform key
-            artwork_options: List of dicts with keys: 'image_data' (bytes), 'source' (str)
+            artwork_options: List of dicts with keys: 'image_data' (bytes, often a provider
+                thumbnail), 'source' (str), optional 'width'/'height' of the full-size image
         """
         super().__init__(parent)
         self.title = title
@@ -171,7 +179,10 @@ class ArtworkPickerDialog(QDialog):
                 image_data=opt['image_data'],
                 source=opt['source'],
                 index=i,
-                parent=self.grid_widget
+                parent=self.grid_widget,
+                width=opt.get('width'),
+                height=opt.get('height'),
+                duplicates=opt.get('duplicates')
             )
             row = i // self.num_columns
             col = i % self.num_columns
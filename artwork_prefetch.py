@@ -0,0 +1,186 @@
+"""
+Look-ahead artwork prefetching for interactive mode.
+
+While the user is choosing artwork for one title, the options for the next few
+titles are fetched in the background so their picker can open immediately.
+
+Fetched option images are not kept in Python memory beyond a small budget:
+anything past it is written to the artwork cache (content-addressed, so images
+already downloaded there cost nothing extra) and the queue keeps only the entry
+name plus the option's metadata. The images are mapped back from the cache when
+the title is taken. A disk budget caps how much spilled artwork may be waiting
+in the queue; prefetching pauses until the user catches up.
+
+If the cache evicts a spilled image before it is used, that option is dropped;
+if none are left the title is simply fetched again.
+"""
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from artwork_cache import get_artwork_cache
+
+# Entry name prefix for spilled option images in the artwork cache
+_SPILL_PREFIX = "prefetch_"
+
+
+class ArtworkPrefetcher:
+    """Bounded background queue of artwork options for upcoming titles.
+
+    fetch(key, *args) returns the list of option dicts for one title; options
+    carry their image in 'image_data' (bytes or a mapped cache entry).
+    Fetches run one at a time on a single background thread, in the order
+    titles were scheduled.
+    """
+
+    def __init__(self, fetch: Callable[..., List[Dict[str, Any]]], cache_dir: Path,
+                 depth: int = 2, max_memory_bytes: int = 16 * 1024 * 1024,
+                 max_disk_bytes: int = 256 * 1024 * 1024, log: Optional[Callable[[str], None]] = None):
+        self._fetch = fetch
+        self._cache = get_artwork_cache(cache_dir)
+        self.depth = max(0, int(depth))
+        self.max_memory_bytes = max(0, int(max_memory_bytes))
+        self.max_disk_bytes = max(0, int(max_disk_bytes))
+        self._log = log or (lambda m: None)
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        # key -> (options, inline bytes, spilled bytes)
+        self._ready: Dict[str, Tuple[List[Dict[str, Any]], int, int]] = {}
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._closed = threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._disk_bytes
+
+    def schedule(self, upcoming: List[Tuple[str, tuple]]) -> None:
+        """
+        Queue fetches for the next titles, given as (key, fetch args) in processing order.
+        Only the first `depth` are considered, and nothing new is queued while the
+        spilled artwork waiting in the queue is over the disk budget.
+        """
+        if self._closed.is_set():
+            return
+        with self._lock:
+            for key, args in upcoming[:self.depth]:
+                if key in self._pending or key in self._ready:
+                    continue
+                if self.max_disk_bytes and self._disk_bytes >= self.max_disk_bytes:
+                    break
+                self._pending[key] = self._pool.submit(self._run, key, args)
+
+    def take(self, key: str, timeout: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Remove and return the prefetched options for key, waiting for an in-flight
+        fetch up to timeout seconds. Returns None if key was never scheduled, its
+        fetch failed or timed out, or all of its spilled images were evicted.
+        """
+        with self._lock:
+            fut = self._pending.get(key)
+        if fut is not None:
+            try:
+                fut.result(timeout=timeout)
+            except Exception:
+                self.discard(key)
+                return None
+
+        with self._lock:
+            entry = self._ready.pop(key, None)
+            if entry is None:
+                return None
+            options, inline, spilled = entry
+            self._memory_bytes -= inline
+            self._disk_bytes -= spilled
+
+        restored = []
+        for opt in options:
+            name = opt.pop("spill_name", None)
+            if name is not None:
+                data = self._cache.get(name)
+                if data is None:
+                    continue
+                opt["image_data"] = data
+            restored.append(opt)
+        if options and not restored:
+            self._log(f"[PREFETCH] Spilled artwork for {key} was evicted from the cache")
+            return None
+        return restored
+
+    def discard(self, key: str) -> None:
+        """Drop key from the queue (its fetch is cancelled if it has not started)."""
+        with self._lock:
+            fut = self._pending.pop(key, None)
+            entry = self._ready.pop(key, None)
+            if entry is not None:
+                self._memory_bytes -= entry[1]
+                self._disk_bytes -= entry[2]
+        if fut is not None:
+            fut.cancel()
+
+    def close(self) -> None:
+        """Stop prefetching: queued fetches are cancelled and held options released."""
+        self._closed.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._pending.clear()
+            self._ready.clear()
+            self._memory_bytes = 0
+            self._disk_bytes = 0
+
+    def _run(self, key: str, args: tuple) -> None:
+        try:
+            if self._closed.is_set():
+                return
+            options = self._fetch(*args)
+            if self._closed.is_set():
+                return
+            entry = self._spill(options)
+            with self._lock:
+                if self._pending.pop(key, None) is None:
+                    return  # discarded while fetching
+                self._ready[key] = entry
+                self._memory_bytes += entry[1]
+                self._disk_bytes += entry[2]
+            self._log(f"[PREFETCH] Ready: {key} ({len(options)} options, "
+                      f"{entry[1] // 1024} KB in memory, {entry[2] // 1024} KB on disk)")
+        except Exception as e:
+            with self._lock:
+                self._pending.pop(key, None)
+            self._log(f"[PREFETCH] Failed for {key}: {type(e).__name__}: {e}")
+            raise
+
+    def _spill(self, options: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Keep plain bytes inline while the memory budget allows; write everything
+        else (including mapped cache entries, which hold a file handle) to the
+        artwork cache and keep its entry name instead.
+        """
+        inline = spilled = 0
+        kept = []
+        for opt in options:
+            data = opt.get("image_data")
+            if data is None:
+                continue
+            size = len(data)
+            with self._lock:
+                room = self.max_memory_bytes - self._memory_bytes - inline
+            if isinstance(data, bytes) and size <= room:
+                inline += size
+            else:
+                name = f"{_SPILL_PREFIX}{hashlib.sha256(data).hexdigest()}.bin"
+                self._cache.put(name, data)
+                opt = dict(opt, spill_name=name)
+                del opt["image_data"]
+                if hasattr(data, "close"):
+                    data.close()
+                spilled += size
+            kept.append(opt)
+        return kept, inline, spilled
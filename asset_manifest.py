@@ -0,0 +1,361 @@
+"""
+Generated-asset manifest for iiSU Asset Tool.
+
+Records every asset written by run_backend.run_job in a small SQLite database
+that lives in the output directory, so the GUI tabs and the device sync can
+list what was generated without walking the folder tree.
+"""
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+MANIFEST_FILENAME = "manifest.sqlite"
+
+# Files that identify a game folder when back-filling from disk
+_ICON_NAMES = ("icon.png", "icon.jpg", "icon.jpeg", "icon.webp")
+
+# Smaller copies written for output_variants (icon_256px.png, hero_1_128px.jpg)
+_SIZE_VARIANT_RE = re.compile(r"_\d+px$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    game_dir      TEXT PRIMARY KEY,
+    folder        TEXT NOT NULL,
+    platform      TEXT NOT NULL,
+    title         TEXT NOT NULL,
+    slug          TEXT NOT NULL,
+    files         TEXT NOT NULL DEFAULT '[]',
+    source_tag    TEXT,
+    source_url    TEXT,
+    source_hash   TEXT,
+    border_path   TEXT,
+    border_hash   TEXT,
+    centering_x   REAL,
+    centering_y   REAL,
+    out_size      INTEGER,
+    export_format TEXT,
+    created_at    REAL NOT NULL,
+    updated_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_assets_folder ON assets(folder);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# meta key set once the output folder has been back-filled from disk
+_META_DISK_IMPORTED = "disk_imported"
+
+# Columns added after the first schema; added to existing databases on open
+_ADDED_COLUMNS = {
+    "title_source": "TEXT",  # "logo" or "boxart" (title image is a copy of the icon)
+}
+
+
+def get_manifest_path(output_dir: Path) -> Path:
+    """Get the manifest database path for an output directory."""
+    return Path(output_dir) / MANIFEST_FILENAME
+
+
+class AssetManifest:
+    """SQLite manifest of generated assets.
+
+    One row per game folder. Rows are keyed by the game folder path relative
+    to the output directory (e.g. "snes/Super_Metroid"), which is also how the
+    launcher lays folders out on the device.
+
+    A single connection is shared between worker threads and guarded by a lock;
+    every write runs in its own transaction.
+    """
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.path = get_manifest_path(self.output_dir)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            existing = {r[1] for r in self._conn.execute("PRAGMA table_info(assets)").fetchall()}
+            for name, decl in _ADDED_COLUMNS.items():
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE assets ADD COLUMN {name} {decl}")
+            self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+    def game_dir_key(self, game_dir: Path) -> str:
+        """Get the manifest key for a game folder (relative to the output dir when possible)."""
+        game_dir = Path(game_dir)
+        try:
+            return game_dir.resolve().relative_to(self.output_dir.resolve()).as_posix()
+        except ValueError:
+            return game_dir.resolve().as_posix()
+
+    def resolve_game_dir(self, key: str) -> Path:
+        """Get the absolute game folder path for a manifest key."""
+        p = Path(key)
+        return p if p.is_absolute() else self.output_dir / p
+
+    def record_asset(
+        self,
+        *,
+        game_dir: Path,
+        platform: str,
+        title: str,
+        slug: str,
+        files: Iterable[str],
+        source_tag: Optional[str] = None,
+        source_url: Optional[str] = None,
+        source_hash: Optional[str] = None,
+        border_path: Optional[Path] = None,
+        border_hash: Optional[str] = None,
+        centering: Tuple[float, float] = (0.5, 0.5),
+        out_size: Optional[int] = None,
+        export_format: Optional[str] = None,
+        title_source: Optional[str] = None,
+        replace_files: bool = False,
+    ) -> None:
+        """
+        Insert or update the row for one generated asset in a single transaction.
+
+        Files already listed for the folder are kept unless replace_files is set,
+        since a re-scrape that only rewrites the icon leaves the hero/slide files
+        on disk; listed files that are no longer on disk are dropped. A
+        title_source of None keeps the previously recorded value.
+        """
+        key = self.game_dir_key(game_dir)
+        folder = Path(game_dir).parent.name
+        now = time.time()
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT files, created_at, title_source FROM assets WHERE game_dir = ?", (key,)
+            ).fetchone()
+            merged = set(files)
+            created_at = now
+            if row is not None:
+                if not replace_files:
+                    merged.update(name for name in _load_files(row["files"]) if (Path(game_dir) / name).exists())
+                created_at = row["created_at"]
+                if title_source is None:
+                    title_source = row["title_source"]
+
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO assets (
+                    game_dir, folder, platform, title, slug, files,
+                    source_tag, source_url, source_hash, border_path, border_hash,
+                    centering_x, centering_y, out_size, export_format,
+                    created_at, updated_at, title_source
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key, folder, platform, title, slug, json.dumps(sorted(merged)),
+                    source_tag, source_url, source_hash,
+                    str(border_path) if border_path else None, border_hash,
+                    float(centering[0]), float(centering[1]),
+                    out_size, export_format,
+                    created_at, now, title_source,
+                ),
+            )
+
+    def remove(self, game_dir: Path) -> None:
+        """Remove the row for a game folder."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM assets WHERE game_dir = ?", (self.game_dir_key(game_dir),))
+
+    def prune_missing(self) -> int:
+        """
+        Reconcile rows with the disk after folders or files were removed by hand.
+
+        Listed files that are gone are dropped from their row; rows whose game
+        folder or icon is gone are deleted. Costs one stat per listed file.
+
+        Returns:
+            Number of rows deleted
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT game_dir, files FROM assets").fetchall()
+
+        deleted = []
+        trimmed = []
+        for r in rows:
+            game_dir = self.resolve_game_dir(r["game_dir"])
+            files = _load_files(r["files"])
+            present = [name for name in files if (game_dir / name).is_file()] if game_dir.is_dir() else []
+            if not any(name in present for name in _ICON_NAMES):
+                deleted.append((r["game_dir"],))
+            elif len(present) != len(files):
+                trimmed.append((json.dumps(present), r["game_dir"]))
+
+        if deleted or trimmed:
+            with self._lock, self._conn:
+                self._conn.executemany("DELETE FROM assets WHERE game_dir = ?", deleted)
+                self._conn.executemany("UPDATE assets SET files = ? WHERE game_dir = ?", trimmed)
+        return len(deleted)
+
+    def disk_imported(self) -> bool:
+        """Whether import_from_disk has run for this output directory."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (_META_DISK_IMPORTED,)).fetchone()
+        return row is not None
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0])
+
+    def source_hashes(self) -> Set[str]:
+        """Get the source image hashes referenced by any row."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT source_hash FROM assets WHERE source_hash IS NOT NULL").fetchall()
+        return {r[0] for r in rows}
+
+    def folders(self) -> List[str]:
+        """Get the distinct platform folder names, sorted."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT folder FROM assets ORDER BY folder").fetchall()
+        return [r[0] for r in rows]
+
+    def assets(self, folder: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get manifest rows as dicts, sorted by folder then game folder name.
+
+        Each dict has the table columns plus:
+            path: absolute game folder path
+            name: game folder name
+            files: list of file names in the folder
+            device_files: files to push to the device (size variants left out)
+        """
+        query = "SELECT * FROM assets"
+        params: Tuple[Any, ...] = ()
+        if folder is not None:
+            query += " WHERE folder = ?"
+            params = (folder,)
+        query += " ORDER BY folder, game_dir"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        out = []
+        for r in rows:
+            d = dict(r)
+            d["files"] = _load_files(d["files"])
+            d["device_files"] = [name for name in d["files"] if not is_size_variant(name)]
+            game_path = self.resolve_game_dir(d["game_dir"])
+            d["path"] = game_path
+            d["name"] = game_path.name
+            out.append(d)
+        return out
+
+    def import_from_disk(self, platform_for_folder=None) -> int:
+        """
+        Back-fill rows for game folders generated before the manifest existed.
+
+        Walks the output directory; folders already in the manifest are left
+        alone. Only folders containing an icon file are imported. Afterwards
+        disk_imported() is true, so open_manifest only walks the folder again
+        when asked to rescan.
+
+        Args:
+            platform_for_folder: Optional callable mapping a platform folder name
+                (e.g. "snes") to a platform key (e.g. "SNES")
+
+        Returns:
+            Number of rows added
+        """
+        with self._lock:
+            known = {r[0] for r in self._conn.execute("SELECT game_dir FROM assets").fetchall()}
+
+        added = 0
+        now = time.time()
+        rows = []
+        for platform_dir in sorted(self.output_dir.iterdir()):
+            if not platform_dir.is_dir():
+                continue
+            platform = platform_for_folder(platform_dir.name) if platform_for_folder else platform_dir.name
+            for game_dir in sorted(platform_dir.iterdir()):
+                if not game_dir.is_dir():
+                    continue
+                key = f"{platform_dir.name}/{game_dir.name}"
+                if key in known:
+                    continue
+                files = sorted(f.name for f in game_dir.iterdir() if f.is_file())
+                if not any(name in files for name in _ICON_NAMES):
+                    continue
+                icon = next(name for name in _ICON_NAMES if name in files)
+                rows.append((
+                    key, platform_dir.name, platform, game_dir.name, game_dir.name,
+                    json.dumps(files), Path(icon).suffix.lstrip(".").upper(), now, now,
+                ))
+
+        with self._lock, self._conn:
+            if rows:
+                self._conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO assets (
+                        game_dir, folder, platform, title, slug, files,
+                        export_format, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                added = len(rows)
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                               (_META_DISK_IMPORTED, str(now)))
+        return added
+
+
+def open_manifest(output_dir: Path, import_existing: bool = False, platform_for_folder=None,
+                  rescan: bool = False) -> AssetManifest:
+    """
+    Open (creating if needed) the manifest for an output directory.
+
+    Args:
+        output_dir: Output directory containing platform folders
+        import_existing: Drop rows for folders removed from disk, then back-fill
+            from disk unless that was already done once (rows recorded by run_job
+            before then do not count)
+        platform_for_folder: Passed through to AssetManifest.import_from_disk
+        rescan: With import_existing, always walk the output folder and import
+            folders that have no row (e.g. written while the manifest was
+            unavailable)
+    """
+    manifest = AssetManifest(output_dir)
+    if import_existing:
+        manifest.prune_missing()
+        if rescan or not manifest.disk_imported():
+            manifest.import_from_disk(platform_for_folder)
+    return manifest
+
+
+def is_size_variant(file_name: str) -> bool:
+    """Whether a game folder file is a size variant; those stay local, the launcher only reads the full-size files."""
+    return _SIZE_VARIANT_RE.search(Path(file_name).stem) is not None
+
+
+def _load_files(raw: Optional[str]) -> List[str]:
+    try:
+        files = json.loads(raw or "[]")
+        return [str(f) for f in files] if isinstance(files, list) else []
+    except Exception:
+        return []
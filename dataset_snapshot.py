@@ -0,0 +1,289 @@
+"""
+Compiled game-title dataset snapshot for iiSU Asset Tool.
+
+The EveryVideoGameEver GamesDB JSONs are parsed and every title is normalized
+once per dataset version, and the result is stored in a small SQLite file
+named after the dataset zip's hash. Later processes open the snapshot instead
+of re-parsing JSON: the platform list and platform-name lookup load on open,
+and a platform's titles (with their normalized forms and token sets, as used
+by fuzzy matching) are read with one indexed query the first time they are
+needed.
+
+Title lists from outside the dataset (Wikipedia fallback lists for platforms
+it lacks) are merged in later with store_fallback(), keyed by their source and
+revision, so they are normalized and indexed like dataset platforms.
+
+Snapshots are written to a temporary file and renamed into place, so a reader
+never sees a half-built one. A refreshed dataset gets a new snapshot file rather
+than an update in place: jobs holding the previous one keep reading it, and
+prune_snapshots() removes old versions once they are no longer needed.
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+# Bump when the stored normalization changes; older snapshots are then rebuilt
+SNAPSHOT_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE platforms (
+    name        TEXT PRIMARY KEY,
+    pos         INTEGER NOT NULL,
+    norm_key    TEXT NOT NULL,
+    title_count INTEGER NOT NULL
+);
+CREATE TABLE titles (
+    platform TEXT NOT NULL,
+    pos      INTEGER NOT NULL,
+    title    TEXT NOT NULL,
+    norm     TEXT NOT NULL,
+    tokens   TEXT NOT NULL,
+    PRIMARY KEY (platform, pos)
+) WITHOUT ROWID;
+CREATE TABLE fallbacks (
+    source   TEXT PRIMARY KEY,
+    revision TEXT NOT NULL
+);
+CREATE TABLE fallback_titles (
+    source TEXT NOT NULL,
+    pos    INTEGER NOT NULL,
+    title  TEXT NOT NULL,
+    norm   TEXT NOT NULL,
+    tokens TEXT NOT NULL,
+    PRIMARY KEY (source, pos)
+) WITHOUT ROWID;
+"""
+
+
+def snapshot_path(cache_dir: Path, dataset_hash: str) -> Path:
+    """Snapshot file for a dataset version in the dataset cache directory."""
+    return Path(cache_dir) / f"snapshot_{dataset_hash[:32]}_v{SNAPSHOT_VERSION}.sqlite"
+
+
+class PlatformTitles(list):
+    """A platform's titles, with each title's normalized form and token set alongside.
+
+    It is a plain list of titles to callers; fuzzy matching reads `norms` and
+    `token_sets` (same order) instead of normalizing every title again, and keeps
+    structures it derives from them (its search index) in `derived`, which is
+    shared by every copy handed out for the platform.
+    """
+
+    def __init__(self, titles: Iterable[str], norms: List[str], token_sets: List[FrozenSet[str]],
+                 derived: Optional[Dict[str, Any]] = None):
+        super().__init__(titles)
+        self.norms = norms
+        self.token_sets = token_sets
+        self.derived = derived if derived is not None else {}
+
+
+def _title_rows(key: str, titles: List[str],
+                title_keys: Callable[[List[str]], List[Tuple[str, Iterable[str]]]]) -> List[tuple]:
+    return [
+        (key, i, title, norm, " ".join(sorted(set(tokens))))
+        for i, (title, (norm, tokens)) in enumerate(zip(titles, title_keys(titles)))
+    ]
+
+
+def _platform_titles(rows: List[tuple]) -> PlatformTitles:
+    return PlatformTitles(
+        [r[0] for r in rows],
+        [r[1] for r in rows],
+        [frozenset(r[2].split()) for r in rows],
+    )
+
+
+def build_snapshot(
+    path: Path,
+    platforms: Mapping[str, List[str]],
+    title_keys: Callable[[List[str]], List[Tuple[str, Iterable[str]]]],
+    norm_key: Callable[[str], str],
+    dataset_hash: str = "",
+) -> Path:
+    """
+    Write a snapshot of platforms (name -> titles, in order) to path.
+
+    title_keys(titles) returns each title's (normalized form, tokens) as fuzzy matching uses them;
+    norm_key(name) is the platform-name normalization the resolver matches aliases with.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+    conn = sqlite3.connect(str(tmp))
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(_SCHEMA)
+        with conn:
+            conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+                ("version", str(SNAPSHOT_VERSION)),
+                ("dataset_hash", dataset_hash),
+            ])
+            for pos, (name, titles) in enumerate(platforms.items()):
+                rows = _title_rows(name, list(titles), title_keys)
+                conn.execute("INSERT INTO platforms (name, pos, norm_key, title_count) VALUES (?, ?, ?, ?)",
+                             (name, pos, norm_key(name), len(rows)))
+                conn.executemany("INSERT INTO titles (platform, pos, title, norm, tokens) VALUES (?, ?, ?, ?, ?)", rows)
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return path
+
+
+class DatasetSnapshot(Mapping):
+    """Read-only mapping of dataset platform name -> PlatformTitles, backed by a snapshot file.
+
+    `norm_keys` maps each normalized platform name to its dataset name (first
+    platform wins on a collision), for alias resolution without rescanning keys.
+    A single connection is shared between threads and guarded by a lock.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=30, check_same_thread=False)
+        with self._lock:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+            rows = self._conn.execute("SELECT name, norm_key, title_count FROM platforms ORDER BY pos").fetchall()
+        if meta.get("version") != str(SNAPSHOT_VERSION):
+            self.close()
+            raise ValueError(f"Snapshot {self.path} has version {meta.get('version')}, expected {SNAPSHOT_VERSION}")
+        self.dataset_hash = meta.get("dataset_hash", "")
+        self._counts: Dict[str, int] = {name: count for name, _, count in rows}
+        self.norm_keys: Dict[str, str] = {}
+        for name, nk, _ in rows:
+            self.norm_keys.setdefault(nk, name)
+        self._titles: Dict[str, PlatformTitles] = {}
+        # source -> (revision, titles), loaded on first lookup
+        self._fallbacks: Dict[str, Optional[Tuple[str, PlatformTitles]]] = {}
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+    def title_count(self, platform_name: str) -> int:
+        return self._counts[platform_name]
+
+    def __getitem__(self, platform_name: str) -> PlatformTitles:
+        if platform_name not in self._counts:
+            raise KeyError(platform_name)
+        with self._lock:
+            cached = self._titles.get(platform_name)
+            if cached is None:
+                rows = self._conn.execute(
+                    "SELECT title, norm, tokens FROM titles WHERE platform = ? ORDER BY pos", (platform_name,)
+                ).fetchall()
+                cached = _platform_titles(rows)
+                self._titles[platform_name] = cached
+        # Callers get their own list; the normalized columns are shared read-only
+        return PlatformTitles(cached, cached.norms, cached.token_sets, cached.derived)
+
+    def fallback(self, source: str) -> Optional[Tuple[str, PlatformTitles]]:
+        """(revision, titles) of a merged fallback list, or None if source was never stored."""
+        with self._lock:
+            if source not in self._fallbacks:
+                row = self._conn.execute("SELECT revision FROM fallbacks WHERE source = ?", (source,)).fetchone()
+                entry = None
+                if row is not None:
+                    rows = self._conn.execute(
+                        "SELECT title, norm, tokens FROM fallback_titles WHERE source = ? ORDER BY pos", (source,)
+                    ).fetchall()
+                    entry = (row[0], _platform_titles(rows))
+                self._fallbacks[source] = entry
+            entry = self._fallbacks[source]
+        if entry is None:
+            return None
+        revision, cached = entry
+        return revision, PlatformTitles(cached, cached.norms, cached.token_sets, cached.derived)
+
+    def store_fallback(self, source: str, revision: str, titles: List[str],
+                       title_keys: Callable[[List[str]], List[Tuple[str, Iterable[str]]]]) -> None:
+        """
+        Merge a title list from outside the dataset into the snapshot (replacing an
+        earlier revision of it), normalized with title_keys like build_snapshot's.
+        """
+        rows = _title_rows(source, list(titles), title_keys)
+        with self._lock:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            try:
+                with conn:
+                    conn.execute("DELETE FROM fallback_titles WHERE source = ?", (source,))
+                    conn.execute("INSERT OR REPLACE INTO fallbacks (source, revision) VALUES (?, ?)", (source, revision))
+                    conn.executemany(
+                        "INSERT INTO fallback_titles (source, pos, title, norm, tokens) VALUES (?, ?, ?, ?, ?)", rows
+                    )
+            finally:
+                conn.close()
+            self._fallbacks[source] = (revision, _platform_titles([r[2:] for r in rows]))
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+_snapshots: Dict[str, DatasetSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def open_snapshot(path: Path) -> Optional[DatasetSnapshot]:
+    """Shared snapshot for path, or None if it is missing or unreadable (then rebuild it)."""
+    key = str(Path(path).resolve())
+    with _snapshots_lock:
+        snap = _snapshots.get(key)
+        if snap is not None:
+            return snap
+        if not Path(path).exists():
+            return None
+        try:
+            snap = DatasetSnapshot(path)
+        except (sqlite3.Error, ValueError):
+            return None
+        _snapshots[key] = snap
+        return snap
+
+
+def prune_snapshots(cache_dir: Path, keep_hashes: Iterable[str]) -> int:
+    """
+    Delete snapshots in cache_dir except current-version ones for the dataset hashes
+    in keep_hashes. Snapshots open in this process are left alone, as are files that
+    cannot be removed yet (open in another process). Returns the number deleted.
+    """
+    keep = set(keep_hashes)
+    with _snapshots_lock:
+        open_paths = set(_snapshots)
+    removed = 0
+    for path in Path(cache_dir).glob("snapshot_*.sqlite"):
+        if str(path.resolve()) in open_paths:
+            continue
+        dataset_hash = None
+        if path.name.endswith(f"_v{SNAPSHOT_VERSION}.sqlite"):
+            try:
+                conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+                try:
+                    row = conn.execute("SELECT value FROM meta WHERE key = 'dataset_hash'").fetchone()
+                finally:
+                    conn.close()
+                dataset_hash = row[0] if row else None
+            except sqlite3.Error:
+                pass
+        if dataset_hash in keep:
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
@@ -3,7 +3,6 @@ Device Asset Replacement Dialog for iiSU Asset Tool
 Allows browsing and replacing existing assets on connected Android devices via ADB
 """
 import os
-import re
 import sys
 import subprocess
 import shutil
@@ -19,6 +18,8 @@ from PySide6.QtWidgets import (
 )
 
 from adb_setup import is_adb_installed
+from asset_manifest import open_manifest
+from title_normalize import normalize_game_name, normalize_titles
 
 
 def get_subprocess_kwargs():
@@ -33,20 +34,6 @@ def get_subprocess_kwargs():
     return kwargs
 
 
-def normalize_game_name(name: str) -> str:
-    """Normalize a game name for comparison by removing region tags, revision info, etc."""
-    # Remove common suffixes like (USA), (Rev 1), (En,Fr), etc.
-    normalized = re.sub(r'\s*\([^)]*\)\s*', ' ', name)
-    # Remove square bracket content like [!], [b1], etc.
-    normalized = re.sub(r'\s*\[[^\]]*\]\s*', ' ', normalized)
-    # Replace underscores with spaces
-    normalized = normalized.replace('_', ' ')
-    # Remove extra whitespace
-    normalized = ' '.join(normalized.split())
-    # Convert to lowercase for comparison
-    return normalized.lower().strip()
-
-
 def find_matching_local_folder(device_game_name: str, local_folders: List[Path]) -> Optional[Path]:
     """Find a local folder that matches the device game name using fuzzy matching."""
     device_normalized = normalize_game_name(device_game_name)
@@ -298,6 +285,7 @@ class DeviceAssetDialog(QDialog):
         self.device_base_path = self.device_base_path.rstrip("/")
         self.adb_path = get_adb_path()
         self.device_assets = {}
+        self.local_assets: Dict[str, List[dict]] = {}  # platform folder -> manifest rows
 
         self._setup_ui()
         self._check_adb()
@@ -509,39 +497,41 @@ class DeviceAssetDialog(QDialog):
         QMessageBox.critical(self, "Scan Error", f"Failed to scan device: {error}")
 
     def _load_local_assets(self):
-        """Load local output assets."""
+        """Load local output assets from the output folder's asset manifest."""
         self.local_tree.clear()
+        self.local_assets = {}
 
         output_path = Path(self.output_dir)
         if not output_path.exists():
             return
 
-        for platform_folder in sorted(output_path.iterdir()):
-            if not platform_folder.is_dir():
-                continue
-
-            games = list(platform_folder.iterdir())
-            game_count = len([g for g in games if g.is_dir()])
+        try:
+            with open_manifest(output_path, import_existing=True) as manifest:
+                for asset in manifest.assets():
+                    self.local_assets.setdefault(asset["folder"], []).append(asset)
+        except Exception as e:
+            print(f"[DEBUG] Failed to read asset manifest: {e}")
+            return
 
-            platform_item = QTreeWidgetItem([platform_folder.name, f"{game_count} games"])
-            platform_item.setData(0, Qt.UserRole, {"type": "platform", "path": str(platform_folder)})
+        for platform_name in sorted(self.local_assets):
+            games = self.local_assets[platform_name]
 
-            for game_folder in sorted(games):
-                if not game_folder.is_dir():
-                    continue
+            platform_item = QTreeWidgetItem([platform_name, f"{len(games)} games"])
+            platform_item.setData(0, Qt.UserRole, {"type": "platform", "path": str(output_path / platform_name)})
 
-                files = [f.name for f in game_folder.iterdir() if f.is_file()]
+            for asset in games:
+                files = asset["device_files"]
                 files_str = ", ".join(files[:3])
                 if len(files) > 3:
                     files_str += f" +{len(files) - 3} more"
 
-                game_item = QTreeWidgetItem([game_folder.name, files_str])
+                game_item = QTreeWidgetItem([asset["name"], files_str])
                 game_item.setData(0, Qt.UserRole, {
                     "type": "game",
-                    "name": game_folder.name,
-                    "path": str(game_folder),
+                    "name": asset["name"],
+                    "path": str(asset["path"]),
                     "files": files,
-                    "platform": platform_folder.name
+                    "platform": platform_name
                 })
                 game_item.setCheckState(0, Qt.Unchecked)
                 platform_item.addChild(game_item)
@@ -590,6 +580,8 @@ class DeviceAssetDialog(QDialog):
             device_game_names = []
             if platform_name in self.device_assets:
                 device_game_names = [g["name"] for g in self.device_assets[platform_name]]
+            # Normalized once per platform rather than once per local game
+            device_normalized_names = list(zip(device_game_names, normalize_titles(device_game_names, normalize_game_name)))
 
             for j in range(platform_item.childCount()):
                 game_item = platform_item.child(j)
@@ -608,9 +600,7 @@ class DeviceAssetDialog(QDialog):
                             best_match = None
                             best_score = 0
 
-                            for device_name in device_game_names:
-                                device_normalized = normalize_game_name(device_name)
-
+                            for device_name, device_normalized in device_normalized_names:
                                 # Exact match after normalization
                                 if local_normalized == device_normalized:
                                     best_match = device_name
@@ -647,13 +637,12 @@ class DeviceAssetDialog(QDialog):
 
                     device_game_path = f"{self.device_base_path}/{platform_name}/{device_game_name}"
 
-                    # Add all files in the game folder
-                    for file_path in local_game_path.iterdir():
-                        if file_path.is_file():
-                            items.append((
-                                str(file_path),
-                                f"{device_game_path}/{file_path.name}"
-                            ))
+                    # Add all files recorded for the game folder
+                    for file_name in data["files"]:
+                        items.append((
+                            str(local_game_path / file_name),
+                            f"{device_game_path}/{file_name}"
+                        ))
 
         return items, matched_games, unmatched_games
 
@@ -670,26 +659,17 @@ class DeviceAssetDialog(QDialog):
         matched_games = []
         unmatched_games = []
 
-        output_path = Path(self.output_dir)
-        if not output_path.exists():
-            return items, matched_games, unmatched_games
-
-        for platform_folder in output_path.iterdir():
-            if not platform_folder.is_dir():
-                continue
-
-            platform_name = platform_folder.name
-
+        for platform_name, games in self.local_assets.items():
             # Get device game folders for this platform
             device_game_names = []
             if platform_name in self.device_assets:
                 device_game_names = [g["name"] for g in self.device_assets[platform_name]]
+            # Normalized once per platform rather than once per local game
+            device_normalized_names = list(zip(device_game_names, normalize_titles(device_game_names, normalize_game_name)))
 
-            for game_folder in platform_folder.iterdir():
-                if not game_folder.is_dir():
-                    continue
-
-                local_game_name = game_folder.name
+            for asset in games:
+                game_folder = asset["path"]
+                local_game_name = asset["name"]
                 device_game_name = local_game_name  # Default to same name
 
                 # Try to find matching device folder
@@ -701,9 +681,7 @@ class DeviceAssetDialog(QDialog):
                         best_match = None
                         best_score = 0
 
-                        for device_name in device_game_names:
-                            device_normalized = normalize_game_name(device_name)
-
+                        for device_name, device_normalized in device_normalized_names:
                             # Exact match after normalization
                             if local_normalized == device_normalized:
                                 best_match = device_name
@@ -741,14 +719,13 @@ class DeviceAssetDialog(QDialog):
                 device_game_path = f"{self.device_base_path}/{platform_name}/{device_game_name}"
                 print(f"[DEBUG] Device target folder: {device_game_path}")
 
-                for file_path in game_folder.iterdir():
-                    if file_path.is_file():
-                        target_path = f"{device_game_path}/{file_path.name}"
-                        print(f"[DEBUG]   File: {file_path.name} -> {target_path}")
-                        items.append((
-                            str(file_path),
-                            target_path
-                        ))
+                for file_name in asset["device_files"]:
+                    target_path = f"{device_game_path}/{file_name}"
+                    print(f"[DEBUG]   File: {file_name} -> {target_path}")
+                    items.append((
+                        str(game_folder / file_name),
+                        target_path
+                    ))
 
         return items, matched_games, unmatched_games
 
@@ -766,27 +743,27 @@ class DeviceAssetDialog(QDialog):
                 game_name = data.get("name")
                 device_game_path = data.get("path")
 
+                local_games = {a["name"]: a for a in self.local_assets.get(platform, [])}
+
                 # First try exact match
-                local_game_path = Path(self.output_dir) / platform / game_name
+                local_asset = local_games.get(game_name)
 
-                if not local_game_path.exists():
+                if local_asset is None and local_games:
                     # Try fuzzy matching with local folders
-                    local_platform_path = Path(self.output_dir) / platform
-                    if local_platform_path.exists():
-                        local_folders = [f for f in local_platform_path.iterdir() if f.is_dir()]
-                        matched_folder = find_matching_local_folder(game_name, local_folders)
-                        if matched_folder:
-                            local_game_path = matched_folder
-                            print(f"[DEBUG] Fuzzy matched '{game_name}' -> '{matched_folder.name}'")
-
-                if local_game_path.exists():
+                    local_folders = [a["path"] for a in local_games.values()]
+                    matched_folder = find_matching_local_folder(game_name, local_folders)
+                    if matched_folder:
+                        local_asset = local_games[matched_folder.name]
+                        print(f"[DEBUG] Fuzzy matched '{game_name}' -> '{matched_folder.name}'")
+
+                if local_asset is not None:
+                    local_game_path = local_asset["path"]
                     matched_games.append(f"{game_name} -> {local_game_path.name}")
-                    for file_path in local_game_path.iterdir():
-                        if file_path.is_file():
-                            selected_items.append((
-                                str(file_path),
-                                f"{device_game_path}/{file_path.name}"
-                            ))
+                    for file_name in local_asset["device_files"]:
+                        selected_items.append((
+                            str(local_game_path / file_name),
+                            f"{device_game_path}/{file_name}"
+                        ))
                 else:
                     unmatched_games.append(game_name)
 
@@ -900,15 +877,17 @@ class DeviceAssetDialog(QDialog):
         if self.delete_after_push.isChecked() and successful_folders:
             self.status_label.setText(f"Pushed {copied} files. Deleting local folders...")
 
-            for folder_path in successful_folders:
-                try:
-                    folder = Path(folder_path)
-                    if folder.exists() and folder.is_dir():
-                        shutil.rmtree(folder)
-                        deleted_count += 1
-                except Exception as e:
-                    print(f"Error deleting {folder_path}: {e}")
-                    delete_errors += 1
+            with open_manifest(Path(self.output_dir)) as manifest:
+                for folder_path in successful_folders:
+                    try:
+                        folder = Path(folder_path)
+                        if folder.exists() and folder.is_dir():
+                            shutil.rmtree(folder)
+                            deleted_count += 1
+                        manifest.remove(folder)
+                    except Exception as e:
+                        print(f"Error deleting {folder_path}: {e}")
+                        delete_errors += 1
 
         # Build status message
         status_parts = [f"Pushed {copied} files to device"]
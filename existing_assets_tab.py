@@ -17,6 +17,7 @@ from PySide6.QtWidgets import (
 )
 
 from app_paths import get_config_path
+from asset_manifest import open_manifest
 from icon_generator_tab import ClickableIconPreview
 from rom_parser import IISU_PLATFORM_FOLDERS
 import run_backend
@@ -42,7 +43,7 @@ class ExistingAssetsTab(QWidget):
         self.config_path = str(get_config_path())
         self._cancel_token = None
         self._rescrape_in_progress = False
-        self._rescrape_cancelled = False
+        self._rescrape_cancel_token = None
 
         # Asset data storage
         self.all_assets = []  # All loaded assets
@@ -188,37 +189,41 @@ class ExistingAssetsTab(QWidget):
             self.platform_filter.addItem("All Platforms", "all")
             self.platform_filter.blockSignals(False)
 
-            # Scan output folder structure: output/{platform}/{game}/icon.png or icon.jpg
+            # Load from the asset manifest, reconciled with the output folder first
             found_count = 0
-            for platform_dir in sorted(output_dir.iterdir()):
-                if not platform_dir.is_dir():
+            with open_manifest(
+                output_dir,
+                import_existing=True,
+                platform_for_folder=lambda name: FOLDER_TO_PLATFORM.get(name.lower(), name),
+                rescan=True,
+            ) as manifest:
+                assets = manifest.assets()
+
+            for asset in assets:
+                icon_name = next(
+                    (name for name in ["icon.png", "icon.jpg", "icon.jpeg", "icon.webp"] if name in asset["files"]),
+                    None
+                )
+                if not icon_name:
                     continue
 
-                platform_name = platform_dir.name
-                self._platforms.add(platform_name)
+                # Smallest icon size variant that still covers the 128px preview
+                stem, ext = icon_name.rsplit(".", 1)
+                thumb_name = next(
+                    (f"{stem}_{size}px.{ext}" for size in (128, 256) if f"{stem}_{size}px.{ext}" in asset["files"]),
+                    None
+                )
 
-                for game_dir in sorted(platform_dir.iterdir()):
-                    if not game_dir.is_dir():
-                        continue
-
-                    game_name = game_dir.name
-
-                    # Look for icon file
-                    icon_path = None
-                    for icon_name in ["icon.png", "icon.jpg", "icon.jpeg"]:
-                        potential_icon = game_dir / icon_name
-                        if potential_icon.exists():
-                            icon_path = potential_icon
-                            break
-
-                    if icon_path:
-                        self.all_assets.append({
-                            "path": str(icon_path),
-                            "title": game_name,
-                            "platform": platform_name,
-                            "widget": None
-                        })
-                        found_count += 1
+                platform_name = asset["folder"]
+                self._platforms.add(platform_name)
+                self.all_assets.append({
+                    "path": str(asset["path"] / icon_name),
+                    "thumb": str(asset["path"] / thumb_name) if thumb_name else None,
+                    "title": asset["title"],
+                    "platform": platform_name,
+                    "widget": None
+                })
+                found_count += 1
 
             # Update platform filter dropdown
             self.platform_filter.blockSignals(True)
@@ -283,7 +288,8 @@ class ExistingAssetsTab(QWidget):
             preview_item = ClickableIconPreview(
                 asset_data["path"],
                 asset_data["title"],
-                asset_data["platform"]
+                asset_data["platform"],
+                thumb_path=asset_data.get("thumb")
             )
             preview_item.clicked.connect(self._on_asset_clicked)
             preview_item.selection_changed.connect(self._on_selection_changed)
@@ -503,7 +509,6 @@ class ExistingAssetsTab(QWidget):
     def _run_batch_rescrape(self, selected_widgets: list):
         """Run batch re-scrape for selected assets."""
         self._rescrape_in_progress = True
-        self._rescrape_cancelled = False
         self.btn_rescrape.setEnabled(False)
         self.btn_rescrape.setText("Re-scraping...")
         self.btn_cancel.setEnabled(True)
@@ -517,58 +522,56 @@ class ExistingAssetsTab(QWidget):
                     self._log("[RE-SCRAPE] Config file not found")
                     return
 
-                for i, preview_widget in enumerate(selected_widgets):
-                    if self._rescrape_cancelled:
-                        self._log("[RE-SCRAPE] Cancelled by user")
-                        break
-
-                    game_title = preview_widget.game_title
+                # One batch job for all selected icons, written back to their own files
+                items = []
+                widgets_by_path = {}
+                for preview_widget in selected_widgets:
                     platform = preview_widget.platform
-
-                    # Convert folder name to platform key
-                    platform_key = self._get_platform_key(platform)
-
-                    self._log(f"[RE-SCRAPE] ({i+1}/{len(selected_widgets)}) {game_title}")
-                    self._update_status(f"Processing {i+1}/{len(selected_widgets)}: {game_title}")
-
-                    # Get border path for this platform
-                    border_path = self._get_border_path_for_platform(platform)
-
-                    cancel_token = run_backend.CancelToken()
-
-                    ok, msg = run_backend.run_job(
-                        config_path=cfg_path,
-                        platforms=[platform_key],
-                        workers=1,
-                        limit=1,
-                        cancel=cancel_token,
-                        callbacks={
-                            "log": lambda m: self._log(str(m)),
-                            "preview": lambda p, t="", pl="", pw=preview_widget: self._on_rescrape_complete(pw, p),
-                            "request_selection": self._request_artwork_selection_batch,
-                        },
-                        search_term=game_title,
-                        interactive_mode=True,
-                        download_heroes=False,
-                        hero_count=0,
-                        fallback_settings={"enabled": False},
-                        download_screenshots=False,
-                        screenshot_count=0,
-                        copy_to_device=False,
-                        device_path="",
-                        scrape_logos=False,
-                        logo_fallback_to_boxart=False,
-                        force_rescrape=True,
-                        output_path_override=preview_widget.icon_path,
-                        border_path_override=border_path
-                    )
-
-                    if ok:
-                        self._log(f"[RE-SCRAPE] Completed: {game_title}")
-                        # Deselect on main thread
-                        self._deselect_widget_on_main_thread(preview_widget)
-                    else:
-                        self._log(f"[RE-SCRAPE] Skipped/failed: {game_title}")
+                    items.append((
+                        self._get_platform_key(platform),
+                        preview_widget.game_title,
+                        preview_widget.icon_path,
+                        self._get_border_path_for_platform(platform),
+                    ))
+                    widgets_by_path[str(Path(preview_widget.icon_path))] = preview_widget
+
+                def on_preview(path: str, title: str = "", platform: str = ""):
+                    preview_widget = widgets_by_path.get(str(Path(path)))
+                    if preview_widget is None:
+                        return
+                    self._log(f"[RE-SCRAPE] Completed: {preview_widget.game_title}")
+                    self._on_rescrape_complete(preview_widget, path)
+                    self._deselect_widget_on_main_thread(preview_widget)
+
+                def on_progress(done: int, total: int):
+                    self._update_status(f"Processed {done}/{total}")
+
+                self._rescrape_cancel_token = run_backend.CancelToken()
+                ok, msg = run_backend.run_batch_job(
+                    config_path=cfg_path,
+                    items=items,
+                    workers=1,
+                    cancel=self._rescrape_cancel_token,
+                    callbacks={
+                        "log": lambda m: self._log(str(m)),
+                        "progress": on_progress,
+                        "preview": on_preview,
+                        "request_selection": self._request_artwork_selection,
+                    },
+                    interactive_mode=True,
+                    download_heroes=False,
+                    hero_count=0,
+                    fallback_settings={"enabled": False},
+                    download_screenshots=False,
+                    screenshot_count=0,
+                    copy_to_device=False,
+                    device_path="",
+                    scrape_logos=False,
+                    logo_fallback_to_boxart=False,
+                    force_rescrape=True
+                )
+                if not ok:
+                    self._log(f"[RE-SCRAPE] {msg}")
 
                 self._log("[RE-SCRAPE] Batch complete")
 
@@ -584,7 +587,8 @@ class ExistingAssetsTab(QWidget):
 
     def _cancel_rescrape(self):
         """Cancel ongoing re-scrape."""
-        self._rescrape_cancelled = True
+        if self._rescrape_cancel_token is not None:
+            self._rescrape_cancel_token.cancel()
         self.btn_cancel.setEnabled(False)
         self.status_label.setText("Cancelling...")
 
@@ -607,13 +611,6 @@ class ExistingAssetsTab(QWidget):
 
         return self._dialog_result.get()
 
-    def _request_artwork_selection_batch(self, title: str, platform: str, artwork_options):
-        """Request artwork selection during batch (cancel stops all)."""
-        result = self._request_artwork_selection(title, platform, artwork_options)
-        if result == -1:
-            self._rescrape_cancelled = True
-        return result
-
     @Slot()
     def _show_selection_dialog(self):
         """Show artwork selection dialog on main thread."""
@@ -20,6 +20,7 @@ from PySide6.QtWidgets import (
 )
 
 import run_backend
+from asset_manifest import is_size_variant
 from preview_window import show_preview_dialog
 from source_priority_widget import SourcePriorityWidget
 from options_dialog import OptionsDialog
@@ -31,7 +32,7 @@ class ClickableIconPreview(QFrame):
     clicked = Signal(object)  # Emits self when clicked (for single re-scrape)
     selection_changed = Signal(object, bool)  # Emits (self, is_selected) when checkbox changes
 
-    def __init__(self, icon_path: str, game_title: str, platform: str, parent=None):
+    def __init__(self, icon_path: str, game_title: str, platform: str, parent=None, thumb_path: str = None):
         super().__init__(parent)
         self.icon_path = icon_path
         self.game_title = game_title
@@ -60,7 +61,10 @@ class ClickableIconPreview(QFrame):
         self.icon_label.setScaledContents(True)
         self.icon_label.setStyleSheet("QLabel { border: 2px solid #3A4048; border-radius: 8px; }")
 
-        pixmap = QPixmap(icon_path)
+        # A smaller size variant, when one was generated, loads faster than the full icon
+        pixmap = QPixmap(thumb_path or icon_path)
+        if pixmap.isNull() and thumb_path:
+            pixmap = QPixmap(icon_path)
         if not pixmap.isNull():
             self.icon_label.setPixmap(pixmap)
 
@@ -1008,6 +1012,7 @@ class IconGeneratorTab(QWidget):
             # Update export format settings
             cfg["export_format"] = export_settings.get("format", "JPEG")
             cfg["jpeg_quality"] = export_settings.get("jpeg_quality", 95)
+            cfg["export_preset"] = export_settings.get("preset", "balanced")
 
             # Write back
             with open(cfg_path, "w", encoding="utf-8") as f:
@@ -1373,7 +1378,8 @@ class IconGeneratorTab(QWidget):
                 # Find all asset files to push
                 asset_files = []
                 for asset_file in game_dir.iterdir():
-                    if asset_file.is_file() and asset_file.suffix.lower() in ('.png', '.jpg', '.jpeg'):
+                    if (asset_file.is_file() and asset_file.suffix.lower() in ('.png', '.jpg', '.jpeg', '.webp')
+                            and not is_size_variant(asset_file.name)):
                         asset_files.append(asset_file)
 
                 if not asset_files:
@@ -396,7 +396,7 @@ class OptionsDialog(QDialog):
         export_layout.setSpacing(10)
 
         self.export_format = QComboBox()
-        self.export_format.addItems(["JPEG", "PNG"])
+        self.export_format.addItems(["JPEG", "PNG", "WEBP"])
         self.export_format.setCurrentText(self.export_settings.get("format", "JPEG"))
         self.export_format.currentTextChanged.connect(self._on_export_format_changed)
         export_layout.addRow("Image Format:", self.export_format)
@@ -406,6 +406,13 @@ class OptionsDialog(QDialog):
         self.jpeg_quality.setValue(self.export_settings.get("jpeg_quality", 95))
         export_layout.addRow("JPEG Quality:", self.jpeg_quality)
 
+        self.export_preset = QComboBox()
+        self.export_preset.addItem("Fast", "fast")
+        self.export_preset.addItem("Balanced", "balanced")
+        self.export_preset.addItem("Smallest files", "smallest")
+        self._set_export_preset(self.export_settings.get("preset", "balanced"))
+        export_layout.addRow("Encoding:", self.export_preset)
+
         export_note = QLabel("<span style='color: #888; font-size: 10px;'>JPEG recommended for iiSU Launcher</span>")
         export_layout.addRow(export_note)
 
@@ -718,6 +725,10 @@ class OptionsDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save config: {e}")
 
+    def _set_export_preset(self, preset: str):
+        index = self.export_preset.findData(str(preset or "balanced").lower())
+        self.export_preset.setCurrentIndex(index if index >= 0 else 1)
+
     def _on_export_format_changed(self, format_text: str):
         is_jpeg = format_text.upper() in ("JPEG", "JPG")
         self.jpeg_quality.setEnabled(is_jpeg)
@@ -953,7 +964,8 @@ class OptionsDialog(QDialog):
     def get_export_settings(self):
         return {
             "format": self.export_format.currentText(),
-            "jpeg_quality": self.jpeg_quality.value()
+            "jpeg_quality": self.jpeg_quality.value(),
+            "preset": self.export_preset.currentData()
         }
 
     def get_custom_border_settings(self):
@@ -994,6 +1006,7 @@ class OptionsDialog(QDialog):
         self.export_settings = settings
         self.export_format.setCurrentText(settings.get("format", "JPEG"))
         self.jpeg_quality.setValue(settings.get("jpeg_quality", 95))
+        self._set_export_preset(settings.get("preset", "balanced"))
         self._on_export_format_changed(self.export_format.currentText())
 
     def set_custom_border_settings(self, settings: dict):
@@ -1105,13 +1105,9 @@ if ($device) {{
             QMessageBox.information(self, "No Selection", "Please select games to process.")
             return
 
-        # Group by platform
-        by_platform: Dict[str, List[str]] = {}
-        for game in selected:
-            plat = game["platform"]
-            if plat not in by_platform:
-                by_platform[plat] = []
-            by_platform[plat].append(game["title"])
+        # One batch job for the whole selection: the dataset is loaded and each
+        # platform resolved once, and titles run in parallel (existing icons are skipped)
+        items = [(game["platform"], game["title"]) for game in selected]
 
         # Load config for processing
         cfg_path = Path(self.config_path)
@@ -1133,88 +1129,41 @@ if ($device) {{
         callbacks.preview.connect(self._add_preview)
         callbacks.current_item.connect(self._on_current_item)
 
-        # Calculate total games across all platforms
-        total_games = sum(len(titles) for titles in by_platform.values())
-
-        # Load config once to get output directory and format (avoid loading per-ROM)
         try:
             with open(cfg_path, "r", encoding="utf-8") as f:
                 cfg = yaml.safe_load(f) or {}
-            output_dir = cfg_path.parent / cfg.get("paths", {}).get("output_dir", "./output")
-            export_format = str(cfg.get("export_format", "JPEG")).upper()
-            file_ext = "jpg" if export_format == "JPEG" else "png"
+            workers = int((cfg.get("processing", {}) or {}).get("workers", 8))
         except Exception:
-            output_dir = cfg_path.parent / "output"
-            file_ext = "png"
+            workers = 8
+
+        interactive = self.interactive_check.isChecked()
 
-        # Process each platform's games
         def _run():
             try:
-                done_count = 0
-                skipped_count = 0
-                for platform_key, titles in by_platform.items():
-                    if self._cancel_token.is_cancelled:
-                        break
-
-                    # Get platform output folder name from config
-                    platforms_cfg = cfg.get("platforms", {}) or {}
-                    pconf = platforms_cfg.get(platform_key, {})
-                    folder_name = pconf.get("folder_name", platform_key.lower())
-                    out_plat = output_dir / folder_name
-
-                    for title in titles:
-                        if self._cancel_token.is_cancelled:
-                            break
-
-                        # Check if output already exists BEFORE calling run_job
-                        # This avoids expensive config parsing for already-scraped ROMs
-                        slug = run_backend.safe_slug(title)
-                        out_path = out_plat / slug / f"icon.{file_ext}"
-
-                        if out_path.exists():
-                            # Already scraped - skip without calling run_job
-                            callbacks.log.emit(f"[SKIP] {platform_key}: {title} - Already exists")
-                            done_count += 1
-                            skipped_count += 1
-                            callbacks.progress.emit(done_count, total_games)
-                            continue
-
-                        # Emit current item being processed
-                        callbacks.current_item.emit(title, platform_key)
-                        callbacks.progress.emit(done_count, total_games)
-
-                        # Process single game - limit=1 ensures only one icon per ROM
-                        ok, msg = run_backend.run_job(
-                            config_path=cfg_path,
-                            platforms=[platform_key],
-                            workers=1,
-                            limit=1,  # Only generate one icon per scanned ROM
-                            cancel=self._cancel_token,
-                            callbacks={
-                                "log": lambda m: callbacks.log.emit(str(m)),
-                                "preview": lambda p, t="", pl="": callbacks.preview.emit(str(p), t, pl),
-                                "request_selection": self._request_artwork_selection,
-                            },
-                            search_term=title,
-                            interactive_mode=self.interactive_check.isChecked(),
-                            download_heroes=self.hero_check.isChecked(),
-                            hero_count=1,  # Only one hero image per ROM
-                            fallback_settings=self.fallback_settings,
-                            download_screenshots=self.screenshot_settings.get("enabled", False),
-                            screenshot_count=self.screenshot_settings.get("count", 3),
-                            copy_to_device=self.device_settings.get("enabled", False),
-                            device_path=self.device_settings.get("path", ""),
-                            scrape_logos=self.logo_settings.get("scrape_logos", True),
-                            logo_fallback_to_boxart=self.logo_settings.get("fallback_to_boxart", True)
-                        )
-
-                        done_count += 1
-                        callbacks.progress.emit(done_count, total_games)
-
-                if skipped_count > 0:
-                    callbacks.finished.emit(True, f"Processing complete ({skipped_count} already existed, skipped)")
-                else:
-                    callbacks.finished.emit(True, "Processing complete")
+                ok, msg = run_backend.run_batch_job(
+                    config_path=cfg_path,
+                    items=items,
+                    workers=workers,
+                    cancel=self._cancel_token,
+                    callbacks={
+                        "log": lambda m: callbacks.log.emit(str(m)),
+                        "progress": lambda d, t: callbacks.progress.emit(d, t),
+                        "preview": lambda p, t="", pl="": callbacks.preview.emit(str(p), t, pl),
+                        "current_item": lambda t, pl: callbacks.current_item.emit(t, pl),
+                        "request_selection": self._request_artwork_selection,
+                    },
+                    interactive_mode=interactive,
+                    download_heroes=self.hero_check.isChecked(),
+                    hero_count=1,  # Only one hero image per ROM
+                    fallback_settings=self.fallback_settings,
+                    download_screenshots=self.screenshot_settings.get("enabled", False),
+                    screenshot_count=self.screenshot_settings.get("count", 3),
+                    copy_to_device=self.device_settings.get("enabled", False),
+                    device_path=self.device_settings.get("path", ""),
+                    scrape_logos=self.logo_settings.get("scrape_logos", True),
+                    logo_fallback_to_boxart=self.logo_settings.get("fallback_to_boxart", True)
+                )
+                callbacks.finished.emit(ok, msg)
 
             except Exception as e:
                 callbacks.finished.emit(False, f"Error: {e}")
@@ -1412,7 +1361,6 @@ if ($device) {{
             return
 
         self._rescrape_in_progress = True
-        self._rescrape_cancelled = False
         self.btn_rescrape_selected.setEnabled(False)
         self.btn_rescrape_selected.setText("Re-scraping...")
         self._on_log(f"[RE-SCRAPE] Starting batch re-scrape for {len(selected_items)} icons")
@@ -1424,57 +1372,49 @@ if ($device) {{
                     self._on_log("[RE-SCRAPE] Config file not found")
                     return
 
-                for i, preview_widget in enumerate(selected_items):
-                    if self._rescrape_cancelled:
-                        self._on_log(f"[RE-SCRAPE] Batch cancelled by user")
-                        break
-
-                    game_title = preview_widget.game_title
-                    platform = preview_widget.platform
-
-                    self._on_log(f"[RE-SCRAPE] ({i+1}/{len(selected_items)}) Processing: {game_title}")
-
-                    cancel_token = run_backend.CancelToken()
-
-                    # Use the same run_job function with interactive_mode=True
-                    ok, msg = run_backend.run_job(
-                        config_path=cfg_path,
-                        platforms=[platform],
-                        workers=1,
-                        limit=1,
-                        cancel=cancel_token,
-                        callbacks={
-                            "log": lambda m: self._on_log(str(m)),
-                            "preview": lambda p, t="", pl="", pw=preview_widget: self._on_rescrape_preview_update(pw, p),
-                            "request_selection": self._request_artwork_selection_batch,
-                        },
-                        search_term=game_title,
-                        interactive_mode=True,  # Force interactive mode
-                        download_heroes=False,
-                        hero_count=0,
-                        fallback_settings={"enabled": False},
-                        download_screenshots=False,
-                        screenshot_count=0,
-                        copy_to_device=False,
-                        device_path="",
-                        scrape_logos=False,
-                        logo_fallback_to_boxart=False,
-                        force_rescrape=True,  # Override existing icons
-                        output_path_override=preview_widget.icon_path
+                # One interactive batch job; each icon is written back to its own file
+                items = [(w.platform, w.game_title, w.icon_path) for w in selected_items]
+                widgets_by_path = {str(Path(w.icon_path)): w for w in selected_items}
+
+                def on_preview(path: str, title: str = "", platform: str = ""):
+                    preview_widget = widgets_by_path.get(str(Path(path)))
+                    if preview_widget is None:
+                        return
+                    self._on_log(f"[RE-SCRAPE] Completed: {preview_widget.game_title}")
+                    self._on_rescrape_preview_update(preview_widget, path)
+                    # Deselect after successful processing - store widget reference for main thread
+                    self._widget_to_deselect = preview_widget
+                    from PySide6.QtCore import QMetaObject, Qt
+                    QMetaObject.invokeMethod(
+                        self,
+                        "_deselect_preview_widget",
+                        Qt.ConnectionType.QueuedConnection
                     )
 
-                    if ok:
-                        self._on_log(f"[RE-SCRAPE] Completed: {game_title}")
-                        # Deselect after successful processing - store widget reference for main thread
-                        self._widget_to_deselect = preview_widget
-                        from PySide6.QtCore import QMetaObject, Qt
-                        QMetaObject.invokeMethod(
-                            self,
-                            "_deselect_preview_widget",
-                            Qt.ConnectionType.QueuedConnection
-                        )
-                    else:
-                        self._on_log(f"[RE-SCRAPE] Skipped or failed: {game_title}")
+                ok, msg = run_backend.run_batch_job(
+                    config_path=cfg_path,
+                    items=items,
+                    workers=1,
+                    cancel=run_backend.CancelToken(),
+                    callbacks={
+                        "log": lambda m: self._on_log(str(m)),
+                        "preview": on_preview,
+                        "request_selection": self._request_artwork_selection,
+                    },
+                    interactive_mode=True,  # Force interactive mode
+                    download_heroes=False,
+                    hero_count=0,
+                    fallback_settings={"enabled": False},
+                    download_screenshots=False,
+                    screenshot_count=0,
+                    copy_to_device=False,
+                    device_path="",
+                    scrape_logos=False,
+                    logo_fallback_to_boxart=False,
+                    force_rescrape=True  # Override existing icons
+                )
+                if not ok:
+                    self._on_log(f"[RE-SCRAPE] {msg}")
 
                 self._on_log(f"[RE-SCRAPE] Batch complete")
 
@@ -1494,17 +1434,6 @@ if ($device) {{
         thread = threading.Thread(target=do_batch_rescrape, daemon=True)
         thread.start()
 
-    def _request_artwork_selection_batch(self, title: str, platform: str, artwork_options):
-        """
-        Request user to select artwork during batch re-scrape.
-        Returns selected index, None if skipped, -1 if cancelled all.
-        """
-        result = self._request_artwork_selection(title, platform, artwork_options)
-        if result == -1:
-            # User cancelled all - stop batch
-            self._rescrape_cancelled = True
-        return result
-
     @Slot()
     def _on_batch_rescrape_finished(self):
         """Called when batch re-scrape is finished."""
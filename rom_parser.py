@@ -11,6 +11,8 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any
 
+from title_normalize import clean_game_title, normalize_for_search
+
 
 def _get_subprocess_flags():
     """Get platform-specific subprocess flags to hide console on Windows."""
@@ -432,98 +434,14 @@ def detect_region(filename: str, file_path: Optional[Path] = None, platform_key:
     return 'Unknown'
 
 
-def clean_game_title(name: str) -> str:
-    """
-    Clean a ROM filename/folder name to extract a clean game title.
-    Removes region tags, version info, dump info, file extensions, file sizes, etc.
-    """
-    # Remove file extension if present
-    name = re.sub(r'\.(zip|7z|rar|' + '|'.join(ext.strip('.') for exts in ROM_EXTENSIONS.values() for ext in exts) + r')$', '', name, flags=re.IGNORECASE)
-
-    # Remove common archive suffixes
-    name = re.sub(r'\.(zip|7z|rar)$', '', name, flags=re.IGNORECASE)
-
-    # Remove square bracket tags like [!], [U], [E], [J], [h], [b], etc.
-    name = re.sub(r'\s*\[[^\]]*\]', '', name)
-
-    # Remove file size patterns like (6.01 GB), (1.2 MB), (500 KB), (123456789)
-    name = re.sub(r'\s*\(\s*\d+\.?\d*\s*(GB|MB|KB|B|bytes?)?\s*\)', '', name, flags=re.IGNORECASE)
-    # Also handle standalone numbers in parens (often file sizes without units)
-    name = re.sub(r'\s*\(\s*\d{6,}\s*\)', '', name)
-
-    # Remove parenthetical region/version tags
-    # Match patterns like (USA), (Europe), (Rev A), (v1.0), (En,Fr,De), etc.
-    name = re.sub(r'\s*\((USA|US|Europe|EU|Japan|JP|World|WLD|En|Fr|De|Es|It|Ja|Ko|Zh|Rev\s*[A-Z0-9]*|v\d+[.\d]*|Proto|Beta|Alpha|Demo|Sample|Unl|Pirate|Virtual Console|Switch|NSW|PS4|PS5|Xbox|XB1|PC|[A-Za-z]{2}(,[A-Za-z]{2})*)\)', '', name, flags=re.IGNORECASE)
-
-    # Remove version patterns like v1.0.1, V2.3, version 1.0
-    name = re.sub(r'\s*v\d+(\.\d+)*', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s*version\s*\d+(\.\d+)*', '', name, flags=re.IGNORECASE)
-
-    # Remove parenthetical disc numbers
-    name = re.sub(r'\s*\(Disc\s*\d+[^)]*\)', '', name, flags=re.IGNORECASE)
-
-    # Remove update/DLC/patch tags
-    name = re.sub(r'\s*\+?\s*(Update|DLC|Patch|Fix|Hotfix)\s*v?\d*(\.\d+)*', '', name, flags=re.IGNORECASE)
-
-    # Remove any remaining empty parentheses
-    name = re.sub(r'\s*\(\s*\)', '', name)
-
-    # Remove leading/trailing whitespace and normalize spaces
-    name = re.sub(r'\s+', ' ', name).strip()
-
-    # Remove trailing dashes, underscores, or dots
-    name = name.rstrip('-_. ')
-
-    return name
-
-
-def normalize_for_search(name: str) -> str:
-    """
-    Normalize a game title for search - handles accented characters,
-    special characters, and common variations.
-    Returns a search-friendly version of the name.
-    """
-    import unicodedata
-
-    # First clean the title
-    name = clean_game_title(name)
-
-    # Normalize unicode - decompose accented characters
-    # NFD breaks é into e + combining accent, then we strip combining chars
-    normalized = unicodedata.normalize('NFD', name)
-    # Remove combining diacritical marks (accents)
-    ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-
-    # Also create a version with common substitutions
-    # Handle special game title patterns
-    search_name = ascii_name
-
-    # Common character substitutions
-    replacements = {
-        '&': 'and',
-        '+': 'plus',
-        '@': 'at',
-        '™': '',
-        '®': '',
-        '©': '',
-        ''': "'",
-        ''': "'",
-        '"': '"',
-        '"': '"',
-        '–': '-',
-        '—': '-',
-        '…': '...',
-    }
-    for old, new in replacements.items():
-        search_name = search_name.replace(old, new)
-
-    # Remove most punctuation but keep apostrophes and hyphens for names
-    search_name = re.sub(r"[^\w\s'-]", ' ', search_name)
-
-    # Normalize whitespace
-    search_name = re.sub(r'\s+', ' ', search_name).strip()
-
-    return search_name
+# Roman numeral -> number substitutions tried by get_search_variants
+_ROMAN_NUMERAL_VARIANTS = [
+    (re.compile(pattern), replacement) for pattern, replacement in [
+        (r'\bIII\b', '3'), (r'\bII\b', '2'), (r'\bIV\b', '4'),
+        (r'\bVI\b', '6'), (r'\bVII\b', '7'), (r'\bVIII\b', '8'),
+        (r'\bIX\b', '9'), (r'\bXI\b', '11'), (r'\bXII\b', '12'),
+    ]
+]
 
 
 def get_search_variants(name: str) -> List[str]:
@@ -555,14 +473,9 @@ def get_search_variants(name: str) -> List[str]:
             variants.append(main_title)
 
     # Handle roman numerals vs numbers (e.g., "III" vs "3")
-    roman_map = [
-        (r'\bIII\b', '3'), (r'\bII\b', '2'), (r'\bIV\b', '4'),
-        (r'\bVI\b', '6'), (r'\bVII\b', '7'), (r'\bVIII\b', '8'),
-        (r'\bIX\b', '9'), (r'\bXI\b', '11'), (r'\bXII\b', '12'),
-    ]
-    for pattern, replacement in roman_map:
-        if re.search(pattern, clean):
-            variant = re.sub(pattern, replacement, clean)
+    for pattern, replacement in _ROMAN_NUMERAL_VARIANTS:
+        if pattern.search(clean):
+            variant = pattern.sub(replacement, clean)
             if variant not in variants:
                 variants.append(variant)
 
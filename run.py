@@ -31,9 +31,25 @@ def parse_args():
     p.add_argument("--workers", type=int, default=8, help="Parallel workers (default: 8)")
     p.add_argument("--limit", type=int, default=0, help="Limit titles per platform (0 = use config or unlimited)")
     p.add_argument("--mode", default="", help="Source mode: steamgriddb_then_libretro, steamgriddb, libretro, libretro_then_steamgriddb (empty = use config)")
+    p.add_argument("--rebuild", action="store_true", help="Re-render existing icons from cached sources with the current borders/settings (offline, uses all cores)")
+    p.add_argument("--bench-export", action="store_true", help="Report encode time and size per export preset using icons from the output folder, then exit")
     return p.parse_args()
 
 
+def bench_export(cfg: dict, config_path: Path, count: int = 20) -> int:
+    output_dir = config_path.parent / (cfg.get("paths", {}) or {}).get("output_dir", "./output")
+    icons = sorted(p for p in output_dir.rglob("icon.*") if p.suffix.lower() in (".png", ".jpg", ".jpeg", ".webp"))[:count]
+    if not icons:
+        print(f"[ERROR] No icons found in {output_dir}")
+        return 1
+    quality = int(cfg.get("jpeg_quality", 95))
+    print(f"[BENCH] {len(icons)} icons from {output_dir}, JPEG quality {quality}")
+    print(f"{'format':<6} {'preset':<9} {'encode ms':>10} {'bytes':>10}")
+    for row in run_backend.benchmark_export_presets(icons, quality=quality):
+        print(f"{row['format']:<6} {row['preset']:<9} {row['ms']:>10.1f} {row['bytes']:>10}")
+    return 0
+
+
 def main():
     args = parse_args()
 
@@ -49,6 +65,9 @@ def main():
         print(f"[ERROR] Failed to read config: {e}")
         return 1
 
+    if args.bench_export:
+        return bench_export(cfg, config_path)
+
     platforms_cfg = cfg.get("platforms", {}) or {}
     if not platforms_cfg:
         print("[ERROR] No platforms configured in config.yaml")
@@ -111,6 +130,7 @@ def main():
             callbacks=callbacks,
             source_mode=args.mode if args.mode else None,
             steamgriddb_square_only=None,  # Use config default
+            rebuild_offline=args.rebuild,
         )
 
         print()
@@ -128,4 +148,6 @@ def main():
 
 
 if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -2,17 +2,20 @@ import os
 import re
 import sys
 import json
+import math
 import time
+import shutil
 import hashlib
 import zipfile
+from difflib import SequenceMatcher
 import threading
-import unicodedata
 import subprocess
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Any, Tuple
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import html
 from urllib.parse import unquote
 
@@ -20,6 +23,12 @@ import requests
 import yaml
 from PIL import Image, ImageOps, ImageChops, ImageFilter
 
+from asset_manifest import open_manifest
+from artwork_cache import ArtworkData, get_artwork_cache
+from artwork_prefetch import ArtworkPrefetcher
+from dataset_snapshot import build_snapshot, open_snapshot, prune_snapshots, snapshot_path
+from title_normalize import clean_game_title, normalize_for_search, normalize_titles
+
 
 def _get_subprocess_flags():
     """Get platform-specific subprocess flags to hide console on Windows."""
@@ -29,22 +38,9 @@ def _get_subprocess_flags():
 
 # Import search utilities from rom_parser
 try:
-    from rom_parser import normalize_for_search, get_search_variants, clean_game_title, get_iisu_folder_name
+    from rom_parser import get_search_variants, get_iisu_folder_name
 except ImportError:
     # Fallback implementations if rom_parser is not available
-    def clean_game_title(name: str) -> str:
-        """Basic fallback title cleaning."""
-        name = re.sub(r'\s*\[[^\]]*\]', '', name)
-        name = re.sub(r'\s*\([^)]*\)', '', name)
-        name = re.sub(r'\s+v\d+(\.\d+)*', '', name, flags=re.IGNORECASE)
-        return re.sub(r'\s+', ' ', name).strip()
-
-    def normalize_for_search(name: str) -> str:
-        """Basic fallback normalization."""
-        name = clean_game_title(name)
-        normalized = unicodedata.normalize('NFD', name)
-        return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-
     def get_search_variants(name: str) -> List[str]:
         """Basic fallback variants."""
         clean = clean_game_title(name)
@@ -89,6 +85,27 @@ def safe_slug(s: str, limit: int = 180) -> str:
 def sha256_text(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
+def sha256_bytes(b: bytes) -> str:
+    return hashlib.sha256(b).hexdigest()
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link src to dst (replacing dst), falling back to a copy across devices."""
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
 def load_yaml(path: Path) -> dict:
     with path.open("r", encoding="utf-8") as f:
         return yaml.safe_load(f) or {}
@@ -113,17 +130,53 @@ def get_export_extension(export_format: str) -> str:
     return fmt.lower()
 
 
-def save_image_for_export(img: Image.Image, path: Path, export_format: str, quality: int = 95, optimize: bool = True):
+# Encoder settings per export_preset. PNG optimize=True makes Pillow search
+# every filter at level 9, which dominates export time for 1024px icons.
+EXPORT_PRESETS: Dict[str, Dict[str, Any]] = {
+    "fast": {"png_compress_level": 1, "png_optimize": False,
+             "jpeg_optimize": False, "jpeg_progressive": False, "webp_method": 0, "webp_effort": 0},
+    "balanced": {"png_compress_level": 6, "png_optimize": False,
+                 "jpeg_optimize": True, "jpeg_progressive": False, "webp_method": 4, "webp_effort": 50},
+    "smallest": {"png_compress_level": 9, "png_optimize": True,
+                 "jpeg_optimize": True, "jpeg_progressive": True, "webp_method": 5, "webp_effort": 80},
+}
+DEFAULT_EXPORT_PRESET = "balanced"
+
+def export_save_options(export_format: str, quality: int = 95, preset: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    Pillow format name and save() keyword arguments for an export format and preset.
+
+    WEBP is written lossless; the preset sets its compression effort.
+    """
+    p = EXPORT_PRESETS.get(str(preset or DEFAULT_EXPORT_PRESET).lower(), EXPORT_PRESETS[DEFAULT_EXPORT_PRESET])
+    fmt = export_format.upper()
+    if fmt in ("JPG", "JPEG"):
+        return "JPEG", {"quality": quality, "optimize": p["jpeg_optimize"], "progressive": p["jpeg_progressive"]}
+    if fmt == "PNG":
+        return "PNG", {"compress_level": p["png_compress_level"], "optimize": p["png_optimize"]}
+    if fmt == "WEBP":
+        return "WEBP", {"lossless": True, "method": p["webp_method"], "quality": p["webp_effort"]}
+    return fmt, {}
+
+def save_image_for_export(img: Image.Image, path: Path, export_format: str, quality: int = 95, optimize: bool = True,
+                          preset: Optional[str] = None):
     """
     Save an image in the specified format, handling RGBA to RGB conversion for JPEG.
 
     Args:
         img: PIL Image to save
         path: Output path
-        export_format: Format string (e.g., "JPEG", "PNG")
+        export_format: Format string (e.g., "JPEG", "PNG", "WEBP")
         quality: JPEG quality (1-100), ignored for PNG
-        optimize: Whether to optimize the output
+        optimize: Whether to optimize the output (only used without a preset)
+        preset: Encoder preset from EXPORT_PRESETS ("fast", "balanced", "smallest")
     """
+    # Write a new file rather than truncating the old one, which may be a hard link
+    # into the render cache
+    path = Path(path)
+    if path.exists():
+        path.unlink()
+
     # Normalize format
     fmt = export_format.upper()
     if fmt in ("JPG", "JPEG"):
@@ -140,10 +193,448 @@ def save_image_for_export(img: Image.Image, path: Path, export_format: str, qual
             img = background
         elif img.mode != "RGB":
             img = img.convert("RGB")
-        img.save(path, fmt, quality=quality, optimize=optimize)
+        if preset:
+            fmt, options = export_save_options(fmt, quality, preset)
+            img.save(path, fmt, **options)
+        else:
+            img.save(path, fmt, quality=quality, optimize=optimize)
     else:
         # PNG or other formats that support transparency
-        img.save(path, fmt, optimize=optimize)
+        if preset:
+            fmt, options = export_save_options(fmt, quality, preset)
+            img.save(path, fmt, **options)
+        else:
+            img.save(path, fmt, optimize=optimize)
+
+
+# Image modes that can be written as-is for each export format
+_PASSTHROUGH_MODES = {
+    "JPEG": ("RGB", "L"),
+    "PNG": ("RGBA", "RGB", "LA", "L", "P"),
+    "WEBP": ("RGBA", "RGB"),
+}
+
+def needs_reencode(data, export_format: str, max_size: Tuple[int, int] = (0, 0)) -> bool:
+    """
+    True if downloaded image data must be decoded and re-encoded for export_format.
+
+    Data already in the target format, within max_size, in a plain mode, not
+    animated and with no EXIF rotation to apply can be written unchanged. Only
+    the header is read.
+    """
+    fmt = export_format.upper()
+    if fmt == "JPG":
+        fmt = "JPEG"
+    try:
+        img = open_image(data)
+    except Exception:
+        return True
+    if img.format != fmt or img.mode not in _PASSTHROUGH_MODES.get(fmt, ()):
+        return True
+    if fit_scale(img.size, max_size) < 1.0:
+        return True
+    if getattr(img, "is_animated", False):
+        return True
+    try:
+        orientation = img.getexif().get(0x0112, 1)
+    except Exception:
+        return True
+    return orientation not in (None, 1)
+
+def write_bytes_atomic(data, path: Path) -> None:
+    """Write data to a new file at path (never truncating an existing one, which may be a hard link)."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+# ==========================
+# Output profiles
+# ==========================
+OUTPUT_ASSET_TYPES = ("icon", "title", "hero", "slide")
+
+def load_output_profile(cfg: dict) -> Dict[str, Dict[str, Any]]:
+    """
+    Output format, quality and size per asset type (icon, title, hero, slide).
+
+    Defaults come from output_size / export_format / jpeg_quality. When
+    device_profile names an entry in device_profiles, its per-type settings
+    override them. Icons are square ("size"); the other types keep their aspect
+    ratio and are only scaled down to fit "max_size" (width, height; 0 = no limit).
+    "variants" lists extra long-edge sizes written next to each file (output_variants,
+    or "variants" in the device profile).
+    """
+    base_format = str(cfg.get("export_format", "JPEG")).upper()
+    base_quality = int(cfg.get("jpeg_quality", 95))
+    profiles = cfg.get("device_profiles", {}) or {}
+    overrides = profiles.get(cfg.get("device_profile") or "", {}) or {}
+    variants_cfg = cfg.get("output_variants", {}) or {}
+
+    profile: Dict[str, Dict[str, Any]] = {}
+    for asset_type in OUTPUT_ASSET_TYPES:
+        o = overrides.get(asset_type, {}) or {}
+        spec: Dict[str, Any] = {
+            "format": str(o.get("format", base_format)).upper(),
+            "quality": int(o.get("quality", base_quality)),
+        }
+        if asset_type == "icon":
+            spec["size"] = int(o.get("size", cfg.get("output_size", 1024)))
+        else:
+            spec["max_size"] = (int(o.get("max_width") or 0), int(o.get("max_height") or 0))
+        variants = o.get("variants", variants_cfg.get(asset_type)) or []
+        spec["variants"] = sorted({int(v) for v in variants if int(v) > 0}, reverse=True)
+        profile[asset_type] = spec
+    return profile
+
+_VARIANT_SUFFIX = re.compile(r"_(\d+)px$")
+
+def variant_path(path: Path, size: int) -> Path:
+    """Path of the size variant of an output file: icon.png -> icon_256px.png."""
+    return path.with_name(f"{path.stem}_{size}px{path.suffix}")
+
+def variant_base_stem(name: str) -> str:
+    """Stem of the full-size file a variant belongs to (the stem itself for full-size files)."""
+    return _VARIANT_SUFFIX.sub("", Path(name).stem)
+
+def asset_type_for_file(name: str) -> str:
+    """Asset type of a game folder file: icon.png -> "icon", hero_2.jpg -> "hero", slide_1.png -> "slide"."""
+    stem = Path(name).stem.lower()
+    for asset_type in ("hero", "slide", "title"):
+        if stem.startswith(asset_type):
+            return asset_type
+    return "icon"
+
+def fit_scale(size: Tuple[int, int], max_size: Tuple[int, int]) -> float:
+    """Scale (<= 1) that fits size within max_size; a 0 bound is unlimited."""
+    w, h = size
+    scale = 1.0
+    if max_size[0] and w > max_size[0]:
+        scale = min(scale, max_size[0] / float(w))
+    if max_size[1] and h > max_size[1]:
+        scale = min(scale, max_size[1] / float(h))
+    return scale
+
+def export_image(img: Image.Image, path: Path, spec: Dict[str, Any], preset: Optional[str] = None) -> Image.Image:
+    """Save img for an output profile entry, downscaling it to the entry's max_size first. Returns the saved image."""
+    scale = fit_scale(img.size, spec.get("max_size", (0, 0)))
+    if scale < 1.0:
+        size = (max(1, int(round(img.width * scale))), max(1, int(round(img.height * scale))))
+        img = img.resize(size, Image.LANCZOS, reducing_gap=2.0)
+    save_image_for_export(img, path, spec["format"], spec["quality"], preset=preset)
+    return img
+
+def resampling_pyramid(img: Image.Image, sizes: List[int]) -> List[Tuple[int, Image.Image]]:
+    """
+    Downscaled copies of img with the given long-edge sizes (largest first).
+
+    Levels are derived from each other: the image is halved with reduce(2) while
+    it is at least twice the next size, then one LANCZOS step hits the size
+    exactly. Sizes not smaller than img are skipped.
+    """
+    levels = []
+    current = img
+    for size in sorted(set(sizes), reverse=True):
+        if size >= max(img.size):
+            continue
+        while max(current.size) >= 2 * size:
+            current = current.reduce(2)
+        scale = size / float(max(current.size))
+        target = (max(1, int(round(current.width * scale))), max(1, int(round(current.height * scale))))
+        levels.append((size, current.resize(target, Image.LANCZOS) if target != current.size else current))
+    return levels
+
+def export_variants(img: Image.Image, path: Path, spec: Dict[str, Any], preset: Optional[str] = None) -> List[str]:
+    """Write the profile's size variants of an exported image next to it. Returns the file names."""
+    names = []
+    for size, level in resampling_pyramid(img, spec.get("variants", [])):
+        vpath = variant_path(path, size)
+        save_image_for_export(level, vpath, spec["format"], spec["quality"], preset=preset)
+        names.append(vpath.name)
+    return names
+
+def export_boxart_title(icon_path: Path, title_path: Path, output_profile: Dict[str, Dict[str, Any]],
+                        preset: Optional[str] = None, icon_img: Optional[Image.Image] = None) -> List[str]:
+    """
+    Title image (and its size variants) for a game without a logo: the icon's
+    files, linked when the title settings match the icon's and re-encoded
+    otherwise. Returns the file names written.
+    """
+    icon, title = output_profile["icon"], output_profile["title"]
+    names = []
+    sizes = title["variants"]
+    if (title["format"], title["quality"]) == (icon["format"], icon["quality"]) \
+            and fit_scale((icon["size"], icon["size"]), title["max_size"]) >= 1.0:
+        link_or_copy(icon_path, title_path)
+        names.append(title_path.name)
+        sizes = []
+        for size in title["variants"]:
+            if size in icon["variants"] and variant_path(icon_path, size).exists():
+                link_or_copy(variant_path(icon_path, size), variant_path(title_path, size))
+                names.append(variant_path(title_path, size).name)
+            else:
+                sizes.append(size)
+        if not sizes:
+            return names
+
+    if icon_img is None:
+        with Image.open(icon_path) as im:
+            icon_img = im.convert("RGBA")
+    if names:
+        title_img = icon_img
+    else:
+        title_img = export_image(icon_img, title_path, title, preset)
+        names.append(title_path.name)
+    return names + export_variants(title_img, title_path, dict(title, variants=sizes), preset)
+
+
+def benchmark_export_presets(
+    image_paths: List[Path],
+    formats: Tuple[str, ...] = ("PNG", "JPEG", "WEBP"),
+    quality: int = 95
+) -> List[Dict[str, Any]]:
+    """
+    Encode each image in memory with every export preset and format.
+
+    Returns one row per (format, preset) with the mean encode time in ms and
+    mean output size in bytes over the images.
+    """
+    images = []
+    for path in image_paths:
+        with Image.open(path) as im:
+            images.append(ImageOps.exif_transpose(im).convert("RGBA"))
+    rows = []
+    for fmt in formats:
+        for preset in EXPORT_PRESETS:
+            pil_fmt, options = export_save_options(fmt, quality, preset)
+            total_ms = 0.0
+            total_bytes = 0
+            for img in images:
+                src = img.convert("RGB") if pil_fmt == "JPEG" else img
+                buf = BytesIO()
+                t0 = time.perf_counter()
+                src.save(buf, pil_fmt, **options)
+                total_ms += (time.perf_counter() - t0) * 1000.0
+                total_bytes += buf.tell()
+            n = max(1, len(images))
+            rows.append({"format": pil_fmt, "preset": preset, "ms": total_ms / n, "bytes": total_bytes // n})
+    return rows
+
+
+_TITLE_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def fuzzy_title_key(title: str) -> Tuple[str, set]:
+    """Normalized form and token set fuzzy_match_title compares titles by (stored in dataset snapshots)."""
+    norm = normalize_for_search(title).lower()
+    return norm, set(_TITLE_TOKEN_RE.findall(norm))
+
+
+def fuzzy_title_keys(titles: List[str]) -> List[Tuple[str, set]]:
+    """fuzzy_title_key for a whole list of titles, normalized in one batch."""
+    keys = []
+    for norm in normalize_titles(titles):
+        norm = norm.lower()
+        keys.append((norm, set(_TITLE_TOKEN_RE.findall(norm))))
+    return keys
+
+
+# Important keywords that must match if present in search term
+# These distinguish different versions/editions of the same game
+CRITICAL_KEYWORDS = {
+    'trilogy', 'collection', 'compilation', 'anthology', 'bundle',
+    'remaster', 'remastered', 'remake', 'hd', 'definitive', 'complete',
+    'goty', 'ultimate', 'deluxe', 'premium', 'gold', 'platinum',
+    '2', '3', '4', '5', '6', '7', '8', '9', '10',  # Numbered sequels
+    'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',  # Roman numerals
+    'zero', 'origins', 'revelations', 'corruption', 'echoes', 'hunters',
+    'prime', 'fusion', 'super', 'advance', 'portable', 'pocket',
+}
+
+# Extra critical keywords in a title that rule it out (a different entry in the series)
+SEQUEL_INDICATORS = {'2', '3', '4', '5', '6', '7', '8', '9', '10',
+                     'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+                     'trilogy', 'collection', 'compilation'}
+
+
+def _fuzzy_score(search_norm: str, search_tokens: set, search_critical: set,
+                 title_norm: str, title_tokens, threshold: float) -> Optional[float]:
+    """Score one normalized title against the search (None = no match). Shared by the scan and the index."""
+    # Check for critical keyword mismatch
+    # If search has critical keywords, title should have them too
+    title_critical = title_tokens & CRITICAL_KEYWORDS
+    if search_critical:
+        # If search has "trilogy" but title doesn't, heavily penalize
+        missing_critical = search_critical - title_critical
+        if missing_critical:
+            # Skip this match entirely - critical keywords are missing
+            return None
+
+    # Also penalize if title has critical keywords that search doesn't
+    # e.g., searching "Metroid Prime" should not match "Metroid Prime 3"
+    if title_critical - search_critical:
+        extra_critical = title_critical - search_critical
+        # Only skip if the extra keywords are sequel indicators
+        if extra_critical & SEQUEL_INDICATORS:
+            return None
+
+    # Strategy 1: Exact match (after normalization)
+    if search_norm == title_norm:
+        return 1.0
+
+    # Strategy 2: One contains the other (with word boundary check)
+    # Be STRICT: only give high scores if lengths are very similar
+    # "Pac-Man" should NOT highly match "Jr. Pac-Man" or "Pac-Man Plus"
+    if search_norm in title_norm or title_norm in search_norm:
+        # Check if it's a proper word boundary match, not just substring
+        is_word_boundary_match = False
+        if search_norm in title_norm:
+            idx = title_norm.find(search_norm)
+            end_idx = idx + len(search_norm)
+            before_ok = idx == 0 or title_norm[idx - 1] == ' '
+            after_ok = end_idx == len(title_norm) or title_norm[end_idx] == ' '
+            is_word_boundary_match = before_ok and after_ok
+        elif title_norm in search_norm:
+            idx = search_norm.find(title_norm)
+            end_idx = idx + len(title_norm)
+            before_ok = idx == 0 or search_norm[idx - 1] == ' '
+            after_ok = end_idx == len(search_norm) or search_norm[end_idx] == ' '
+            is_word_boundary_match = before_ok and after_ok
+
+        if is_word_boundary_match:
+            # Score based on length ratio - be strict about length differences
+            len_ratio = min(len(search_norm), len(title_norm)) / max(len(search_norm), len(title_norm))
+            # Only give high score (>= 0.85) if lengths are nearly identical (ratio > 0.95)
+            # This prevents "Pac-Man" from matching "Pac-Man Plus" with high score
+            if len_ratio > 0.95:
+                return 0.90 + (len_ratio * 0.05)
+            # Significant length difference - lower score proportional to ratio
+            # This allows the match but won't be considered "exact"
+            return 0.5 + (len_ratio * 0.3)
+
+    # Strategy 3: Token overlap (Jaccard similarity)
+    if search_tokens and title_tokens:
+        intersection = len(search_tokens & title_tokens)
+        union = len(search_tokens | title_tokens)
+        jaccard = intersection / union if union > 0 else 0
+
+        # Only boost if tokens match exactly (same tokens, same count)
+        # Don't boost for "Pac-Man Plus" when searching "Pac-Man"
+        if search_tokens == title_tokens:
+            # Exact token match - high score
+            jaccard = min(1.0, jaccard + 0.3)
+        elif search_tokens <= title_tokens:
+            # All search tokens found, but title has extra tokens
+            # Give modest boost but cap below "exact match" threshold
+            extra_tokens = len(title_tokens - search_tokens)
+            # More extra tokens = lower score
+            boost = max(0, 0.15 - (extra_tokens * 0.05))
+            jaccard = min(0.80, jaccard + boost)  # Cap at 0.80, below 0.85 threshold
+
+        if jaccard >= threshold:
+            return jaccard
+
+    # Strategy 4: Sequence matching (handles typos, minor differences)
+    seq_ratio = SequenceMatcher(None, search_norm, title_norm).ratio()
+    if seq_ratio >= threshold:
+        # Penalize cases where one is a prefix of the other
+        shorter, longer = (search_norm, title_norm) if len(search_norm) <= len(title_norm) else (title_norm, search_norm)
+        if longer.startswith(shorter) and len(longer) > len(shorter):
+            extra_part = longer[len(shorter):]
+            if extra_part and extra_part[0] != ' ':
+                # No word boundary - definitely different game (e.g., "pacmania" vs "pacman")
+                seq_ratio = max(0, seq_ratio - 0.4)
+            else:
+                # Has word boundary but still different (e.g., "pac-man plus" vs "pac-man")
+                # Penalize based on length difference
+                len_ratio = len(shorter) / len(longer)
+                if len_ratio < 0.9:
+                    # Significant length difference - cap the score
+                    seq_ratio = min(seq_ratio, 0.75)
+        if seq_ratio >= threshold:
+            return seq_ratio
+
+    # Strategy 5: Check if search starts with or title starts with
+    # But only if it's at a word boundary to avoid "pac-man" matching "pac-mania"
+    prefix_match = False
+    if title_norm.startswith(search_norm):
+        # Title starts with search - check word boundary after search
+        if len(title_norm) == len(search_norm):
+            prefix_match = True
+        elif title_norm[len(search_norm)] in ' -:':
+            prefix_match = True
+    elif search_norm.startswith(title_norm):
+        # Search starts with title - check word boundary after title
+        if len(search_norm) == len(title_norm):
+            prefix_match = True
+        elif search_norm[len(title_norm)] in ' -:':
+            prefix_match = True
+
+    if prefix_match:
+        return 0.65
+    return None
+
+
+class FuzzyTitleIndex:
+    """
+    Candidate prefilter over one platform's normalized titles, so fuzzy_match_title
+    only scores titles that can possibly match:
+
+      - a token inverted index finds every title sharing a token with the search
+        (exact, containment, prefix and token-overlap matches all do), plus titles
+        with no tokens at all;
+      - a character-count profile bounds difflib's ratio from above (its
+        quick_ratio), keeping every title a sequence match could still reach
+        the threshold with.
+
+    Both are exact bounds, so results are identical to scanning every title.
+    Needs NumPy for the profile; build with FuzzyTitleIndex.build (None without NumPy).
+    """
+
+    def __init__(self, norms: List[str], token_sets: List[Any]):
+        self.norms = norms
+        self.token_sets = token_sets
+        postings: Dict[str, List[int]] = {}
+        tokenless = []
+        for i, tokens in enumerate(token_sets):
+            if not tokens:
+                tokenless.append(i)
+            for tok in tokens:
+                postings.setdefault(tok, []).append(i)
+        self.postings = {tok: np.array(ids, dtype=np.int32) for tok, ids in postings.items()}
+        self.tokenless = np.array(tokenless, dtype=np.int32)
+
+        alphabet = sorted({c for norm in norms for c in norm})
+        self.columns = {c: j for j, c in enumerate(alphabet)}
+        profile = np.zeros((len(norms), max(1, len(alphabet))), dtype=np.uint16)
+        for i, norm in enumerate(norms):
+            for c in norm:
+                profile[i, self.columns[c]] += 1
+        self.profile = profile
+        self.lengths = np.array([len(n) for n in norms], dtype=np.int32)
+
+    @classmethod
+    def build(cls, norms: List[str], token_sets: List[Any]) -> Optional["FuzzyTitleIndex"]:
+        return cls(norms, token_sets) if np is not None else None
+
+    def candidates(self, search_norm: str, search_tokens: set, threshold: float):
+        """Sorted indices of titles that may score for this search, or None when everything must be scanned."""
+        if not search_tokens or threshold <= 0:
+            return None
+        found = [self.tokenless] + [self.postings[t] for t in search_tokens if t in self.postings]
+
+        query = np.zeros(self.profile.shape[1], dtype=np.uint16)
+        for c in search_norm:
+            j = self.columns.get(c)
+            if j is not None:
+                query[j] += 1
+        common = np.minimum(self.profile, query).sum(axis=1)
+        total = self.lengths + len(search_norm)
+        # quick_ratio = 2 * common / total; the small slack keeps float rounding on the safe side
+        reachable = 2.0 * common >= (threshold - 1e-9) * np.maximum(total, 1)
+        found.append(np.flatnonzero(reachable).astype(np.int32))
+        return np.unique(np.concatenate(found))
 
 
 def fuzzy_match_title(search_term: str, database_titles: List[str], threshold: float = 0.6) -> List[Tuple[str, float]]:
@@ -151,164 +642,74 @@ def fuzzy_match_title(search_term: str, database_titles: List[str], threshold: f
     Fuzzy match a search term against database titles.
     Returns list of (title, score) tuples sorted by score descending.
     Uses multiple matching strategies for maximum leniency.
-    """
-    from difflib import SequenceMatcher
 
+    Titles from a dataset snapshot (PlatformTitles) carry their normalized forms,
+    which are used instead of normalizing every title again, and a FuzzyTitleIndex
+    that narrows the titles scored to those that can match.
+    """
     if not search_term or not database_titles:
         return []
 
-    # Important keywords that must match if present in search term
-    # These distinguish different versions/editions of the same game
-    CRITICAL_KEYWORDS = {
-        'trilogy', 'collection', 'compilation', 'anthology', 'bundle',
-        'remaster', 'remastered', 'remake', 'hd', 'definitive', 'complete',
-        'goty', 'ultimate', 'deluxe', 'premium', 'gold', 'platinum',
-        '2', '3', '4', '5', '6', '7', '8', '9', '10',  # Numbered sequels
-        'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',  # Roman numerals
-        'zero', 'origins', 'revelations', 'corruption', 'echoes', 'hunters',
-        'prime', 'fusion', 'super', 'advance', 'portable', 'pocket',
-    }
-
     # Normalize search term
-    search_norm = normalize_for_search(search_term).lower()
-    search_tokens = set(re.findall(r'[a-z0-9]+', search_norm))
+    search_norm, search_tokens = fuzzy_title_key(search_term)
 
     # Find critical keywords in search term
     search_critical = search_tokens & CRITICAL_KEYWORDS
 
     results = []
-
-    for title in database_titles:
-        # Normalize database title
-        title_norm = normalize_for_search(title).lower()
-        title_tokens = set(re.findall(r'[a-z0-9]+', title_norm))
-
-        # Check for critical keyword mismatch
-        # If search has critical keywords, title should have them too
-        title_critical = title_tokens & CRITICAL_KEYWORDS
-        if search_critical:
-            # If search has "trilogy" but title doesn't, heavily penalize
-            missing_critical = search_critical - title_critical
-            if missing_critical:
-                # Skip this match entirely - critical keywords are missing
-                continue
-
-        # Also penalize if title has critical keywords that search doesn't
-        # e.g., searching "Metroid Prime" should not match "Metroid Prime 3"
-        if title_critical - search_critical:
-            extra_critical = title_critical - search_critical
-            # Only skip if the extra keywords are sequel indicators
-            sequel_indicators = {'2', '3', '4', '5', '6', '7', '8', '9', '10',
-                                'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
-                                'trilogy', 'collection', 'compilation'}
-            if extra_critical & sequel_indicators:
-                continue
-
-        # Strategy 1: Exact match (after normalization)
-        if search_norm == title_norm:
-            results.append((title, 1.0))
-            continue
-
-        # Strategy 2: One contains the other (with word boundary check)
-        # Be STRICT: only give high scores if lengths are very similar
-        # "Pac-Man" should NOT highly match "Jr. Pac-Man" or "Pac-Man Plus"
-        if search_norm in title_norm or title_norm in search_norm:
-            # Check if it's a proper word boundary match, not just substring
-            is_word_boundary_match = False
-            if search_norm in title_norm:
-                idx = title_norm.find(search_norm)
-                end_idx = idx + len(search_norm)
-                before_ok = idx == 0 or title_norm[idx - 1] == ' '
-                after_ok = end_idx == len(title_norm) or title_norm[end_idx] == ' '
-                is_word_boundary_match = before_ok and after_ok
-            elif title_norm in search_norm:
-                idx = search_norm.find(title_norm)
-                end_idx = idx + len(title_norm)
-                before_ok = idx == 0 or search_norm[idx - 1] == ' '
-                after_ok = end_idx == len(search_norm) or search_norm[end_idx] == ' '
-                is_word_boundary_match = before_ok and after_ok
-
-            if is_word_boundary_match:
-                # Score based on length ratio - be strict about length differences
-                len_ratio = min(len(search_norm), len(title_norm)) / max(len(search_norm), len(title_norm))
-                # Only give high score (>= 0.85) if lengths are nearly identical (ratio > 0.95)
-                # This prevents "Pac-Man" from matching "Pac-Man Plus" with high score
-                if len_ratio > 0.95:
-                    results.append((title, 0.90 + (len_ratio * 0.05)))
-                else:
-                    # Significant length difference - lower score proportional to ratio
-                    # This allows the match but won't be considered "exact"
-                    results.append((title, 0.5 + (len_ratio * 0.3)))
-                continue
-
-        # Strategy 3: Token overlap (Jaccard similarity)
-        if search_tokens and title_tokens:
-            intersection = len(search_tokens & title_tokens)
-            union = len(search_tokens | title_tokens)
-            jaccard = intersection / union if union > 0 else 0
-
-            # Only boost if tokens match exactly (same tokens, same count)
-            # Don't boost for "Pac-Man Plus" when searching "Pac-Man"
-            if search_tokens == title_tokens:
-                # Exact token match - high score
-                jaccard = min(1.0, jaccard + 0.3)
-            elif search_tokens <= title_tokens:
-                # All search tokens found, but title has extra tokens
-                # Give modest boost but cap below "exact match" threshold
-                extra_tokens = len(title_tokens - search_tokens)
-                # More extra tokens = lower score
-                boost = max(0, 0.15 - (extra_tokens * 0.05))
-                jaccard = min(0.80, jaccard + boost)  # Cap at 0.80, below 0.85 threshold
-
-            if jaccard >= threshold:
-                results.append((title, jaccard))
-                continue
-
-        # Strategy 4: Sequence matching (handles typos, minor differences)
-        seq_ratio = SequenceMatcher(None, search_norm, title_norm).ratio()
-        if seq_ratio >= threshold:
-            # Penalize cases where one is a prefix of the other
-            shorter, longer = (search_norm, title_norm) if len(search_norm) <= len(title_norm) else (title_norm, search_norm)
-            if longer.startswith(shorter) and len(longer) > len(shorter):
-                extra_part = longer[len(shorter):]
-                if extra_part and extra_part[0] != ' ':
-                    # No word boundary - definitely different game (e.g., "pacmania" vs "pacman")
-                    seq_ratio = max(0, seq_ratio - 0.4)
-                else:
-                    # Has word boundary but still different (e.g., "pac-man plus" vs "pac-man")
-                    # Penalize based on length difference
-                    len_ratio = len(shorter) / len(longer)
-                    if len_ratio < 0.9:
-                        # Significant length difference - cap the score
-                        seq_ratio = min(seq_ratio, 0.75)
-            if seq_ratio >= threshold:
-                results.append((title, seq_ratio))
-                continue
-
-        # Strategy 5: Check if search starts with or title starts with
-        # But only if it's at a word boundary to avoid "pac-man" matching "pac-mania"
-        prefix_match = False
-        if title_norm.startswith(search_norm):
-            # Title starts with search - check word boundary after search
-            if len(title_norm) == len(search_norm):
-                prefix_match = True
-            elif title_norm[len(search_norm)] in ' -:':
-                prefix_match = True
-        elif search_norm.startswith(title_norm):
-            # Search starts with title - check word boundary after title
-            if len(search_norm) == len(title_norm):
-                prefix_match = True
-            elif search_norm[len(title_norm)] in ' -:':
-                prefix_match = True
-
-        if prefix_match:
-            results.append((title, 0.65))
+    norms = getattr(database_titles, "norms", None)
+    token_sets = getattr(database_titles, "token_sets", None)
+
+    if norms is None:
+        for title, (title_norm, title_tokens) in zip(database_titles, fuzzy_title_keys(database_titles)):
+            score = _fuzzy_score(search_norm, search_tokens, search_critical, title_norm, title_tokens, threshold)
+            if score is not None:
+                results.append((title, score))
+    else:
+        derived = getattr(database_titles, "derived", None)
+        if derived is None:
+            index = None
+        elif "fuzzy_index" in derived:
+            index = derived["fuzzy_index"]
+        else:
+            index = derived["fuzzy_index"] = FuzzyTitleIndex.build(norms, token_sets)
+        indices = index.candidates(search_norm, search_tokens, threshold) if index is not None else None
+        for i in (range(len(norms)) if indices is None else indices.tolist()):
+            score = _fuzzy_score(search_norm, search_tokens, search_critical, norms[i], token_sets[i], threshold)
+            if score is not None:
+                results.append((database_titles[i], score))
 
     # Sort by score descending
     results.sort(key=lambda x: x[1], reverse=True)
     return results
 
 
+def match_search_title(search_term: str, titles: List[str], platform_key: str = "", callbacks=None) -> str:
+    """
+    Title to process for an explicit search: the database title if it is a near-exact
+    match (score >= 0.85), otherwise the search term itself so the providers look it up.
+    """
+    if not titles:
+        # No database titles available - use search term directly
+        _emit_log(callbacks, f"[FILTER] Search '{search_term}' on {platform_key}: No database, using search term directly")
+        return search_term
+
+    # Try to find an exact or near-exact match in the database
+    fuzzy_matches = fuzzy_match_title(search_term, titles, threshold=0.7)  # Higher threshold for explicit search
+    if not fuzzy_matches:
+        _emit_log(callbacks, f"[FILTER] Search '{search_term}' on {platform_key}: No database match, using search term directly")
+        return search_term
+
+    # Only use the BEST match, not multiple - user searched for a specific game
+    best_match, best_score = fuzzy_matches[0]
+    # Otherwise use the search term directly to let the API find it
+    if best_score >= 0.85:
+        _emit_log(callbacks, f"[FILTER] Search '{search_term}' on {platform_key}: Found exact match '{best_match}' (score: {best_score:.2f})")
+        return best_match
+    _emit_log(callbacks, f"[FILTER] Search '{search_term}' on {platform_key}: No exact match (best: {best_score:.2f}), using search term directly")
+    return search_term
+
+
 def find_best_database_match(search_term: str, database_titles: List[str], max_results: int = 5) -> List[str]:
     """
     Find the best matching titles from the database for a search term.
@@ -375,6 +776,24 @@ def _emit_preview(callbacks, img_path: Path, title: str = "", platform: str = ""
         except Exception:
             pass
 
+def _emit_current_item(callbacks, title: str, platform: str = ""):
+    """Report the title a worker is starting on."""
+    if callbacks is None:
+        return
+    # Handle dict-style callbacks (from GUI)
+    if isinstance(callbacks, dict):
+        if "current_item" in callbacks and callable(callbacks["current_item"]):
+            try:
+                callbacks["current_item"](title, platform)
+            except Exception:
+                pass
+    # Handle object-style callbacks
+    elif hasattr(callbacks, "current_item"):
+        try:
+            callbacks.current_item.emit(title, platform)
+        except Exception:
+            pass
+
 def _request_user_selection(callbacks, title: str, platform: str, artwork_options: List[Dict[str, Any]]) -> Optional[int]:
     """
     Request user to select artwork from options.
@@ -541,10 +960,316 @@ def pick_best_grid(grids: List[dict], prefer_dim: str, allow_animated: bool, squ
     filtered.sort(key=lambda x: (x.get("score", 0), x.get("upvotes", 0), x.get("id", 0)), reverse=True)
     return filtered[0]
 
-def download_bytes(url: str, timeout_s: int) -> bytes:
-    r = requests.get(url, timeout=timeout_s)
-    r.raise_for_status()
-    return r.content
+# Largest single artwork download accepted (artwork_cache.max_download_mb)
+MAX_DOWNLOAD_BYTES = 64 * 1024 * 1024
+_max_download_bytes = MAX_DOWNLOAD_BYTES
+
+def set_max_download_bytes(max_bytes: int) -> None:
+    global _max_download_bytes
+    _max_download_bytes = max(0, int(max_bytes))
+
+def _stream_download(url: str, f, timeout_s: int, max_bytes: int) -> str:
+    """Stream url into an open binary file in chunks. Returns the SHA-256 of the content."""
+    h = hashlib.sha256()
+    size = 0
+    with requests.get(url, timeout=timeout_s, stream=True) as r:
+        r.raise_for_status()
+        declared = int(r.headers.get("Content-Length") or 0)
+        if max_bytes and declared > max_bytes:
+            raise ValueError(f"Download too large ({declared} bytes > {max_bytes}): {url}")
+        for chunk in r.iter_content(chunk_size=1024 * 1024):
+            size += len(chunk)
+            if max_bytes and size > max_bytes:
+                raise ValueError(f"Download too large (> {max_bytes} bytes): {url}")
+            h.update(chunk)
+            f.write(chunk)
+    return h.hexdigest()
+
+def download_to_file(url: str, dest: Path, timeout_s: int, max_bytes: Optional[int] = None) -> str:
+    """
+    Stream url to dest through a temp file that is renamed into place when complete.
+    Returns the SHA-256 of the content.
+    """
+    tmp = dest.with_name(f"{dest.name}.{os.getpid()}.{threading.get_ident()}.part")
+    try:
+        with open(tmp, "wb") as f:
+            content_hash = _stream_download(url, f, timeout_s, _max_download_bytes if max_bytes is None else max_bytes)
+        os.replace(tmp, dest)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return content_hash
+
+def download_to_cache(url: str, cache_dir: Path, timeout_s: int, prefix: str = "") -> ArtworkData:
+    """Stream url into the artwork cache and return the entry as a cache read would."""
+    cache = get_artwork_cache(cache_dir)
+    part = cache.incoming_path()
+    try:
+        with open(part, "wb") as f:
+            content_hash = _stream_download(url, f, timeout_s, _max_download_bytes)
+        return cache.put_file(_cache_name(url, prefix), part, content_hash)
+    finally:
+        if part.exists():
+            part.unlink()
+
+def open_image(data) -> Image.Image:
+    """Open image data without copying it: mapped cache entries are read in place, bytes via BytesIO."""
+    if hasattr(data, "seek"):
+        data.seek(0)
+        return Image.open(data)
+    return Image.open(BytesIO(data))
+
+
+# Decoded images are kept under this many pixels (draft/reduce), whatever the target size
+MAX_DECODE_PIXELS = 40_000_000
+
+def decode_image(data, min_short_side: Optional[int] = None, max_pixels: int = MAX_DECODE_PIXELS) -> Image.Image:
+    """
+    Open and decode image data at the smallest power-of-two scale that keeps the
+    short side at or above min_short_side and the pixel count within max_pixels.
+
+    JPEGs are scaled during decode with draft() (DCT scaling, 1/2 to 1/8); other
+    formats are decoded and then shrunk with reduce(). With no min_short_side only
+    the pixel budget applies.
+    """
+    img = open_image(data)
+    w, h = img.size
+    factor = 1
+    if min_short_side:
+        while min(w, h) // (factor * 2) >= min_short_side:
+            factor *= 2
+    while max_pixels and (w // factor) * (h // factor) > max_pixels:
+        factor *= 2
+    if factor == 1:
+        return img
+
+    target_w = -(-w // factor)
+    if img.format == "JPEG":
+        # draft() picks the smallest DCT scale (down to 1/8) that is still >= the requested size;
+        # anything left over is reduced after decoding
+        img.draft(img.mode, (target_w, -(-h // factor)))
+        factor = max(1, img.size[0] // target_w)
+        if factor == 1:
+            return img
+    return img.reduce(factor)
+
+
+def _note_source_url(url: Optional[str]) -> None:
+    """Remember the last artwork URL fetched on this thread (recorded in the asset manifest)."""
+    _thread_local.last_source_url = url
+
+def get_last_source_url() -> Optional[str]:
+    return getattr(_thread_local, "last_source_url", None)
+
+def _cache_name(url: str, prefix: str = "") -> str:
+    return f"{prefix}{sha256_text(url)}.bin"
+
+def is_cached(url: str, cache_dir: Path, prefix: str = "") -> bool:
+    return get_artwork_cache(cache_dir).contains(_cache_name(url, prefix))
+
+def read_cached(url: str, cache_dir: Path, prefix: str = "") -> Optional[ArtworkData]:
+    """Return the cached image for url (see ArtworkCache.get), or None if not in the artwork cache."""
+    return get_artwork_cache(cache_dir).get(_cache_name(url, prefix))
+
+def cached_image_info(cache_dir: Path, img_bytes: bytes) -> Optional[Dict[str, Any]]:
+    """Width/height/mime recorded when these bytes entered the artwork cache (None if not cached)."""
+    return get_artwork_cache(cache_dir).info_for_hash(sha256_bytes(img_bytes))
+
+def read_or_download(url: str, cache_dir: Path, timeout_s: int, prefix: str = "") -> ArtworkData:
+    """Return the cached image for url, downloading and caching it on a miss."""
+    img_bytes = read_cached(url, cache_dir, prefix)
+    if img_bytes is None:
+        img_bytes = download_to_cache(url, cache_dir, timeout_s, prefix)
+    _note_source_url(url)
+    return img_bytes
+
+def preview_option(image_data: bytes, source: str, full_url: Optional[str] = None,
+                   width: Optional[int] = None, height: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Artwork picker option built from a provider thumbnail. full_url is the full-size
+    image to download once the option is selected (None when image_data is already it);
+    width/height describe the full-size image when the provider reports them.
+    """
+    opt: Dict[str, Any] = {"image_data": image_data, "source": source, "full_url": full_url}
+    if width and height:
+        opt["width"] = int(width)
+        opt["height"] = int(height)
+    return opt
+
+def download_selected_artwork(option: Dict[str, Any], cache_dir: Path, timeout_s: int) -> ArtworkData:
+    """Full-size image for a picker option: its full_url when it only carries a preview."""
+    if option.get("full_url"):
+        return read_or_download(option["full_url"], cache_dir, timeout_s)
+    return option["image_data"]
+
+def get_source_cache_path(cache_dir: Path, source_hash: str) -> Path:
+    """Path of the stored source image for a manifest source_hash."""
+    return cache_dir / "sources" / f"{source_hash}.bin"
+
+def store_source_bytes(cache_dir: Path, img_bytes: bytes, source_hash: Optional[str] = None) -> str:
+    """
+    Keep a copy of the source image an icon was composed from, keyed by its hash,
+    so icons can be re-rendered offline when borders or output settings change.
+    Returns the source hash.
+    """
+    source_hash = source_hash or sha256_bytes(img_bytes)
+    path = get_source_cache_path(cache_dir, source_hash)
+    if not path.exists():
+        ensure_dir(path.parent)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(img_bytes)
+        os.replace(tmp, path)
+    return source_hash
+
+# Stored sources younger than this are never pruned: another job may have
+# stored one and not yet recorded it in its manifest
+SOURCE_PRUNE_MIN_AGE_S = 3600
+
+def prune_source_cache(cache_dir: Path, keep_hashes: Iterable[str]) -> int:
+    """
+    Delete stored source images whose hash is not in keep_hashes (the source
+    hashes still referenced by the manifest), e.g. the previous source of a
+    re-scraped icon. Returns the number of files deleted.
+    """
+    sources_dir = cache_dir / "sources"
+    if not sources_dir.is_dir():
+        return 0
+    keep = set(keep_hashes)
+    cutoff = time.time() - SOURCE_PRUNE_MIN_AGE_S
+    removed = 0
+    for path in sources_dir.glob("*.bin"):
+        if path.stem in keep:
+            continue
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+# ==========================
+# Artwork option de-duplication
+# ==========================
+# Options whose difference hashes differ in at most this many of their 64 bits are
+# treated as the same artwork (re-uploads, recompressions, small resizes)
+DEDUPE_MAX_DISTANCE = 6
+
+def _dhash_proxy(data) -> Tuple[Any, Tuple[int, int]]:
+    """
+    Decode data to the 9x8 grayscale proxy a difference hash is taken from.
+    Returns (proxy image, original size). Transparent areas are flattened onto white.
+    """
+    img = open_image(data)
+    size = img.size
+    img.draft("RGB", (64, 64))  # JPEG: DCT-scale during decode; no-op for other formats
+    factor = min(img.size) // 64
+    if factor > 1:
+        img = img.reduce(factor)
+    if img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        flat = Image.new("RGBA", img.size, (255, 255, 255, 255))
+        flat.alpha_composite(img)
+        img = flat
+    return img.convert("L").resize((9, 8), Image.BOX), size
+
+def artwork_fingerprints(images: List[Any]) -> List[Optional[Tuple[int, Tuple[int, int]]]]:
+    """
+    64-bit difference hashes for a list of image data, computed together.
+    Returns (hash, (width, height)) per image, or None where the image does not decode.
+    """
+    proxies = []
+    for data in images:
+        try:
+            proxies.append(_dhash_proxy(data))
+        except Exception:
+            proxies.append(None)
+
+    decoded = [p for p in proxies if p is not None]
+    if not decoded:
+        return [None] * len(proxies)
+    if np is not None:
+        stack = np.stack([np.asarray(p[0], dtype=np.int16) for p in decoded])  # (N, 8, 9)
+        bits = stack[:, :, 1:] > stack[:, :, :-1]                               # (N, 8, 8)
+        packed = np.packbits(bits.reshape(len(decoded), 64), axis=1)            # (N, 8) bytes
+        hashes = [int.from_bytes(row.tobytes(), "big") for row in packed]
+    else:
+        hashes = []
+        for proxy, _ in decoded:
+            px = list(proxy.getdata())
+            h = 0
+            for y in range(8):
+                for x in range(8):
+                    h = (h << 1) | (px[y * 9 + x + 1] > px[y * 9 + x])
+            hashes.append(h)
+
+    fingerprints = iter([(h, p[1]) for h, p in zip(hashes, decoded)])
+    return [next(fingerprints) if p is not None else None for p in proxies]
+
+def _hamming_matrix(hashes: List[int]):
+    """Pairwise bit distances between 64-bit hashes (nested lists without NumPy)."""
+    if np is not None:
+        h = np.array(hashes, dtype=np.uint64)
+        x = (h[:, None] ^ h[None, :]).astype(">u8")
+        return np.unpackbits(x.view(np.uint8).reshape(len(hashes), len(hashes), 8), axis=2).sum(axis=2)
+    return [[bin(a ^ b).count("1") for b in hashes] for a in hashes]
+
+def dedupe_artwork_options(options: List[Dict[str, Any]],
+                           max_distance: int = DEDUPE_MAX_DISTANCE) -> List[Dict[str, Any]]:
+    """
+    Collapse near-duplicate artwork options (same picture from several providers or
+    uploads), keeping the highest-resolution one of each group in the position of
+    the group's first option. Options that fail to decode are kept as they are.
+
+    Resolution is the option's width/height (the full-size image for previews),
+    else the decoded image size. The kept option lists the others' sources
+    under 'duplicates'.
+    """
+    if len(options) < 2:
+        return options
+    prints = artwork_fingerprints([opt.get("image_data") for opt in options])
+    hashed = [i for i, fp in enumerate(prints) if fp is not None]
+    if len(hashed) < 2:
+        return options
+    dist = _hamming_matrix([prints[i][0] for i in hashed])
+
+    def area(i: int) -> int:
+        opt = options[i]
+        w, h = (opt.get("width"), opt.get("height")) if opt.get("width") else prints[i][1]
+        return int(w or 0) * int(h or 0)
+
+    # Greedy grouping in option order: each option joins the first group whose
+    # leader is within max_distance
+    leaders: List[int] = []
+    group_of: Dict[int, int] = {}
+    for a, i in enumerate(hashed):
+        for b in leaders:
+            if dist[a][b] <= max_distance:
+                group_of[i] = hashed[b]
+                break
+        else:
+            leaders.append(a)
+            group_of[i] = i
+
+    groups: Dict[int, List[int]] = {}
+    for i in hashed:
+        groups.setdefault(group_of[i], []).append(i)
+
+    result = []
+    for i, opt in enumerate(options):
+        if i not in group_of:
+            result.append(opt)
+        elif group_of[i] == i:
+            members = groups[i]
+            best = max(members, key=lambda m: (area(m), -m))
+            kept = options[best]
+            others = [options[m]["source"] for m in members if m != best]
+            if others:
+                kept = dict(kept, duplicates=others)
+            result.append(kept)
+    return result
 
 
 # ==========================
@@ -858,18 +1583,26 @@ def _parse_libretro_index_filenames(index_html: str) -> List[str]:
             out.append(fname)
     return out
 
+_PNG_SUFFIX_RE = re.compile(r"\.png$")
+_MATCH_BRACKET_RE = re.compile(r"\[[^\]]+\]")
+_MATCH_PAREN_RE = re.compile(r"\(([^)]*)\)")
+_MATCH_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_MATCH_SPACES_RE = re.compile(r"\s+")
+
+# Index filenames are normalized again for every title matched against them
+@lru_cache(maxsize=32768)
 def _norm_for_match(s: str) -> str:
     # Aggressive normalization for matching titles to filenames
     s = (s or "").lower()
-    s = re.sub(r"\.png$", "", s)
+    s = _PNG_SUFFIX_RE.sub("", s)
     # strip bracket tags like [h], [b], [iNES title], etc.
-    s = re.sub(r"\[[^\]]+\]", "", s)
+    s = _MATCH_BRACKET_RE.sub("", s)
     # strip parenthetical chunks that are mostly region/lang/publisher/date noise,
     # but keep it gentle (we’ll still score tokens)
-    s = re.sub(r"\(([^)]*)\)", r" \1 ", s)
+    s = _MATCH_PAREN_RE.sub(r" \1 ", s)
     # punctuation -> spaces
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _MATCH_NON_ALNUM_RE.sub(" ", s)
+    s = _MATCH_SPACES_RE.sub(" ", s).strip()
     return s
 
 def _score_match(title_norm: str, fname_norm: str) -> int:
@@ -936,14 +1669,16 @@ def libretro_try_download_boxart(
     type_dir: str,
     title: str,
     timeout_s: int,
-    cache_dir: Optional[Path] = None,
+    cache_dir: Path,
     use_index_matching: bool = True,
     index_cache_hours: int = 168,
     debug_log=None
-) -> Optional[bytes]:
+) -> Optional[ArtworkData]:
     """
     1) Try direct candidate names (fast)
     2) If that fails and use_index_matching=True, build/load index for platform and fuzzy match
+
+    Downloads go through the artwork cache (a miss for a candidate name is a 404).
     """
     # ---- 1) Direct tries (fast path)
     for cand in libretro_candidate_names(title):
@@ -954,14 +1689,14 @@ def libretro_try_download_boxart(
         ])
         url = f"{base_url.rstrip('/')}/{path}"
         try:
-            r = requests.get(url, timeout=timeout_s)
-            if r.status_code == 200 and r.content:
-                return r.content
+            img_bytes = read_or_download(url, cache_dir, timeout_s)
+            if img_bytes:
+                return img_bytes
         except Exception:
             continue
 
     # ---- 2) Index + fuzzy match
-    if not use_index_matching or cache_dir is None:
+    if not use_index_matching:
         return None
 
     try:
@@ -996,11 +1731,11 @@ def libretro_try_download_boxart(
 
     url = f"{_libretro_index_url(base_url, playlist_name, type_dir)}{requests.utils.quote(best)}"
     try:
-        r = requests.get(url, timeout=timeout_s)
-        if r.status_code == 200 and r.content:
+        img_bytes = read_or_download(url, cache_dir, timeout_s)
+        if img_bytes:
             if debug_log:
                 debug_log(f"[LIBRETRO] Matched '{title}' -> '{best}' (score={best_score})")
-            return r.content
+            return img_bytes
     except Exception as e:
         if debug_log:
             debug_log(f"[LIBRETRO] Download failed for {best}: {e}")
@@ -1016,16 +1751,109 @@ try:
 except ImportError:
     np = None
 
+class ImageContext:
+    """
+    One source image normalized once (EXIF orientation applied, RGBA), with
+    derived data cached so the logo detection, centering and compose stages
+    share it instead of each re-normalizing a full-size copy.
+
+    The pipeline functions below accept either a PIL image or an ImageContext.
+    """
+
+    def __init__(self, img: Image.Image, normalized: bool = False):
+        self.image = img if normalized else ImageOps.exif_transpose(img).convert("RGBA")
+        self.size = self.image.size
+        self._array = None
+        self._proxies: Dict[int, Image.Image] = {}
+        self._scaled_alpha: Dict[int, Any] = {}
+
+    @property
+    def array(self):
+        """H x W x 4 uint8 NumPy array of the image (requires NumPy)."""
+        if self._array is None:
+            self._array = np.asarray(self.image)
+        return self._array
+
+    @property
+    def alpha(self):
+        """H x W alpha channel, a view into array (requires NumPy)."""
+        return self.array[:, :, 3]
+
+    def proxy(self, max_edge: int) -> Image.Image:
+        """Downscaled copy with the long edge at most max_edge (the image itself if already smaller)."""
+        w, h = self.size
+        if max(w, h) <= max_edge:
+            return self.image
+        if max_edge not in self._proxies:
+            scale = max_edge / float(max(w, h))
+            size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+            # Area averaging: cheap, and free of the ringing that adds spurious edges
+            self._proxies[max_edge] = self.image.resize(size, Image.BOX)
+        return self._proxies[max_edge]
+
+    def scaled_alpha(self, short_side: int):
+        """Alpha channel resampled so the short side equals short_side, as ImageOps.fit would (requires NumPy)."""
+        if short_side not in self._scaled_alpha:
+            w, h = self.size
+            scale = short_side / float(min(w, h))
+            size = (max(short_side, int(round(w * scale))), max(short_side, int(round(h * scale))))
+            alpha = self.image.getchannel("A")
+            if alpha.size != size:
+                alpha = alpha.resize(size, Image.LANCZOS)
+            self._scaled_alpha[short_side] = np.asarray(alpha)
+        return self._scaled_alpha[short_side]
+
+    def crop(self, box: Tuple[int, int, int, int]) -> "ImageContext":
+        """Context for a region; an already computed array is shared as a view."""
+        sub = ImageContext(self.image.crop(box), normalized=True)
+        if self._array is not None:
+            x1, y1, x2, y2 = box
+            sub._array = self._array[y1:y2, x1:x2]
+        return sub
+
+
+def _as_context(img) -> ImageContext:
+    return img if isinstance(img, ImageContext) else ImageContext(img)
+
+
 def center_crop_to_square(img: Image.Image, out_size: int, centering: Tuple[float, float] = (0.5, 0.5)) -> Image.Image:
-    img = ImageOps.exif_transpose(img).convert("RGBA")
+    img = _as_context(img).image
     cx, cy = centering
     cx = max(0.0, min(1.0, float(cx)))
     cy = max(0.0, min(1.0, float(cy)))
     return ImageOps.fit(img, (out_size, out_size), method=Image.LANCZOS, centering=(cx, cy))
 
+def _alpha_centroid(a, alpha_threshold: int = 16, margin_pct: float = 0.06) -> Tuple[float, float, int]:
+    """Centroid of an alpha array's pixels above alpha_threshold, ignoring a margin; normalized to [0,1]."""
+    h, w = a.shape
+    if w <= 1 or h <= 1:
+        return (0.5, 0.5, 0)
+
+    mx = int(round(w * margin_pct))
+    my = int(round(h * margin_pct))
+    x1, y1 = mx, my
+    x2, y2 = max(x1 + 1, w - mx), max(y1 + 1, h - my)
+    region = a[y1:y2, x1:x2]
+    rh, rw = region.shape
+
+    mask = region > alpha_threshold
+    cnt = int(mask.sum())
+    if cnt <= 0:
+        return (0.5, 0.5, 0)
+    ys, xs = np.nonzero(mask)
+    cx = float(xs.mean()) / max(1.0, (rw - 1))
+    cy = float(ys.mean()) / max(1.0, (rh - 1))
+    gx = (x1 + cx * (rw - 1)) / (w - 1)
+    gy = (y1 + cy * (rh - 1)) / (h - 1)
+    return (float(gx), float(gy), cnt)
+
 def _content_centroid(img_rgba: Image.Image, alpha_threshold: int = 16, margin_pct: float = 0.06) -> Tuple[float, float, int]:
     """Returns (mx,my,count) centroid of non-transparent pixels, normalized to [0,1] in x/y."""
-    img = ImageOps.exif_transpose(img_rgba).convert("RGBA")
+    ctx = _as_context(img_rgba)
+    if np is not None:
+        return _alpha_centroid(ctx.alpha, alpha_threshold=alpha_threshold, margin_pct=margin_pct)
+
+    img = ctx.image
     w, h = img.size
     if w <= 1 or h <= 1:
         return (0.5, 0.5, 0)
@@ -1037,19 +1865,6 @@ def _content_centroid(img_rgba: Image.Image, alpha_threshold: int = 16, margin_p
     region = img.crop((x1, y1, x2, y2))
     rw, rh = region.size
 
-    if np is not None:
-        a = np.array(region.split()[-1], dtype=np.uint8)
-        mask = a > alpha_threshold
-        cnt = int(mask.sum())
-        if cnt <= 0:
-            return (0.5, 0.5, 0)
-        ys, xs = np.nonzero(mask)
-        cx = float(xs.mean()) / max(1.0, (rw - 1))
-        cy = float(ys.mean()) / max(1.0, (rh - 1))
-        gx = (x1 + cx * (rw - 1)) / (w - 1)
-        gy = (y1 + cy * (rh - 1)) / (h - 1)
-        return (float(gx), float(gy), cnt)
-
     alpha = region.split()[-1]
     pix = alpha.load()
     total = 0
@@ -1069,15 +1884,29 @@ def _content_centroid(img_rgba: Image.Image, alpha_threshold: int = 16, margin_p
     gy = (y1 + cy * (rh - 1)) / (h - 1)
     return (float(gx), float(gy), int(total))
 
+def _fitted_centroid(ctx: ImageContext, out_size: int, centering: Tuple[float, float],
+                     alpha_threshold: int, margin_pct: float) -> Tuple[float, float, int]:
+    """Content centroid of center_crop_to_square(ctx, out_size, centering)."""
+    if np is None:
+        fitted = center_crop_to_square(ctx, out_size, centering=centering)
+        return _content_centroid(fitted, alpha_threshold=alpha_threshold, margin_pct=margin_pct)
+
+    # The fit crop is always out_size square at this scale; only its offset depends on centering
+    a = ctx.scaled_alpha(out_size)
+    h, w = a.shape
+    left = int(round((w - out_size) * max(0.0, min(1.0, centering[0]))))
+    top = int(round((h - out_size) * max(0.0, min(1.0, centering[1]))))
+    return _alpha_centroid(a[top:top + out_size, left:left + out_size], alpha_threshold=alpha_threshold, margin_pct=margin_pct)
+
 def _best_centering_for_img(img_rgba: Image.Image, out_size: int, steps: int = 5, span: float = 0.22,
                             alpha_threshold: int = 16, margin_pct: float = 0.06) -> Tuple[Tuple[float, float], Tuple[float, float, int]]:
     """Search a small grid of ImageOps.fit centering points and pick the one that best centers content."""
+    ctx = _as_context(img_rgba)
     steps = max(1, int(steps))
     span = max(0.0, min(0.49, float(span)))
     if steps == 1:
         best = (0.5, 0.5)
-        fitted = center_crop_to_square(img_rgba, out_size, centering=best)
-        mx, my, cnt = _content_centroid(fitted, alpha_threshold=alpha_threshold, margin_pct=margin_pct)
+        mx, my, cnt = _fitted_centroid(ctx, out_size, best, alpha_threshold, margin_pct)
         return best, (mx, my, cnt)
 
     offsets = [(-span + (2 * span) * i / (steps - 1)) for i in range(steps)]
@@ -1088,8 +1917,7 @@ def _best_centering_for_img(img_rgba: Image.Image, out_size: int, steps: int = 5
     for oy in offsets:
         for ox in offsets:
             c = (0.5 + ox, 0.5 + oy)
-            fitted = center_crop_to_square(img_rgba, out_size, centering=c)
-            mx, my, cnt = _content_centroid(fitted, alpha_threshold=alpha_threshold, margin_pct=margin_pct)
+            mx, my, cnt = _fitted_centroid(ctx, out_size, c, alpha_threshold, margin_pct)
             score = (mx - 0.5) ** 2 + (my - 0.5) ** 2
             if cnt <= 0:
                 score += 10.0
@@ -1110,11 +1938,11 @@ def _detect_content_bbox(img_rgba: Image.Image, alpha_threshold: int = 16, edge_
     Detect tight bounding box around non-transparent content.
     Returns (x1, y1, x2, y2) in pixel coordinates.
     """
-    img = ImageOps.exif_transpose(img_rgba).convert("RGBA")
-    w, h = img.size
+    ctx = _as_context(img_rgba)
+    w, h = ctx.size
 
     if np is not None:
-        alpha = np.array(img.split()[-1], dtype=np.uint8)
+        alpha = ctx.alpha
         mask = alpha > alpha_threshold
 
         if not mask.any():
@@ -1137,7 +1965,7 @@ def _detect_content_bbox(img_rgba: Image.Image, alpha_threshold: int = 16, edge_
         return (x1, y1, x2, y2)
 
     # Fallback without NumPy
-    alpha = img.split()[-1]
+    alpha = ctx.image.split()[-1]
     pix = alpha.load()
 
     min_x, min_y = w, h
@@ -1164,34 +1992,36 @@ def _detect_content_bbox(img_rgba: Image.Image, alpha_threshold: int = 16, edge_
     return (x1, y1, x2, y2)
 
 
-def _detect_logo_region_cv2(img_rgba: Image.Image, debug: bool = False) -> Optional[Tuple[int, int, int, int]]:
-    """
-    Advanced logo detection using OpenCV (if available).
-    Uses edge detection + morphology to find the main logo region.
-    Returns (x1, y1, x2, y2) or None if OpenCV unavailable.
-    """
-    try:
-        import cv2
-    except ImportError:
-        return None
+# Default long edge of the proxy logo detection runs on (logo_detection.proxy_max_edge)
+LOGO_DETECT_MAX_EDGE = 512
 
-    img = ImageOps.exif_transpose(img_rgba).convert("RGBA")
-    w, h = img.size
+# Full-resolution detection constants: edges are joined by a 5x5 dilation run
+# twice (4 px reach) and the box is padded by 10 px
+_LOGO_KERNEL = 5
+_LOGO_DILATE_ITERATIONS = 2
+_LOGO_PADDING = 10
+# Regions found on the proxy that are measured at full resolution
+_LOGO_PROXY_CANDIDATES = 8
 
-    # Convert to NumPy
-    img_array = np.array(img, dtype=np.uint8)
+def _have_cv2() -> bool:
+    try:
+        import cv2  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
-    # Extract alpha channel
-    alpha = img_array[:, :, 3]
 
+def _logo_contours(cv2, img_array, kernel_size: int = _LOGO_KERNEL,
+                   iterations: int = _LOGO_DILATE_ITERATIONS) -> list:
+    """External contours of the joined edge regions in an RGBA array, largest first."""
     # Create mask of non-transparent regions
-    mask = (alpha > 16).astype(np.uint8) * 255
+    mask = (img_array[:, :, 3] > 16).astype(np.uint8) * 255
 
     if mask.sum() == 0:
-        return None
+        return []
 
     # Convert RGB to grayscale for edge detection
-    gray = cv2.cvtColor(img_array[:, :, :3], cv2.COLOR_RGB2GRAY)
+    gray = cv2.cvtColor(np.ascontiguousarray(img_array[:, :, :3]), cv2.COLOR_RGB2GRAY)
 
     # Apply bilateral filter to reduce noise while keeping edges
     filtered = cv2.bilateralFilter(gray, 9, 75, 75)
@@ -1203,72 +2033,145 @@ def _detect_logo_region_cv2(img_rgba: Image.Image, debug: bool = False) -> Optio
     edges = cv2.bitwise_and(edges, edges, mask=mask)
 
     # Morphological operations to connect nearby edges
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-    dilated = cv2.dilate(edges, kernel, iterations=2)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
+    dilated = cv2.dilate(edges, kernel, iterations=iterations)
     closed = cv2.morphologyEx(dilated, cv2.MORPH_CLOSE, kernel, iterations=1)
 
     # Find contours
     contours, _ = cv2.findContours(closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    return sorted(contours, key=cv2.contourArea, reverse=True)
 
-    if not contours:
+
+def _detect_logo_region_cv2(img_rgba: Image.Image, debug: bool = False,
+                            max_edge: int = 0) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Advanced logo detection using OpenCV (if available).
+    Uses edge detection + morphology to find the main logo region.
+
+    With max_edge set, candidate regions are located on a downscaled proxy
+    (long edge <= max_edge) with the kernel scaled to match, then each is
+    measured at full resolution inside its own search area and the largest
+    wins, as it would on the whole image. If a region runs past its search
+    area, detection falls back to the whole image.
+    Returns (x1, y1, x2, y2) or None if OpenCV unavailable.
+    """
+    try:
+        import cv2
+    except ImportError:
         return None
 
-    # Find the largest contour by area
-    largest_contour = max(contours, key=cv2.contourArea)
+    ctx = _as_context(img_rgba)
+    w, h = ctx.size
 
-    # Get bounding rectangle
-    x, y, bw, bh = cv2.boundingRect(largest_contour)
+    def largest(img_array, ox: int = 0, oy: int = 0):
+        contours = _logo_contours(cv2, img_array)
+        if not contours:
+            return None
+        x, y, bw, bh = cv2.boundingRect(contours[0])
+        return cv2.contourArea(contours[0]), (ox + x, oy + y, ox + x + bw, oy + y + bh)
+
+    def padded(box):
+        x1, y1, x2, y2 = box
+        return (max(0, x1 - _LOGO_PADDING), max(0, y1 - _LOGO_PADDING),
+                min(w, x2 + _LOGO_PADDING), min(h, y2 + _LOGO_PADDING))
+
+    proxy = ctx.proxy(max_edge) if max_edge else ctx.image
+    if proxy is ctx.image:
+        found = largest(ctx.array)
+        return padded(found[1]) if found else None
+
+    # Locate candidate regions on the proxy, with the dilation reach scaled down
+    scale = proxy.size[0] / float(w)
+    kernel_size = max(3, int(round(_LOGO_KERNEL * scale)) | 1)
+    contours = _logo_contours(cv2, np.asarray(proxy), kernel_size, iterations=1)
+    if not contours:
+        return None
 
-    # Add padding
-    padding = 10
-    x1 = max(0, x - padding)
-    y1 = max(0, y - padding)
-    x2 = min(w, x + bw + padding)
-    y2 = min(h, y + bh + padding)
+    # Region sizes on the proxy are rough (thin outlines in particular), so the
+    # largest candidates are each measured at full resolution inside a search
+    # area with a margin for the proxy's pixel size and the dilation reach.
+    # Every region found there that is not cut off by the search area counts.
+    margin = int(math.ceil(2.0 / scale)) + _LOGO_KERNEL * _LOGO_DILATE_ITERATIONS
+    searched = []
+    best = None
+    for contour in contours[:_LOGO_PROXY_CANDIDATES]:
+        x, y, bw, bh = cv2.boundingRect(contour)
+        rx1 = max(0, int(math.floor(x / scale)) - margin)
+        ry1 = max(0, int(math.floor(y / scale)) - margin)
+        rx2 = min(w, int(math.ceil((x + bw) / scale)) + margin)
+        ry2 = min(h, int(math.ceil((y + bh) / scale)) + margin)
+        if any(sx1 <= rx1 and sy1 <= ry1 and rx2 <= sx2 and ry2 <= sy2 for sx1, sy1, sx2, sy2 in searched):
+            continue
+        searched.append((rx1, ry1, rx2, ry2))
+        for i, found in enumerate(_logo_contours(cv2, ctx.array[ry1:ry2, rx1:rx2])):
+            fx, fy, fw, fh = cv2.boundingRect(found)
+            if (fx == 0 < rx1) or (fy == 0 < ry1) or (rx1 + fx + fw == rx2 < w) or (ry1 + fy + fh == ry2 < h):
+                if i == 0:
+                    # The largest region here runs past the search area
+                    best = None
+                    break
+                continue
+            area = cv2.contourArea(found)
+            if best is None or area > best[0]:
+                best = (area, (rx1 + fx, ry1 + fy, rx1 + fx + fw, ry1 + fy + fh))
+        else:
+            continue
+        break
 
-    return (x1, y1, x2, y2)
+    if best is None:
+        best = largest(ctx.array)
+    return padded(best[1]) if best else None
 
 
 def detect_and_crop_logo(img_rgba: Image.Image,
                          method: str = "auto",
                          min_content_ratio: float = 0.15,
                          max_crop_ratio: float = 0.85,
-                         debug_log=None) -> Image.Image:
+                         debug_log=None,
+                         proxy_max_edge: int = LOGO_DETECT_MAX_EDGE) -> Image.Image:
     """
     Detect the main logo/artwork region and crop to it intelligently.
 
     Args:
-        img_rgba: Input RGBA image
+        img_rgba: Input RGBA image, or an ImageContext
         method: "auto", "bbox", "cv2", or "none"
         min_content_ratio: Minimum ratio of content to keep (prevents over-cropping)
         max_crop_ratio: Maximum crop ratio (prevents tiny crops)
         debug_log: Optional logging function
+        proxy_max_edge: Locate the logo for OpenCV detection on a proxy with
+            this long edge; the box is still measured at full resolution
+            (0 = search the whole image at full resolution)
 
     Returns:
-        Cropped image (or original if detection fails)
+        Cropped image (or original if detection fails); an ImageContext when
+        given one
     """
-    img = ImageOps.exif_transpose(img_rgba).convert("RGBA")
-    orig_w, orig_h = img.size
+    ctx = _as_context(img_rgba)
+    as_image = not isinstance(img_rgba, ImageContext)
+    orig_w, orig_h = ctx.size
+
+    def result(c: ImageContext):
+        return c.image if as_image else c
 
     if method == "none":
-        return img
+        return result(ctx)
 
     bbox = None
 
     # Try CV2 method first if available and requested
     if method in ("auto", "cv2"):
-        bbox = _detect_logo_region_cv2(img, debug=False)
+        bbox = _detect_logo_region_cv2(ctx, debug=False, max_edge=proxy_max_edge)
         if bbox and debug_log:
             debug_log(f"[LOGO] CV2 detection: {bbox}")
 
-    # Fallback to simple bbox if CV2 failed or not requested
-    if bbox is None and method in ("auto", "bbox"):
-        bbox = _detect_content_bbox(img, alpha_threshold=16, edge_padding=10)
+    # Fallback to simple bbox if CV2 failed or not requested (or cv2 is not installed)
+    if bbox is None and (method in ("auto", "bbox") or (method == "cv2" and not _have_cv2())):
+        bbox = _detect_content_bbox(ctx, alpha_threshold=16, edge_padding=10)
         if debug_log:
             debug_log(f"[LOGO] BBox detection: {bbox}")
 
     if bbox is None:
-        return img
+        return result(ctx)
 
     x1, y1, x2, y2 = bbox
     crop_w = x2 - x1
@@ -1276,28 +2179,28 @@ def detect_and_crop_logo(img_rgba: Image.Image,
 
     # Safety checks
     if crop_w <= 0 or crop_h <= 0:
-        return img
+        return result(ctx)
 
     # Check if crop is too small
     content_ratio = (crop_w * crop_h) / (orig_w * orig_h)
     if content_ratio < min_content_ratio:
         if debug_log:
             debug_log(f"[LOGO] Crop too small ({content_ratio:.2%}), using original")
-        return img
+        return result(ctx)
 
     # Check if crop is too similar to original (no point cropping)
     if crop_w > orig_w * max_crop_ratio and crop_h > orig_h * max_crop_ratio:
         if debug_log:
             debug_log(f"[LOGO] Crop too similar to original, using original")
-        return img
+        return result(ctx)
 
     # Perform crop
-    cropped = img.crop((x1, y1, x2, y2))
+    cropped = ctx.crop((x1, y1, x2, y2))
 
     if debug_log:
         debug_log(f"[LOGO] Cropped from {orig_w}x{orig_h} to {crop_w}x{crop_h} ({content_ratio:.2%})")
 
-    return cropped
+    return result(cropped)
 
 
 def fill_center_hole(alpha: Image.Image) -> Image.Image:
@@ -1329,42 +2232,708 @@ def corner_mask_from_border(border_rgba: Image.Image, threshold: int = 18, shrin
         hard = hard.filter(ImageFilter.GaussianBlur(radius=feather))
     return hard
 
-def compose_with_border(base_img: Image.Image, border_path: Path, out_size: int, centering: Tuple[float, float] = (0.5, 0.5)) -> Image.Image:
-    base = center_crop_to_square(base_img, out_size, centering=centering)
+class BorderOverlay:
+    """
+    A border resized to the icon size together with its corner mask.
 
-    border = Image.open(border_path)
-    border = ImageOps.exif_transpose(border).convert("RGBA")
-    if border.size != (out_size, out_size):
-        border = border.resize((out_size, out_size), Image.LANCZOS)
+    Building the mask (flood fill + filters) costs far more than compositing an
+    icon, so overlays are built once per border and size (load_border_overlay)
+    and shared by every icon of a platform.
+    """
 
-    mask = corner_mask_from_border(border, threshold=18, shrink_px=8, feather=0.8)
-    base.putalpha(ImageChops.multiply(base.split()[-1], mask))
-    return Image.alpha_composite(base, border)
+    def __init__(self, border: Image.Image, out_size: int):
+        border = ImageOps.exif_transpose(border).convert("RGBA")
+        if border.size != (out_size, out_size):
+            border = border.resize((out_size, out_size), Image.LANCZOS)
+        self.border = border
+        self.mask = corner_mask_from_border(border, threshold=18, shrink_px=8, feather=0.8)
+        self._pixels = None
+        self._pixels_lock = threading.Lock()
 
+    def pixel_sets(self) -> Dict[str, Any]:
+        """
+        Flattened border/mask arrays and the pixel indices compositing has to
+        touch: where the mask cuts the base alpha, where the border is opaque
+        and where it is partially transparent (requires NumPy).
+        """
+        with self._pixels_lock:
+            if self._pixels is None:
+                border = np.asarray(self.border).reshape(-1, 4)
+                mask = np.asarray(self.mask).reshape(-1)
+                border_alpha = border[:, 3]
+                masked = np.flatnonzero((mask < 255) & (border_alpha < 255))
+                partial = np.flatnonzero((border_alpha > 0) & (border_alpha < 255))
+                self._pixels = {
+                    "border": border,
+                    "masked": masked,
+                    "mask": mask[masked].astype(np.uint32),
+                    "opaque": np.flatnonzero(border_alpha == 255),
+                    "partial": partial,
+                    "partial_border": border[partial].astype(np.uint32),
+                }
+            return self._pixels
+
+
+_border_overlays: Dict[Tuple[str, int, int, int], BorderOverlay] = {}
+_border_overlays_lock = threading.Lock()
+_BORDER_OVERLAY_CACHE_SIZE = 16
+
+def load_border_overlay(border_path: Path, out_size: int) -> BorderOverlay:
+    """Prepared overlay for a border file at out_size, cached per process (rebuilt when the file changes)."""
+    st = os.stat(border_path)
+    key = (str(Path(border_path).resolve()), st.st_mtime_ns, st.st_size, int(out_size))
+    with _border_overlays_lock:
+        overlay = _border_overlays.get(key)
+    if overlay is not None:
+        return overlay
+    with Image.open(border_path) as border:
+        overlay = BorderOverlay(border, out_size)
+    with _border_overlays_lock:
+        while len(_border_overlays) >= _BORDER_OVERLAY_CACHE_SIZE:
+            _border_overlays.pop(next(iter(_border_overlays)))
+        return _border_overlays.setdefault(key, overlay)
+
+def composite_batch(bases: List[Image.Image], overlay: BorderOverlay) -> List[Image.Image]:
+    """
+    Cut the corners of N fitted base images (out_size square, RGBA) and draw the
+    border over them in one vectorized pass.
 
-# ==========================
-# Dataset import (EveryVideoGameEver)
-# ==========================
-def download_and_extract_zip(zip_url: str, cache_dir: Path, log_cb=None) -> Path:
-    ensure_dir(cache_dir)
-    zip_key = sha256_text(zip_url)
-    zip_path = cache_dir / f"{zip_key}.zip"
-    extract_root = cache_dir / f"{zip_key}_extracted"
+    The bases are stacked into an (N, H*W, 4) array and only the pixels the
+    mask or border actually change are computed; the result matches
+    ImageChops.multiply + Image.alpha_composite to within one level. Without
+    NumPy each image is composed with Pillow.
+    """
+    if not bases:
+        return []
+    if np is None:
+        out = []
+        for base in bases:
+            base = base.convert("RGBA")
+            base.putalpha(ImageChops.multiply(base.getchannel("A"), overlay.mask))
+            out.append(Image.alpha_composite(base, overlay.border))
+        return out
+
+    px = overlay.pixel_sets()
+    w, h = overlay.border.size
+    stack = np.stack([np.asarray(b.convert("RGBA")) for b in bases]).reshape(len(bases), -1, 4)
+
+    # Corner mask: alpha * mask / 255, rounded as ImageChops.multiply does
+    t = stack[:, px["masked"], 3].astype(np.uint32) * px["mask"] + 128
+    stack[:, px["masked"], 3] = (((t >> 8) + t) >> 8).astype(np.uint8)
+
+    # Opaque border pixels replace the base
+    stack[:, px["opaque"]] = px["border"][px["opaque"]]
+
+    # Partially transparent border pixels: border over base
+    src = px["partial_border"]
+    dst = stack[:, px["partial"]].astype(np.uint32)
+    src_a = src[:, 3]
+    dst_a = dst[..., 3] * (255 - src_a)
+    out_a = src_a * 255 + dst_a
+    rgb = src[:, :3] * (src_a * 255)[:, None] + dst[..., :3] * dst_a[..., None]
+    rgb = (rgb + out_a[..., None] // 2) // np.maximum(out_a, 1)[..., None]
+    stack[:, px["partial"], :3] = rgb.astype(np.uint8)
+    stack[:, px["partial"], 3] = ((out_a + 127) // 255).astype(np.uint8)
+
+    return [Image.fromarray(icon.reshape(h, w, 4), "RGBA") for icon in stack]
 
-    if extract_root.exists():
-        return extract_root
+def compose_with_border(base_img: Image.Image, border_path: Path, out_size: int, centering: Tuple[float, float] = (0.5, 0.5)) -> Image.Image:
+    base = center_crop_to_square(base_img, out_size, centering=centering)
+    return composite_batch([base], load_border_overlay(border_path, out_size))[0]
 
-    if not zip_path.exists():
-        _emit_log(log_cb, f"[DATASET] Downloading zip: {zip_url}")
-        data = download_bytes(zip_url, timeout_s=180)
-        zip_path.write_bytes(data)
+def load_render_settings(cfg: dict) -> Dict[str, Any]:
+    """Read the auto-centering and logo detection settings used by render_icon."""
+    ac = cfg.get("auto_centering", {}) or {}
+    ld = cfg.get("logo_detection", {}) or {}
+    return {
+        "ac_enabled": bool(ac.get("enabled", True)),
+        "ac_sources": set(ac.get("sources", ["libretro_boxart"])),
+        "ac_tolerance": float(ac.get("tolerance", 0.06)),
+        "ac_steps": int(ac.get("search_steps", 5)),
+        "ac_span": float(ac.get("search_span", 0.22)),
+        "ac_alpha_threshold": int(ac.get("alpha_threshold", 16)),
+        "ac_margin_pct": float(ac.get("margin_pct", 0.06)),
+        "ld_enabled": bool(ld.get("enabled", False)),
+        "ld_method": str(ld.get("method", "auto")),
+        "ld_sources": set(ld.get("sources", ["libretro_boxart", "steamgriddb_square"])),
+        "ld_min_content": float(ld.get("min_content_ratio", 0.15)),
+        "ld_max_crop": float(ld.get("max_crop_ratio", 0.85)),
+        "ld_proxy_max_edge": int(ld.get("proxy_max_edge", LOGO_DETECT_MAX_EDGE) or 0),
+    }
+
+def render_icon(
+    img_bytes: bytes,
+    source_tag: Optional[str],
+    border_path: Path,
+    out_size: int,
+    render_settings: Dict[str, Any],
+    debug_log=None
+) -> Tuple[Image.Image, Tuple[float, float], Optional[Tuple[float, float, int]]]:
+    """
+    Compose an icon from source image bytes: logo crop, auto-centering, border.
+
+    Returns:
+        (icon image, centering used, content centroid (mx, my, count) or None
+        when auto-centering did not run)
+    """
+    base, centering, centroid = render_icon_base(img_bytes, source_tag, out_size, render_settings, debug_log=debug_log)
+    return composite_batch([base], load_border_overlay(border_path, out_size))[0], centering, centroid
+
+def render_icon_base(
+    img_bytes: bytes,
+    source_tag: Optional[str],
+    out_size: int,
+    render_settings: Dict[str, Any],
+    debug_log=None
+) -> Tuple[Image.Image, Tuple[float, float], Optional[Tuple[float, float, int]]]:
+    """
+    The fitted out_size square an icon is composed from (logo crop and
+    auto-centering applied, no border yet), with centering and centroid as
+    returned by render_icon.
+    """
+    rs = render_settings
+    # Decode only as large as the square crop needs. A logo crop keeps at least
+    # ld_min_content of each side, so leave room for it when detection applies.
+    min_short_side = out_size
+    if rs["ld_enabled"] and source_tag in rs["ld_sources"]:
+        min_short_side = int(math.ceil(out_size / max(0.01, rs["ld_min_content"])))
+    # Normalized once; logo detection, centering and compose share its arrays
+    src_img = ImageContext(decode_image(img_bytes, min_short_side=min_short_side))
+
+    # Logo detection and cropping if enabled and source matches
+    if rs["ld_enabled"] and source_tag in rs["ld_sources"]:
+        src_img = detect_and_crop_logo(
+            src_img,
+            method=rs["ld_method"],
+            min_content_ratio=rs["ld_min_content"],
+            max_crop_ratio=rs["ld_max_crop"],
+            debug_log=debug_log,
+            proxy_max_edge=rs.get("ld_proxy_max_edge", 0)
+        )
+
+    # Auto-centering if enabled and source is in configured sources
+    centering = (0.5, 0.5)
+    centroid = None
+    if rs["ac_enabled"] and source_tag in rs["ac_sources"]:
+        centering, centroid = _best_centering_for_img(
+            src_img, out_size,
+            steps=rs["ac_steps"], span=rs["ac_span"],
+            alpha_threshold=rs["ac_alpha_threshold"], margin_pct=rs["ac_margin_pct"]
+        )
+
+    return center_crop_to_square(src_img, out_size, centering=centering), centering, centroid
+
+# Bump when compositing changes so stale renders are not reused
+RENDER_CACHE_VERSION = 5
+# Default render cache budget (render_cache.max_size_mb); evicted down to 90% of it
+RENDER_CACHE_MAX_MB = 512
+
+def render_cache_key(
+    source_hash: str,
+    border_hash: str,
+    source_tag: Optional[str],
+    out_size: int,
+    export_format: str,
+    quality: int,
+    render_settings: Dict[str, Any],
+    export_preset: Optional[str] = None
+) -> str:
+    """
+    Hash of every input that affects an encoded icon.
+
+    Centering is derived from the source and the auto-centering parameters, so
+    those parameters are keyed instead of the computed value. Logo crop and
+    centering parameters only count when they apply to this source.
+    """
+    rs = render_settings
+    parts: Dict[str, Any] = {
+        "v": RENDER_CACHE_VERSION,
+        "source": source_hash,
+        "border": border_hash,
+        "size": int(out_size),
+        "format": export_format.upper(),
+        "quality": int(quality),
+        "preset": str(export_preset or DEFAULT_EXPORT_PRESET).lower(),
+    }
+    if rs["ld_enabled"] and source_tag in rs["ld_sources"]:
+        parts["logo_crop"] = [rs["ld_method"], rs["ld_min_content"], rs["ld_max_crop"]]
+        if rs.get("ld_proxy_max_edge"):
+            parts["logo_crop"].append(rs["ld_proxy_max_edge"])
+    if rs["ac_enabled"] and source_tag in rs["ac_sources"]:
+        parts["centering"] = [rs["ac_steps"], rs["ac_span"], rs["ac_alpha_threshold"], rs["ac_margin_pct"]]
+    return sha256_text(json.dumps(parts, sort_keys=True))
+
+def _render_cache_paths(cache_dir: Path, key: str, export_format: str) -> Tuple[Path, Path]:
+    base = cache_dir / "renders"
+    return base / f"{key}.{get_export_extension(export_format)}", base / f"{key}.json"
+
+def lookup_render_cache(
+    cache_dir: Path, key: str, export_format: str
+) -> Optional[Tuple[Path, Tuple[float, float], Optional[Tuple[float, float, int]]]]:
+    """Return (encoded icon path, centering, centroid) for a cached render, or None."""
+    img_path, meta_path = _render_cache_paths(cache_dir, key, export_format)
+    if not img_path.exists() or not meta_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        centering = (float(meta["centering"][0]), float(meta["centering"][1]))
+        centroid = tuple(meta["centroid"]) if meta.get("centroid") else None
+    except Exception:
+        return None
+    # The metadata file's mtime is the entry's last use; the image may be hard-linked into the output
+    try:
+        os.utime(meta_path, None)
+    except OSError:
+        pass
+    return img_path, centering, centroid
+
+def store_render_cache(
+    cache_dir: Path,
+    key: str,
+    export_format: str,
+    out_path: Path,
+    centering: Tuple[float, float],
+    centroid: Optional[Tuple[float, float, int]]
+) -> bool:
+    """Add an encoded icon to the render cache. Failures are not fatal."""
+    img_path, meta_path = _render_cache_paths(cache_dir, key, export_format)
+    try:
+        ensure_dir(img_path.parent)
+        meta_path.write_text(
+            json.dumps({"centering": list(centering), "centroid": list(centroid) if centroid else None}),
+            encoding="utf-8"
+        )
+        # Image last: lookups need both files
+        link_or_copy(out_path, img_path)
+        return True
+    except OSError:
+        return False
+
+def render_cache_max_bytes(cfg: dict) -> int:
+    """Render cache budget in bytes from config (0 = unlimited)."""
+    rc = cfg.get("render_cache", {}) or {}
+    return int(float(rc.get("max_size_mb", RENDER_CACHE_MAX_MB)) * 1024 * 1024)
+
+def prune_render_cache(cache_dir: Path, max_bytes: int) -> int:
+    """
+    Remove least recently used renders until the cache fits max_bytes. Returns bytes freed.
+
+    Only files whose sole copy is the cache count: an encode still hard-linked
+    as an output icon takes no extra space, and once that icon is replaced or
+    deleted the cached file starts counting.
+    """
+    base = cache_dir / "renders"
+    if not max_bytes or not base.is_dir():
+        return 0
+    # key -> [last use, bytes, files, image still linked into the output]
+    entries: Dict[str, List[Any]] = {}
+    for path in base.iterdir():
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entry = entries.setdefault(path.stem, [0.0, 0, [], False])
+        if path.suffix == ".json":
+            entry[0] = st.st_mtime
+        elif st.st_nlink > 1:
+            entry[3] = True
+        entry[1] += st.st_size
+        entry[2].append(path)
+    for entry in entries.values():
+        if entry[3]:
+            entry[1] = 0
+    total = sum(e[1] for e in entries.values())
+    if total <= max_bytes:
+        return 0
+
+    target = int(max_bytes * 0.9)
+    freed = 0
+    for _, size, files, _ in sorted(entries.values(), key=lambda e: e[0]):
+        if total <= target:
+            break
+        if not size:
+            continue
+        # Image before metadata, so a lookup never finds metadata for a missing image
+        for path in sorted(files, key=lambda f: f.suffix == ".json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        total -= size
+        freed += size
+    return freed
+
+def render_icon_cached(
+    img_bytes: bytes,
+    source_hash: str,
+    source_tag: Optional[str],
+    border_path: Path,
+    border_hash: Optional[str],
+    out_size: int,
+    export_format: str,
+    quality: int,
+    render_settings: Dict[str, Any],
+    cache_dir: Path,
+    out_path: Path,
+    debug_log=None,
+    export_preset: Optional[str] = None
+) -> Tuple[Optional[Image.Image], Tuple[float, float], Optional[Tuple[float, float, int]], bool]:
+    """
+    Write the icon for out_path, reusing a previous encode when all inputs match.
+
+    Returns:
+        (icon image or None on a cache hit, centering, centroid, cache hit)
+    """
+    result = render_icons_cached_batch(
+        [{"img_bytes": img_bytes, "source_hash": source_hash, "source_tag": source_tag, "out_path": out_path}],
+        border_path, border_hash, out_size, export_format, quality, render_settings, cache_dir,
+        debug_log=debug_log, export_preset=export_preset
+    )[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+def render_icons_cached_batch(
+    items: List[Dict[str, Any]],
+    border_path: Path,
+    border_hash: Optional[str],
+    out_size: int,
+    export_format: str,
+    quality: int,
+    render_settings: Dict[str, Any],
+    cache_dir: Path,
+    debug_log=None,
+    export_preset: Optional[str] = None
+) -> List[Any]:
+    """
+    render_icon_cached for several icons that share a border. Cache misses are
+    fitted one by one and then composited together with composite_batch.
+
+    Each item is a dict with img_bytes, source_hash, source_tag and out_path.
+    Returns, per item, the render_icon_cached tuple or the exception it raised.
+    """
+    results: List[Any] = [None] * len(items)
+    pending = []
+    for i, item in enumerate(items):
+        try:
+            key = None
+            if border_hash:
+                key = render_cache_key(item["source_hash"], border_hash, item["source_tag"], out_size, export_format,
+                                       quality, render_settings, export_preset=export_preset)
+                cached = lookup_render_cache(cache_dir, key, export_format)
+                if cached:
+                    cached_path, centering, centroid = cached
+                    link_or_copy(cached_path, item["out_path"])
+                    results[i] = (None, centering, centroid, True)
+                    continue
+            base, centering, centroid = render_icon_base(
+                item["img_bytes"], item["source_tag"], out_size, render_settings, debug_log=debug_log
+            )
+            pending.append((i, key, base, centering, centroid))
+        except Exception as e:
+            results[i] = e
+
+    if pending:
+        try:
+            icons = composite_batch([base for _, _, base, _, _ in pending], load_border_overlay(border_path, out_size))
+        except Exception as e:
+            for i, _, _, _, _ in pending:
+                results[i] = e
+            return results
+        for (i, key, _, centering, centroid), icon in zip(pending, icons):
+            out_path = items[i]["out_path"]
+            try:
+                save_image_for_export(icon, out_path, export_format, quality, preset=export_preset or DEFAULT_EXPORT_PRESET)
+                if key:
+                    store_render_cache(cache_dir, key, export_format, out_path, centering, centroid)
+                results[i] = (icon, centering, centroid, False)
+            except Exception as e:
+                results[i] = e
+    return results
+
+
+# ==========================
+# Dataset import (EveryVideoGameEver)
+# ==========================
+# How often the dataset zip is re-checked (dataset.refresh_hours; 0 = never after the first download)
+DATASET_REFRESH_HOURS = 24
+# Connection attempts per dataset download; each one resumes where the last stopped
+DATASET_DOWNLOAD_ATTEMPTS = 5
+_dataset_download_lock = threading.Lock()
+
+# Wikipedia fallback lists for platforms missing from the dataset
+WIKIPEDIA_API_URL = 'https://en.wikipedia.org/w/api.php'
+WIKIPEDIA_HEADERS = {
+    'User-Agent': 'IconGenerator/1.0 (Educational project for game icon generation)'
+}
+# Hours a parsed list is used before its page revision is checked (dataset.wikipedia_cache_hours)
+WIKIPEDIA_CACHE_HOURS = 168
+
+def _read_dataset_state(state_path: Path) -> Dict[str, Any]:
+    try:
+        obj = json.loads(state_path.read_text(encoding="utf-8"))
+        return obj if isinstance(obj, dict) else {}
+    except Exception:
+        return {}
+
+def _write_dataset_state(state_path: Path, state: Dict[str, Any]) -> None:
+    tmp = state_path.with_name(state_path.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    os.replace(tmp, state_path)
+
+def _stream_dataset_zip(zip_url: str, part: Path, state: Dict[str, Any], state_path: Path,
+                        conditional: bool, timeout_s: int, log_cb=None) -> bool:
+    """
+    Download zip_url into part, resuming an earlier partial download with a Range
+    request when the server still has the same version (If-Range). With conditional
+    set, the request carries the stored ETag/Last-Modified. Returns False if the
+    server answered 304 Not Modified.
+    """
+    for attempt in range(1, DATASET_DOWNLOAD_ATTEMPTS + 1):
+        partial = state.get("partial") or {}
+        offset = part.stat().st_size if part.exists() else 0
+        # If-Range needs a strong validator
+        etag = partial.get("etag")
+        validator = etag if etag and not etag.startswith("W/") else partial.get("last_modified")
+        headers = {}
+        if offset and validator:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+        elif conditional:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+        try:
+            with requests.get(zip_url, headers=headers, timeout=timeout_s, stream=True) as r:
+                if r.status_code == 304:
+                    return False
+                if r.status_code == 416:
+                    # Partial file does not fit the current version; start over
+                    part.unlink()
+                    continue
+                r.raise_for_status()
+                resumed = r.status_code == 206
+                if resumed and not r.headers.get("Content-Range", "").startswith(f"bytes {offset}-"):
+                    part.unlink()
+                    continue
+                if resumed:
+                    _emit_log(log_cb, f"[DATASET] Resuming download at {offset // (1024 * 1024)} MB")
+                else:
+                    # Remember this version's validators so an interrupted download can resume
+                    state["partial"] = {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+                    _write_dataset_state(state_path, state)
+                with open(part, "ab" if resumed else "wb") as f:
+                    for chunk in r.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+            return True
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            if attempt == DATASET_DOWNLOAD_ATTEMPTS:
+                raise
+            done = part.stat().st_size if part.exists() else 0
+            _emit_log(log_cb, f"[DATASET] Download interrupted at {done // (1024 * 1024)} MB "
+                              f"({type(e).__name__}), retrying ({attempt}/{DATASET_DOWNLOAD_ATTEMPTS - 1})")
+            time.sleep(min(2 * attempt, 10))
+    raise RuntimeError(f"[DATASET] Could not download {zip_url}")
+
+def _prune_dataset_versions(cache_dir: Path, key: str, state: Dict[str, Any]) -> None:
+    """Delete dataset zips (and their snapshots) other than the current and previous versions."""
+    keep = {state.get("current"), state.get("previous")}
+    keep_hashes = set()
+    for name in keep:
+        if name and (cache_dir / name).exists():
+            keep_hashes.add(dataset_zip_hash(cache_dir / name))
+    for zip_file in [cache_dir / f"{key}.zip", *cache_dir.glob(f"{key}_*.zip")]:
+        if zip_file.name in keep or not zip_file.exists():
+            continue
+        for path in (zip_file, zip_file.with_name(zip_file.name + ".sha256")):
+            try:
+                path.unlink()
+            except OSError:
+                pass  # still open elsewhere; removed on a later refresh
+    prune_snapshots(cache_dir, keep_hashes)
+
+def download_dataset_zip(zip_url: str, cache_dir: Path, log_cb=None,
+                         refresh_hours: float = DATASET_REFRESH_HOURS, timeout_s: int = 60) -> Path:
+    """
+    Path of the current dataset zip (it is read in place, not extracted).
 
-    _emit_log(log_cb, "[DATASET] Extracting zip…")
-    ensure_dir(extract_root)
-    with zipfile.ZipFile(zip_path, "r") as z:
-        z.extractall(extract_root)
+    The zip is downloaded on first use and re-checked with a conditional GET once
+    refresh_hours have passed. Downloads stream to a ".part" file and resume with
+    Range requests after interruptions, including across runs. Every version is
+    stored under its own name (URL hash + content hash) and never rewritten, so
+    jobs that already opened a version, and the snapshot compiled from it, keep a
+    consistent view while a newer one is swapped in; the version before the
+    current one is kept for them, older ones are deleted.
 
-    return extract_root
+    If an update check fails the cached zip is used.
+    """
+    ensure_dir(cache_dir)
+    key = sha256_text(zip_url)
+    state_path = cache_dir / f"{key}.json"
+    part = cache_dir / f"{key}.zip.part"
+
+    with _dataset_download_lock:
+        state = _read_dataset_state(state_path)
+        current = cache_dir / state["current"] if state.get("current") else None
+        if current is None or not current.exists():
+            # Zip downloaded by an older version of the tool (no validators), or none yet
+            legacy = cache_dir / f"{key}.zip"
+            current = legacy if legacy.exists() else None
+            state = {"current": current.name if current is not None else None, "partial": state.get("partial")}
+
+        if current is not None:
+            age_s = time.time() - float(state.get("checked_at") or 0)
+            if refresh_hours <= 0 or age_s < refresh_hours * 3600:
+                return current
+            _emit_log(log_cb, "[DATASET] Checking for dataset updates...")
+        else:
+            _emit_log(log_cb, f"[DATASET] Downloading zip: {zip_url}")
+
+        try:
+            changed = _stream_dataset_zip(zip_url, part, state, state_path, current is not None, timeout_s, log_cb)
+            if changed:
+                if not zipfile.is_zipfile(part):
+                    part.unlink()
+                    raise ValueError("downloaded file is not a zip archive")
+                digest = sha256_file(part)
+                dest = cache_dir / f"{key}_{digest[:16]}.zip"
+                if dest.exists():
+                    part.unlink()
+                else:
+                    os.replace(part, dest)
+                _record_zip_hash(dest, digest)
+                partial = state.pop("partial", None) or {}
+                state["etag"] = partial.get("etag")
+                state["last_modified"] = partial.get("last_modified")
+        except Exception as e:
+            if current is None:
+                raise
+            _emit_log(log_cb, f"[DATASET] Update check failed ({type(e).__name__}: {e}); using the cached dataset")
+            return current
+
+        state["checked_at"] = time.time()
+        if not changed or dest == current:
+            _emit_log(log_cb, "[DATASET] Dataset is up to date")
+        else:
+            if current is not None:
+                state["previous"] = current.name
+                _emit_log(log_cb, f"[DATASET] Downloaded new dataset version: {dest.name}")
+            state["current"] = dest.name
+        _write_dataset_state(state_path, state)
+        if changed and dest != current:
+            _prune_dataset_versions(cache_dir, key, state)
+        return cache_dir / state["current"]
+
+
+class DatasetZip(Mapping):
+    """
+    Read-only mapping of dataset platform name -> titles, backed by the GamesDB JSON
+    members of the dataset zip. Listing platforms only reads the zip's directory;
+    a platform's JSON is read and parsed the first time it is looked up and kept.
+
+    Platforms whose JSON fails to parse map to an empty list.
+    """
+
+    def __init__(self, zip_path: Path, gamesdb_subdir: str):
+        self.zip_path = Path(zip_path)
+        prefix = gamesdb_subdir.strip("/") + "/"
+        with zipfile.ZipFile(self.zip_path, "r") as z:
+            names = sorted(n for n in z.namelist() if n.startswith(prefix) and n.lower().endswith(".json"))
+        if not names:
+            raise RuntimeError(f"[DATASET] Could not find GamesDB JSONs under {gamesdb_subdir} in {self.zip_path}")
+        # Same platform name in two folders: the later path wins, as with the extracted tree
+        self._members: Dict[str, str] = {}
+        for name in names:
+            self._members[Path(name).stem] = name
+        self._titles: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, platform_name: str) -> List[str]:
+        member = self._members[platform_name]
+        with self._lock:
+            titles = self._titles.get(platform_name)
+            if titles is None:
+                try:
+                    with zipfile.ZipFile(self.zip_path, "r") as z:
+                        obj = json.loads(z.read(member).decode("utf-8", errors="replace"))
+                    titles = extract_titles_from_json(obj)
+                except Exception:
+                    titles = []
+                self._titles[platform_name] = titles
+        return list(titles)
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+
+def dataset_zip_hash(zip_path: Path) -> str:
+    """
+    SHA-256 of the dataset zip, remembered in a "<zip>.sha256" file next to it
+    (with the zip's mtime and size) so it is only recomputed when the zip changes.
+    """
+    zip_path = Path(zip_path)
+    st = zip_path.stat()
+    stamp = f"{st.st_mtime_ns} {st.st_size}"
+    sidecar = zip_path.with_name(zip_path.name + ".sha256")
+    try:
+        recorded_stamp, recorded_hash = sidecar.read_text(encoding="utf-8").rsplit(" ", 1)
+        if recorded_stamp == stamp:
+            return recorded_hash.strip()
+    except (OSError, ValueError):
+        pass
+    digest = sha256_file(zip_path)
+    _record_zip_hash(zip_path, digest)
+    return digest
+
+def _record_zip_hash(zip_path: Path, digest: str) -> None:
+    st = zip_path.stat()
+    try:
+        zip_path.with_name(zip_path.name + ".sha256").write_text(f"{st.st_mtime_ns} {st.st_size} {digest}", encoding="utf-8")
+    except OSError:
+        pass
+
+def load_dataset(zip_path: Path, gamesdb_subdir: str, cache_dir: Path, log_cb=None) -> Mapping[str, List[str]]:
+    """
+    Platform name -> titles for the dataset zip, from its compiled snapshot in cache_dir.
+    The snapshot is built (every platform parsed and normalized) the first time a
+    dataset version is seen; if it cannot be written the zip is read directly.
+    """
+    dataset_hash = dataset_zip_hash(zip_path)
+    path = snapshot_path(cache_dir, sha256_text(f"{dataset_hash}:{gamesdb_subdir}"))
+    snapshot = open_snapshot(path)
+    if snapshot is not None:
+        return snapshot
+
+    _emit_log(log_cb, "[DATASET] Compiling dataset snapshot (first run for this dataset version)...")
+    source = open_dataset_zip(zip_path, gamesdb_subdir)
+    t0 = time.perf_counter()
+    try:
+        build_snapshot(path, source, fuzzy_title_keys, norm_key, dataset_hash=dataset_hash)
+    except Exception as e:
+        _emit_log(log_cb, f"[DATASET] Could not write snapshot ({type(e).__name__}: {e}); reading the zip directly")
+        return source
+    _emit_log(log_cb, f"[DATASET] Snapshot written in {time.perf_counter() - t0:.1f}s: {path.name}")
+    return open_snapshot(path) or source
+
+_dataset_zips: Dict[Tuple[str, int, int, str], DatasetZip] = {}
+_dataset_zips_lock = threading.Lock()
+
+def open_dataset_zip(zip_path: Path, gamesdb_subdir: str) -> DatasetZip:
+    """Shared DatasetZip for this zip file and subdirectory; parsed platforms persist across jobs."""
+    st = Path(zip_path).stat()
+    key = (str(Path(zip_path).resolve()), st.st_mtime_ns, st.st_size, gamesdb_subdir)
+    with _dataset_zips_lock:
+        dataset = _dataset_zips.get(key)
+        if dataset is None:
+            dataset = DatasetZip(zip_path, gamesdb_subdir)
+            for old in [k for k in _dataset_zips if k[0] == key[0]]:
+                del _dataset_zips[old]
+            _dataset_zips[key] = dataset
+    return dataset
 
 def iter_json_files(root: Path) -> List[Path]:
     return sorted([p for p in root.rglob("*.json") if p.is_file()])
@@ -1419,6 +2988,7 @@ def extract_titles_from_json(obj: Any) -> List[str]:
     return []
 
 def load_dataset_platform_titles(dataset_root: Path, gamesdb_subdir: str) -> Dict[str, List[str]]:
+    """Parse every platform JSON of an extracted dataset tree (see DatasetZip for reading the zip)."""
     gamesdb = dataset_root / gamesdb_subdir
     if not gamesdb.exists():
         raise RuntimeError(f"[DATASET] Could not find GamesDB at: {gamesdb}")
@@ -1439,27 +3009,32 @@ def load_dataset_platform_titles(dataset_root: Path, gamesdb_subdir: str) -> Dic
     return platform_map
 
 def resolve_platform_titles(
-    dataset_platform_to_titles: Dict[str, List[str]],
+    dataset_platform_to_titles: Mapping[str, List[str]],
     platform_aliases: Dict[str, List[str]],
     desired_platform_key: str,
     platform_config: Optional[Dict[str, Any]] = None,
-    callbacks=None
+    callbacks=None,
+    cache_dir: Optional[Path] = None,
+    wikipedia_cache_hours: float = WIKIPEDIA_CACHE_HOURS,
 ) -> Tuple[str, List[str]]:
     """
     Strict-normalized resolver:
       - Matches aliases to dataset keys by normalized equality (case/punct insensitive).
       - NO substring/prefix fuzzy matching (prevents DS/3DS, GB/GBC/GBA collisions).
-      - Falls back to Wikipedia scraping if platform has wikipedia_url in config.
+      - Falls back to Wikipedia scraping if platform has wikipedia_url in config
+        (cached in cache_dir, see load_wikipedia_game_list).
     """
     desired = desired_platform_key.strip()
     aliases = (platform_aliases.get(desired_platform_key, []) or []) + [desired]
 
-    # Build normalized lookup for dataset keys
-    norm_map = {}
-    for k in dataset_platform_to_titles.keys():
-        nk = norm_key(k)
-        # if collision, keep the first; collisions are rare and should be fixed via aliasing
-        norm_map.setdefault(nk, k)
+    # Build normalized lookup for dataset keys (snapshots carry it precomputed)
+    norm_map = getattr(dataset_platform_to_titles, "norm_keys", None)
+    if norm_map is None:
+        norm_map = {}
+        for k in dataset_platform_to_titles.keys():
+            nk = norm_key(k)
+            # if collision, keep the first; collisions are rare and should be fixed via aliasing
+            norm_map.setdefault(nk, k)
 
     for a in aliases:
         na = norm_key(a)
@@ -1467,14 +3042,19 @@ def resolve_platform_titles(
             continue
         if na in norm_map:
             real_key = norm_map[na]
-            return real_key, dataset_platform_to_titles[real_key]
+            titles = dataset_platform_to_titles[real_key]
+            if titles:  # an unparseable platform JSON counts as no match
+                return real_key, titles
 
     # No match in dataset - check for Wikipedia fallback
     if platform_config:
         wikipedia_url = platform_config.get("wikipedia_url")
         if wikipedia_url:
             _emit_log(callbacks, f"[DATASET] No dataset match for {desired_platform_key}, trying Wikipedia fallback...")
-            titles = fetch_wikipedia_game_list(wikipedia_url, callbacks=callbacks)
+            titles = load_wikipedia_game_list(
+                wikipedia_url, cache_dir=cache_dir, dataset=dataset_platform_to_titles,
+                max_age_hours=wikipedia_cache_hours, callbacks=callbacks,
+            )
             if titles:
                 _emit_log(callbacks, f"[DATASET] Wikipedia fallback loaded {len(titles)} titles for {desired_platform_key}")
                 return desired_platform_key, titles
@@ -1510,165 +3090,284 @@ def get_review_dir(config_path: Path) -> Path:
 # ==========================
 # Wikipedia Game List Scraper
 # ==========================
-def fetch_wikipedia_game_list(url: str, callbacks=None) -> List[str]:
-    """
-    Scrape game titles from a Wikipedia "List of games" page.
-    Returns list of game titles.
-    """
-    import re
+def _parse_wikipedia_game_list(url: str, callbacks=None) -> Tuple[List[str], str]:
+    """Fetch and parse a Wikipedia "List of games" page. Returns (titles, revision ID); raises on failure."""
     from html import unescape
 
-    try:
-        _emit_log(callbacks, f"[WIKIPEDIA] Fetching game list from {url}")
+    _emit_log(callbacks, f"[WIKIPEDIA] Fetching game list from {url}")
 
-        # Use Wikipedia API for cleaner HTML
-        api_url = 'https://en.wikipedia.org/w/api.php'
+    # Extract page title from URL
+    page_title = url.split('/wiki/')[-1]
 
-        # Extract page title from URL
-        page_title = url.split('/wiki/')[-1]
+    # Use Wikipedia API for cleaner HTML
+    params = {
+        'action': 'parse',
+        'page': page_title,
+        'format': 'json',
+        'prop': 'text',
+        'formatversion': '2'
+    }
 
-        params = {
-            'action': 'parse',
-            'page': page_title,
-            'format': 'json',
-            'prop': 'text',
-            'formatversion': '2'
-        }
+    response = requests.get(WIKIPEDIA_API_URL, params=params, headers=WIKIPEDIA_HEADERS, timeout=30)
+    response.raise_for_status()
+    data = response.json()
 
-        headers = {
-            'User-Agent': 'IconGenerator/1.0 (Educational project for game icon generation)'
-        }
+    if 'parse' not in data or 'text' not in data['parse']:
+        raise ValueError(f"No parse data returned for {page_title}")
 
-        response = requests.get(api_url, params=params, headers=headers, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+    html_content = data['parse']['text']
+    revision = str(data['parse'].get('revid', ''))
 
-        if 'parse' not in data or 'text' not in data['parse']:
-            _emit_log(callbacks, f"[WIKIPEDIA] No parse data returned for {page_title}")
-            return []
+    titles = []
 
-        html_content = data['parse']['text']
+    # Wikipedia game list format:
+    # <tr><td><i>Game Title</i></td><td>Genre</td>...</tr>
+    # Pattern to match <td><i>Title</i></td> at the start of table rows
 
-        titles = []
+    # Extract all <i> tags within <td> tags
+    td_i_pattern = r'<td[^>]*><i>([^<]+)</i>'
+    matches = re.findall(td_i_pattern, html_content)
+
+    for match in matches:
+        # Clean up the title
+        title = unescape(match).strip()
+        # Remove footnote references like [1], [a], etc.
+        title = re.sub(r'\[[^\]]+\]', '', title).strip()
+
+        # Skip empty, very short titles
+        if len(title) < 2:
+            continue
 
-        # Wikipedia game list format:
-        # <tr><td><i>Game Title</i></td><td>Genre</td>...</tr>
-        # Pattern to match <td><i>Title</i></td> at the start of table rows
+        # Filter out obvious non-game entries
+        skip_terms = [
+            'unreleased', 'cancelled', 'tba', 'tbd',
+            'unknown', 'various', 'multiple', 'n/a',
+            'yes', 'no', 'genre', 'developer', 'publisher'
+        ]
+        if any(skip in title.lower() for skip in skip_terms):
+            continue
 
-        # Extract all <i> tags within <td> tags
-        td_i_pattern = r'<td[^>]*><i>([^<]+)</i>'
-        matches = re.findall(td_i_pattern, html_content)
+        # Only add unique titles
+        if title not in titles:
+            titles.append(title)
 
-        for match in matches:
-            # Clean up the title
-            title = unescape(match).strip()
-            # Remove footnote references like [1], [a], etc.
-            title = re.sub(r'\[[^\]]+\]', '', title).strip()
+    _emit_log(callbacks, f"[WIKIPEDIA] Found {len(titles)} game titles")
+    return titles, revision
 
-            # Skip empty, very short titles
-            if len(title) < 2:
-                continue
+def fetch_wikipedia_game_list(url: str, callbacks=None) -> List[str]:
+    """
+    Scrape game titles from a Wikipedia "List of games" page.
+    Returns list of game titles.
+    """
+    try:
+        return _parse_wikipedia_game_list(url, callbacks)[0]
+    except Exception as e:
+        _emit_log(callbacks, f"[WIKIPEDIA] Error fetching {url}: {e}")
+        return []
 
-            # Filter out obvious non-game entries
-            skip_terms = [
-                'unreleased', 'cancelled', 'tba', 'tbd',
-                'unknown', 'various', 'multiple', 'n/a',
-                'yes', 'no', 'genre', 'developer', 'publisher'
-            ]
-            if any(skip in title.lower() for skip in skip_terms):
-                continue
+def fetch_wikipedia_revision(url: str, timeout_s: int = 15) -> Optional[str]:
+    """Current revision ID of the Wikipedia page at url (MediaWiki query API), or None if it has none."""
+    params = {
+        'action': 'query',
+        'prop': 'revisions',
+        'titles': url.split('/wiki/')[-1],
+        'rvprop': 'ids',
+        'format': 'json',
+        'formatversion': '2'
+    }
+    response = requests.get(WIKIPEDIA_API_URL, params=params, headers=WIKIPEDIA_HEADERS, timeout=timeout_s)
+    response.raise_for_status()
+    pages = (response.json().get('query') or {}).get('pages') or []
+    revisions = pages[0].get('revisions') if pages else None
+    return str(revisions[0]['revid']) if revisions else None
+
+# url -> {"revision", "checked_at", "titles"}, mirroring the JSON files in the dataset cache
+_wikipedia_lists: Dict[str, Dict[str, Any]] = {}
+_wikipedia_lock = threading.Lock()
+
+def _wikipedia_record(url: str, cache_path: Optional[Path], max_age_hours: float, callbacks=None) -> Optional[Dict[str, Any]]:
+    record = _wikipedia_lists.get(url)
+    if record is None and cache_path is not None and cache_path.exists():
+        try:
+            record = json.loads(cache_path.read_text(encoding="utf-8"))
+        except Exception:
+            record = None
 
-            # Only add unique titles
-            if title not in titles:
-                titles.append(title)
+    def save(rec: Dict[str, Any]) -> Dict[str, Any]:
+        _wikipedia_lists[url] = rec
+        if cache_path is not None:
+            try:
+                cache_path.write_text(json.dumps(rec, indent=2), encoding="utf-8")
+            except OSError:
+                pass
+        return rec
 
-        _emit_log(callbacks, f"[WIKIPEDIA] Found {len(titles)} game titles")
-        return titles
+    if record is not None:
+        if time.time() - float(record.get("checked_at", 0)) < max_age_hours * 3600:
+            _wikipedia_lists[url] = record
+            return record
+        try:
+            revision = fetch_wikipedia_revision(url)
+        except Exception as e:
+            # Offline or API trouble: keep the list until the next check is due
+            _emit_log(callbacks, f"[WIKIPEDIA] Revision check failed ({type(e).__name__}); using the cached list")
+            revision = record.get("revision")
+        if revision == record.get("revision"):
+            return save(dict(record, checked_at=time.time()))
+        _emit_log(callbacks, f"[WIKIPEDIA] Page changed (revision {record.get('revision')} -> {revision}), refetching")
 
+    try:
+        titles, revision = _parse_wikipedia_game_list(url, callbacks)
     except Exception as e:
         _emit_log(callbacks, f"[WIKIPEDIA] Error fetching {url}: {e}")
+        if record is None:
+            return None
+        # Keep the previous list until the next check is due rather than retrying on every call
+        _emit_log(callbacks, "[WIKIPEDIA] Using the cached list")
+        return save(dict(record, checked_at=time.time()))
+    return save({"url": url, "revision": revision, "checked_at": time.time(), "titles": titles})
+
+def load_wikipedia_game_list(
+    url: str,
+    cache_dir: Optional[Path] = None,
+    dataset: Optional[Mapping[str, List[str]]] = None,
+    max_age_hours: float = WIKIPEDIA_CACHE_HOURS,
+    callbacks=None,
+) -> List[str]:
+    """
+    Titles of a Wikipedia fallback list, fetched and parsed only when needed.
+
+    The parsed list is cached in memory and as JSON in cache_dir. Once
+    max_age_hours have passed the page's revision ID is checked; the page is only
+    fetched and parsed again if it changed. When dataset is a snapshot, the list
+    is also merged into it per revision, so its titles come back normalized and
+    indexed for fuzzy matching like a dataset platform's.
+    """
+    cache_path = Path(cache_dir) / f"wikipedia_{sha256_text(url)}.json" if cache_dir is not None else None
+    with _wikipedia_lock:
+        record = _wikipedia_record(url, cache_path, max_age_hours, callbacks)
+    if not record or not record.get("titles"):
         return []
 
+    store = getattr(dataset, "store_fallback", None)
+    if store is None:
+        return list(record["titles"])
+    merged = dataset.fallback(url)
+    if merged is None or merged[0] != record["revision"]:
+        try:
+            store(url, record["revision"], record["titles"], fuzzy_title_keys)
+        except Exception as e:
+            _emit_log(callbacks, f"[WIKIPEDIA] Could not merge list into the dataset snapshot ({type(e).__name__}: {e})")
+            return list(record["titles"])
+        merged = dataset.fallback(url)
+    return merged[1]
+
 # ==========================
 # Providers
 # ==========================
-def fetch_multiple_art_from_steamgriddb(
+def _select_steamgriddb_grids(
     *,
     api_key: str,
     base_url: str,
     timeout_s: int,
     delay_s: float,
-    cache_dir: Path,
     allow_animated: bool,
     prefer_dim: str,
     square_styles: List[str],
     square_only: bool,
-    platform_key: str,
     title: str,
     platform_hints: List[str],
     callbacks=None
-) -> List[Tuple[bytes, str]]:
+) -> List[Dict[str, Any]]:
     """
-    Fetch ALL artwork options from SteamGridDB.
-    Returns list of (bytes, source_tag) tuples.
-    Uses smart search with multiple variants for better matching.
-    Downloads are parallelized for speed.
+    Search SteamGridDB for title and return its grid records (url, thumb, width, height,
+    style, ...) that pass the animation/square filters, best score first, at most 25.
     """
-    results = []
+    # Clean the title first for better matching
+    search_title = normalize_for_search(title)
+    _emit_log(callbacks, f"[DEBUG] SteamGridDB: Searching for '{title}' (normalized: '{search_title}')...")
 
-    try:
-        # Clean the title first for better matching
-        search_title = normalize_for_search(title)
-        _emit_log(callbacks, f"[DEBUG] SteamGridDB: Searching for '{title}' (normalized: '{search_title}')...")
+    # Use variant search for better results
+    autocomplete_results = search_with_variants(api_key, base_url, title, timeout_s, delay_s, callbacks)
 
-        # Use variant search for better results
-        autocomplete_results = search_with_variants(api_key, base_url, title, timeout_s, delay_s, callbacks)
+    if not autocomplete_results:
+        _emit_log(callbacks, f"[DEBUG] SteamGridDB: No results found for any search variant")
+        return []
 
-        if not autocomplete_results:
-            _emit_log(callbacks, f"[DEBUG] SteamGridDB: No results found for any search variant")
-            return results
+    if delay_s > 0:
+        time.sleep(delay_s)
 
-        if delay_s > 0:
-            time.sleep(delay_s)
+    # Get best game ID using the normalized title for comparison
+    game_id = choose_best_game_id(api_key, base_url, timeout_s, delay_s, search_title, platform_hints, autocomplete_results, 8, callbacks)
+    if not game_id:
+        return []
 
-        # Get best game ID using the normalized title for comparison
-        game_id = choose_best_game_id(api_key, base_url, timeout_s, delay_s, search_title, platform_hints, autocomplete_results, 8, callbacks)
-        if not game_id:
-            return results
+    # Fetch all grids for this game
+    grids = grids_by_game(api_key, base_url, game_id, [prefer_dim], square_styles, timeout_s)
+    if not grids:
+        return []
 
-        # Fetch all grids for this game
-        grids = grids_by_game(api_key, base_url, game_id, [prefer_dim], square_styles, timeout_s)
-        if not grids:
-            return results
+    if delay_s > 0:
+        time.sleep(delay_s)
 
-        if delay_s > 0:
-            time.sleep(delay_s)
+    # Filter grids based on preferences
+    suitable_grids = []
+    for grid in grids:
+        # Check animation
+        if not allow_animated and grid.get("mime", "").startswith("image/webp"):
+            continue
+        # Check if square only
+        if square_only and grid.get("width") != grid.get("height"):
+            continue
+        suitable_grids.append(grid)
 
-        # Filter grids based on preferences
-        suitable_grids = []
-        for grid in grids:
-            # Check animation
-            if not allow_animated and grid.get("mime", "").startswith("image/webp"):
-                continue
-            # Check if square only
-            if square_only and grid.get("width") != grid.get("height"):
-                continue
-            suitable_grids.append(grid)
+    # Sort by score (highest first) to get the best quality artwork
+    suitable_grids.sort(key=lambda x: (x.get("score", 0), x.get("upvotes", 0), x.get("id", 0)), reverse=True)
+
+    # Limit to max 25 artworks to prevent memory issues with large collections
+    # With 4 providers (steamgriddb, igdb, thegamesdb, libretro), this gives ~100 total options
+    MAX_ARTWORKS_PER_PROVIDER = 25
+    if len(suitable_grids) > MAX_ARTWORKS_PER_PROVIDER:
+        _emit_log(callbacks, f"[DEBUG] SteamGridDB: Limiting from {len(suitable_grids)} to {MAX_ARTWORKS_PER_PROVIDER} artworks")
+        suitable_grids = suitable_grids[:MAX_ARTWORKS_PER_PROVIDER]
 
-        # Sort by score (highest first) to get the best quality artwork
-        suitable_grids.sort(key=lambda x: (x.get("score", 0), x.get("upvotes", 0), x.get("id", 0)), reverse=True)
+    _emit_log(callbacks, f"[DEBUG] SteamGridDB: {len(suitable_grids)} suitable grids after filtering, sorted by score")
+    if suitable_grids:
+        top_scores = [(g.get("score", 0), g.get("style", "?")) for g in suitable_grids[:5]]
+        _emit_log(callbacks, f"[DEBUG] SteamGridDB: Top scores: {top_scores}")
+    return suitable_grids
 
-        # Limit to max 25 artworks to prevent memory issues with large collections
-        # With 4 providers (steamgriddb, igdb, thegamesdb, libretro), this gives ~100 total options
-        MAX_ARTWORKS_PER_PROVIDER = 25
-        if len(suitable_grids) > MAX_ARTWORKS_PER_PROVIDER:
-            _emit_log(callbacks, f"[DEBUG] SteamGridDB: Limiting from {len(suitable_grids)} to {MAX_ARTWORKS_PER_PROVIDER} artworks")
-            suitable_grids = suitable_grids[:MAX_ARTWORKS_PER_PROVIDER]
 
-        _emit_log(callbacks, f"[DEBUG] SteamGridDB: {len(suitable_grids)} suitable grids after filtering, sorted by score")
-        if suitable_grids:
-            top_scores = [(g.get("score", 0), g.get("style", "?")) for g in suitable_grids[:5]]
-            _emit_log(callbacks, f"[DEBUG] SteamGridDB: Top scores: {top_scores}")
+def fetch_multiple_art_from_steamgriddb(
+    *,
+    api_key: str,
+    base_url: str,
+    timeout_s: int,
+    delay_s: float,
+    cache_dir: Path,
+    allow_animated: bool,
+    prefer_dim: str,
+    square_styles: List[str],
+    square_only: bool,
+    platform_key: str,
+    title: str,
+    platform_hints: List[str],
+    callbacks=None
+) -> List[Tuple[bytes, str]]:
+    """
+    Fetch ALL artwork options from SteamGridDB.
+    Returns list of (bytes, source_tag) tuples.
+    Uses smart search with multiple variants for better matching.
+    Downloads are parallelized for speed.
+    """
+    results = []
+
+    try:
+        suitable_grids = _select_steamgriddb_grids(
+            api_key=api_key, base_url=base_url, timeout_s=timeout_s, delay_s=delay_s,
+            allow_animated=allow_animated, prefer_dim=prefer_dim, square_styles=square_styles,
+            square_only=square_only, title=title, platform_hints=platform_hints, callbacks=callbacks,
+        )
 
         # Download ALL grids in parallel for speed
         def download_grid(idx_grid):
@@ -1677,14 +3376,7 @@ def fetch_multiple_art_from_steamgriddb(
             if not url:
                 return None
             try:
-                cache_key = sha256_text(url)
-                cache_path = cache_dir / f"{cache_key}.bin"
-
-                if cache_path.exists():
-                    img_bytes = cache_path.read_bytes()
-                else:
-                    img_bytes = download_bytes(url, timeout_s)
-                    cache_path.write_bytes(img_bytes)
+                img_bytes = read_or_download(url, cache_dir, timeout_s)
 
                 # Add grid style info to source tag
                 style = grid.get("style", "unknown")
@@ -1716,6 +3408,63 @@ def fetch_multiple_art_from_steamgriddb(
         _emit_log(callbacks, f"[DEBUG] SteamGridDB: Error - {e}")
         return results
 
+
+def fetch_previews_from_steamgriddb(
+    *,
+    api_key: str,
+    base_url: str,
+    timeout_s: int,
+    delay_s: float,
+    cache_dir: Path,
+    allow_animated: bool,
+    prefer_dim: str,
+    square_styles: List[str],
+    square_only: bool,
+    platform_key: str,
+    title: str,
+    platform_hints: List[str],
+    callbacks=None
+) -> List[Dict[str, Any]]:
+    """
+    Same grids as fetch_multiple_art_from_steamgriddb, but only their thumbnails are downloaded.
+    Returns preview option dicts (see preview_option); the full grid is fetched on selection.
+    """
+    results = []
+
+    try:
+        suitable_grids = _select_steamgriddb_grids(
+            api_key=api_key, base_url=base_url, timeout_s=timeout_s, delay_s=delay_s,
+            allow_animated=allow_animated, prefer_dim=prefer_dim, square_styles=square_styles,
+            square_only=square_only, title=title, platform_hints=platform_hints, callbacks=callbacks,
+        )
+
+        def download_thumb(grid):
+            url = grid.get("url")
+            thumb_url = grid.get("thumb") or url
+            if not url:
+                return None
+            try:
+                thumb_bytes = read_or_download(thumb_url, cache_dir, timeout_s)
+            except Exception as e:
+                _emit_log(callbacks, f"[DEBUG] SteamGridDB: Failed to download thumbnail - {e}")
+                return None
+            return preview_option(
+                thumb_bytes, f"SteamGridDB - {grid.get('style', 'unknown')}",
+                full_url=url if thumb_url != url else None,
+                width=grid.get("width"), height=grid.get("height"),
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # map() keeps score order
+            results = [r for r in executor.map(download_thumb, suitable_grids) if r]
+
+        _emit_log(callbacks, f"[DEBUG] SteamGridDB: Returning {len(results)} preview options")
+        return results
+
+    except Exception as e:
+        _emit_log(callbacks, f"[DEBUG] SteamGridDB: Error - {e}")
+        return results
+
 def fetch_art_from_steamgriddb_square(
     *,
     api_key: str,
@@ -1784,16 +3533,12 @@ def fetch_art_from_steamgriddb_square(
     _emit_log(callbacks, f"[DEBUG] SteamGridDB: Selected grid - score={best.get('score', 0)}, style={best.get('style', '?')}, dim={best.get('width')}x{best.get('height')}")
 
     url = best["url"]
-    cache_key = sha256_text(url)
-    cache_path = cache_dir / f"{cache_key}.bin"
     try:
-        if cache_path.exists():
+        if is_cached(url, cache_dir):
             _emit_log(callbacks, f"[DEBUG] SteamGridDB: Using cached image")
-            return cache_path.read_bytes(), "steamgriddb_square"
-        _emit_log(callbacks, f"[DEBUG] SteamGridDB: Downloading image...")
-        img_bytes = download_bytes(url, timeout_s)
-        cache_path.write_bytes(img_bytes)
-        _emit_log(callbacks, f"[DEBUG] SteamGridDB: Image downloaded and cached")
+        else:
+            _emit_log(callbacks, f"[DEBUG] SteamGridDB: Downloading image...")
+        img_bytes = read_or_download(url, cache_dir, timeout_s)
         return img_bytes, "steamgriddb_square"
     except Exception as e:
         _emit_log(callbacks, f"[DEBUG] SteamGridDB: Download failed - {type(e).__name__}: {e}")
@@ -1954,15 +3699,11 @@ def fetch_heroes_from_steamgriddb(
                 continue
 
             try:
-                cache_key = sha256_text(url)
-                cache_path = cache_dir / f"hero_{cache_key}.bin"
-
-                if cache_path.exists():
-                    img_bytes = cache_path.read_bytes()
+                img_bytes = read_cached(url, cache_dir, prefix="hero_")
+                if img_bytes is not None:
                     _emit_log(callbacks, f"[HERO] Using cached hero {i+1}")
                 else:
-                    img_bytes = download_bytes(url, timeout_s)
-                    cache_path.write_bytes(img_bytes)
+                    img_bytes = download_to_cache(url, cache_dir, timeout_s, prefix="hero_")
                     _emit_log(callbacks, f"[HERO] Downloaded hero {i+1}")
 
                 # Generate filename hint - hero_Y format (hero_1, hero_2, etc.)
@@ -2098,15 +3839,11 @@ def fetch_logos_from_steamgriddb(
             return None
 
         try:
-            cache_key = sha256_text(url)
-            cache_path = cache_dir / f"logo_{cache_key}.bin"
-
-            if cache_path.exists():
-                img_bytes = cache_path.read_bytes()
+            img_bytes = read_cached(url, cache_dir, prefix="logo_")
+            if img_bytes is not None:
                 _emit_log(callbacks, f"[LOGO] Using cached logo")
             else:
-                img_bytes = download_bytes(url, timeout_s)
-                cache_path.write_bytes(img_bytes)
+                img_bytes = download_to_cache(url, cache_dir, timeout_s, prefix="logo_")
                 _emit_log(callbacks, f"[LOGO] Downloaded logo")
 
             return (img_bytes, "title")
@@ -2199,15 +3936,11 @@ def fetch_screenshots_from_igdb(
                 # IGDB screenshot URL - use 720p size
                 screenshot_url = f"https://images.igdb.com/igdb/image/upload/t_720p/{image_id}.jpg"
 
-                cache_key = sha256_text(screenshot_url)
-                cache_path = cache_dir / f"screenshot_{cache_key}.bin"
-
-                if cache_path.exists():
-                    img_bytes = cache_path.read_bytes()
+                img_bytes = read_cached(screenshot_url, cache_dir, prefix="screenshot_")
+                if img_bytes is not None:
                     _emit_log(callbacks, f"[SCREENSHOT] Using cached screenshot {i+1}")
                 else:
-                    img_bytes = download_bytes(screenshot_url, timeout_s)
-                    cache_path.write_bytes(img_bytes)
+                    img_bytes = download_to_cache(screenshot_url, cache_dir, timeout_s, prefix="screenshot_")
                     _emit_log(callbacks, f"[SCREENSHOT] Downloaded screenshot {i+1}")
 
                 # slide_Y naming format
@@ -2320,15 +4053,11 @@ def fetch_screenshots_from_thegamesdb(
             try:
                 screenshot_url = f"{base_img_url}{filename_part}"
 
-                cache_key = sha256_text(screenshot_url)
-                cache_path = cache_dir / f"screenshot_{cache_key}.bin"
-
-                if cache_path.exists():
-                    img_bytes = cache_path.read_bytes()
+                img_bytes = read_cached(screenshot_url, cache_dir, prefix="screenshot_")
+                if img_bytes is not None:
                     _emit_log(callbacks, f"[SCREENSHOT] Using cached screenshot {i+1}")
                 else:
-                    img_bytes = download_bytes(screenshot_url, timeout_s)
-                    cache_path.write_bytes(img_bytes)
+                    img_bytes = download_to_cache(screenshot_url, cache_dir, timeout_s, prefix="screenshot_")
                     _emit_log(callbacks, f"[SCREENSHOT] Downloaded screenshot {i+1}")
 
                 # slide_Y naming format
@@ -2385,15 +4114,13 @@ def fetch_screenshots_from_libretro(
             url = f"{lr_base.rstrip('/')}/{path}"
 
             try:
-                r = requests.get(url, timeout=timeout_s)
-                if r.status_code == 200 and r.content:
+                img_bytes = read_cached(url, cache_dir, prefix="snapshot_")
+                if img_bytes is None:
+                    img_bytes = download_to_cache(url, cache_dir, timeout_s, prefix="snapshot_")
+                if img_bytes:
                     # Libretro typically has one snapshot per game
-                    cache_key = sha256_text(url)
-                    cache_path = cache_dir / f"snapshot_{cache_key}.bin"
-                    cache_path.write_bytes(r.content)
-
                     filename = "slide_1"
-                    results.append((r.content, filename))
+                    results.append((img_bytes, filename))
                     _emit_log(callbacks, f"[SCREENSHOT] Libretro: Found snapshot for '{title}'")
                     return results  # Libretro has single snapshots
             except Exception:
@@ -2496,6 +4223,96 @@ def fetch_art_from_igdb(
         if debug_log and callable(debug_log):
             debug_log(msg)
 
+    image_id = _find_igdb_cover_id(
+        client_id=client_id, client_secret=client_secret, base_url=base_url,
+        timeout_s=timeout_s, delay_s=delay_s, platform_map=platform_map,
+        platform_key=platform_key, title=title, log=_log,
+    )
+    if not image_id:
+        return None
+
+    try:
+        cover_url = igdb_image_url(image_id, cover_size)
+        _log(f"[DEBUG] IGDB: Cover URL: {cover_url}")
+
+        # Download and cache
+        if is_cached(cover_url, cache_dir):
+            _log(f"[DEBUG] IGDB: Using cached image")
+        else:
+            _log(f"[DEBUG] IGDB: Downloading cover...")
+        img_bytes = read_or_download(cover_url, cache_dir, timeout_s)
+
+        return img_bytes, "igdb_cover"
+
+    except Exception as e:
+        _log(f"[DEBUG] IGDB: Error - {type(e).__name__}: {e}")
+        return None
+
+
+def fetch_preview_from_igdb(
+    *,
+    client_id: str,
+    client_secret: str,
+    base_url: str,
+    timeout_s: int,
+    delay_s: float,
+    platform_map: Dict[str, int],
+    cover_size: str,
+    platform_key: str,
+    title: str,
+    cache_dir: Path,
+    debug_log=None
+) -> Optional[Dict[str, Any]]:
+    """
+    Same cover as fetch_art_from_igdb, downloaded at IGDB_PREVIEW_SIZE for the picker.
+    Returns a preview option dict whose full_url is the cover at cover_size.
+    """
+    def _log(msg):
+        if debug_log and callable(debug_log):
+            debug_log(msg)
+
+    image_id = _find_igdb_cover_id(
+        client_id=client_id, client_secret=client_secret, base_url=base_url,
+        timeout_s=timeout_s, delay_s=delay_s, platform_map=platform_map,
+        platform_key=platform_key, title=title, log=_log,
+    )
+    if not image_id:
+        return None
+
+    try:
+        full_url = igdb_image_url(image_id, cover_size)
+        thumb_url = igdb_image_url(image_id, IGDB_PREVIEW_SIZE)
+        thumb_bytes = read_or_download(thumb_url, cache_dir, timeout_s)
+        return preview_option(thumb_bytes, "igdb_cover", full_url=full_url if full_url != thumb_url else None)
+    except Exception as e:
+        _log(f"[DEBUG] IGDB: Error - {type(e).__name__}: {e}")
+        return None
+
+
+# Picker previews use the cover_big rendition: t_thumb is a 90 px square crop,
+# too small (and cropped) for the picker's 256 px tiles
+IGDB_PREVIEW_SIZE = "cover_big"
+
+def igdb_image_url(image_id: str, size: str) -> str:
+    # IGDB image URL format: https://images.igdb.com/igdb/image/upload/t_{size}/{image_id}.jpg
+    # Sizes: cover_small (90x128), cover_big (264x374), 720p (1280x720), 1080p (1920x1080)
+    return f"https://images.igdb.com/igdb/image/upload/t_{size}/{image_id}.jpg"
+
+def _find_igdb_cover_id(
+    *,
+    client_id: str,
+    client_secret: str,
+    base_url: str,
+    timeout_s: int,
+    delay_s: float,
+    platform_map: Dict[str, int],
+    platform_key: str,
+    title: str,
+    log
+) -> Optional[str]:
+    """Search IGDB for title on platform_key and return the best match's cover image_id."""
+    _log = log
+
     # Clean and normalize title for better search
     search_title = normalize_for_search(title)
     _log(f"[DEBUG] IGDB: Searching for '{title}' (normalized: '{search_title}')")
@@ -2550,27 +4367,7 @@ def fetch_art_from_igdb(
             _log(f"[DEBUG] IGDB: No cover found for '{game.get('name')}'")
             return None
 
-        # Build cover URL
-        image_id = cover["image_id"]
-        # IGDB image URL format: https://images.igdb.com/igdb/image/upload/t_{size}/{image_id}.jpg
-        # Sizes: cover_small (90x128), cover_big (264x374), 720p (1280x720), 1080p (1920x1080)
-        cover_url = f"https://images.igdb.com/igdb/image/upload/t_{cover_size}/{image_id}.jpg"
-        _log(f"[DEBUG] IGDB: Cover URL: {cover_url}")
-
-        # Download and cache
-        cache_key = sha256_text(cover_url)
-        cache_path = cache_dir / f"{cache_key}.bin"
-
-        if cache_path.exists():
-            _log(f"[DEBUG] IGDB: Using cached image")
-            return cache_path.read_bytes(), "igdb_cover"
-
-        _log(f"[DEBUG] IGDB: Downloading cover...")
-        img_bytes = download_bytes(cover_url, timeout_s)
-        cache_path.write_bytes(img_bytes)
-        _log(f"[DEBUG] IGDB: Cover downloaded and cached")
-
-        return img_bytes, "igdb_cover"
+        return cover["image_id"]
 
     except Exception as e:
         _log(f"[DEBUG] IGDB: Error - {type(e).__name__}: {e}")
@@ -2598,6 +4395,99 @@ def fetch_art_from_thegamesdb(
         if debug_log and callable(debug_log):
             debug_log(msg)
 
+    found = _find_thegamesdb_image(
+        api_key=api_key, base_url=base_url, timeout_s=timeout_s, delay_s=delay_s,
+        platform_map=platform_map, prefer_image_type=prefer_image_type,
+        platform_key=platform_key, title=title, log=_log,
+    )
+    if not found:
+        return None
+    base_urls, image = found
+
+    try:
+        # Build image URL
+        image_url = f"{base_urls['original']}{image.get('filename')}"
+        _log(f"[DEBUG] TheGamesDB: Selected image: {image_url}")
+
+        # Download and cache
+        if is_cached(image_url, cache_dir):
+            _log(f"[DEBUG] TheGamesDB: Using cached image")
+        else:
+            _log(f"[DEBUG] TheGamesDB: Downloading image...")
+        img_bytes = read_or_download(image_url, cache_dir, timeout_s)
+
+        return img_bytes, "thegamesdb_boxart"
+
+    except Exception as e:
+        _log(f"[DEBUG] TheGamesDB: Error - {type(e).__name__}: {e}")
+        return None
+
+
+def fetch_preview_from_thegamesdb(
+    *,
+    api_key: str,
+    base_url: str,
+    timeout_s: int,
+    delay_s: float,
+    platform_map: Dict[str, int],
+    prefer_image_type: str,
+    platform_key: str,
+    title: str,
+    cache_dir: Path,
+    debug_log=None
+) -> Optional[Dict[str, Any]]:
+    """
+    Same image as fetch_art_from_thegamesdb, downloaded from TheGamesDB's thumb size.
+    Returns a preview option dict whose full_url is the original image.
+    """
+    def _log(msg):
+        if debug_log and callable(debug_log):
+            debug_log(msg)
+
+    found = _find_thegamesdb_image(
+        api_key=api_key, base_url=base_url, timeout_s=timeout_s, delay_s=delay_s,
+        platform_map=platform_map, prefer_image_type=prefer_image_type,
+        platform_key=platform_key, title=title, log=_log,
+    )
+    if not found:
+        return None
+    base_urls, image = found
+
+    try:
+        filename = image.get("filename")
+        full_url = f"{base_urls['original']}{filename}"
+        thumb_base = base_urls.get("thumb") or base_urls.get("small")
+        thumb_url = f"{thumb_base}{filename}" if thumb_base else full_url
+        thumb_bytes = read_or_download(thumb_url, cache_dir, timeout_s)
+
+        # "resolution" is "WxH" for most images, missing or null for some
+        width, height = parse_resolution(image.get("resolution")) or (None, None)
+        return preview_option(thumb_bytes, "thegamesdb_boxart",
+                              full_url=full_url if full_url != thumb_url else None,
+                              width=width, height=height)
+    except Exception as e:
+        _log(f"[DEBUG] TheGamesDB: Error - {type(e).__name__}: {e}")
+        return None
+
+
+def _find_thegamesdb_image(
+    *,
+    api_key: str,
+    base_url: str,
+    timeout_s: int,
+    delay_s: float,
+    platform_map: Dict[str, int],
+    prefer_image_type: str,
+    platform_key: str,
+    title: str,
+    log
+) -> Optional[Tuple[Dict[str, str], Dict[str, Any]]]:
+    """
+    Search TheGamesDB for title and pick its preferred image.
+    Returns (base_url sizes dict, image record) or None.
+    """
+    _log = log
+
     # Clean and normalize title for better search
     search_title = normalize_for_search(title)
     _log(f"[DEBUG] TheGamesDB: Searching for '{title}' (normalized: '{search_title}')")
@@ -2653,8 +4543,9 @@ def fetch_art_from_thegamesdb(
         if delay_s > 0:
             time.sleep(delay_s)
 
-        # Get base image URL
-        base_img_url = img_data.get("data", {}).get("base_url", {}).get("original")
+        # Get base image URLs (original, thumb, small, medium, ...)
+        base_urls = img_data.get("data", {}).get("base_url", {}) or {}
+        base_img_url = base_urls.get("original")
         images_list = img_data.get("data", {}).get("images", {}).get(str(game_id), [])
         _log(f"[DEBUG] TheGamesDB: Found {len(images_list) if images_list else 0} images")
 
@@ -2683,25 +4574,7 @@ def fetch_art_from_thegamesdb(
             _log(f"[DEBUG] TheGamesDB: No suitable images for '{game_name}'")
             return None
 
-        # Build image URL
-        filename = best_image.get("filename")
-        image_url = f"{base_img_url}{filename}"
-        _log(f"[DEBUG] TheGamesDB: Selected image: {image_url}")
-
-        # Download and cache
-        cache_key = sha256_text(image_url)
-        cache_path = cache_dir / f"{cache_key}.bin"
-
-        if cache_path.exists():
-            _log(f"[DEBUG] TheGamesDB: Using cached image")
-            return cache_path.read_bytes(), "thegamesdb_boxart"
-
-        _log(f"[DEBUG] TheGamesDB: Downloading image...")
-        img_bytes = download_bytes(image_url, timeout_s)
-        cache_path.write_bytes(img_bytes)
-        _log(f"[DEBUG] TheGamesDB: Image downloaded and cached")
-
-        return img_bytes, "thegamesdb_boxart"
+        return base_urls, best_image
 
     except Exception as e:
         _log(f"[DEBUG] TheGamesDB: Error - {type(e).__name__}: {e}")
@@ -2717,6 +4590,8 @@ _steam_app_list_cache = None
 _steam_app_list_lock = threading.Lock()
 _steam_app_list_cache_time = None
 _STEAM_CACHE_HOURS = 24  # Cache app list for 24 hours
+# (app list, its names normalized for search in the same order), filled on first search
+_steam_app_norms = None
 
 
 def _get_steam_app_list(timeout_s: int, debug_log=None) -> Dict[str, int]:
@@ -2795,6 +4670,15 @@ def _get_steam_app_list(timeout_s: int, debug_log=None) -> Dict[str, int]:
             return _steam_app_list_cache or {}
 
 
+def _steam_app_names_normalized(app_list: Dict[str, int]) -> List[str]:
+    """Lowercased normalize_for_search of every app name, computed once per fetched app list."""
+    global _steam_app_norms
+    cached = _steam_app_norms
+    if cached is None or cached[0] is not app_list:
+        cached = _steam_app_norms = (app_list, [n.lower() for n in normalize_titles(app_list.keys())])
+    return cached[1]
+
+
 def _search_steam_apps(search_term: str, app_list: Dict[str, int], max_results: int = 10) -> List[Tuple[int, str, float]]:
     """
     Search Steam app list for matching games.
@@ -2807,8 +4691,9 @@ def _search_steam_apps(search_term: str, app_list: Dict[str, int], max_results:
     search_norm = normalize_for_search(search_term).lower()
 
     results = []
+    app_norms = _steam_app_names_normalized(app_list)
 
-    for name_lower, app_id in app_list.items():
+    for (name_lower, app_id), name_norm in zip(app_list.items(), app_norms):
         # Skip empty names or DLC-like entries
         if not name_lower or "soundtrack" in name_lower or "artbook" in name_lower:
             continue
@@ -2829,7 +4714,6 @@ def _search_steam_apps(search_term: str, app_list: Dict[str, int], max_results:
             continue
 
         # Normalized match
-        name_norm = normalize_for_search(name_lower).lower()
         if search_norm in name_norm:
             ratio = len(search_norm) / len(name_norm)
             results.append((app_id, name_lower, ratio * 0.85))
@@ -2906,22 +4790,19 @@ def fetch_art_from_steam(
             # Steam CDN URLs: https://cdn.akamai.steamstatic.com/steam/apps/{appid}/header.jpg
             header_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/header.jpg"
 
-            # Check cache first
-            cache_key = sha256_text(header_url)
-            cache_path = cache_dir / f"{cache_key}.bin"
-
-            if cache_path.exists():
-                _log(f"[DEBUG] Steam: Using cached image for appid {app_id}")
-                return cache_path.read_bytes(), "steam_header"
-
             try:
-                _log(f"[DEBUG] Steam: Downloading header image for appid {app_id}...")
-                img_bytes = download_bytes(header_url, timeout_s)
+                # Check cache first (placeholders are cached too, so they are not fetched again)
+                img_bytes = read_cached(header_url, cache_dir)
+                if img_bytes is not None:
+                    _log(f"[DEBUG] Steam: Using cached image for appid {app_id}")
+                else:
+                    _log(f"[DEBUG] Steam: Downloading header image for appid {app_id}...")
+                    img_bytes = download_to_cache(header_url, cache_dir, timeout_s)
+                    _log(f"[DEBUG] Steam: Header image downloaded and cached")
 
                 # Verify it's a valid image (not a placeholder)
                 if len(img_bytes) > 1000:  # Basic size check
-                    cache_path.write_bytes(img_bytes)
-                    _log(f"[DEBUG] Steam: Header image downloaded and cached")
+                    _note_source_url(header_url)
                     return img_bytes, "steam_header"
                 else:
                     _log(f"[DEBUG] Steam: Image too small, likely placeholder")
@@ -3004,16 +4885,12 @@ def fetch_multiple_art_from_steam(
                 header_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/header.jpg"
 
                 # Check cache first
-                cache_key = sha256_text(header_url)
-                cache_path = cache_dir / f"{cache_key}.bin"
-
-                if cache_path.exists():
-                    return (cache_path.read_bytes(), f"steam:{matched_name}")
-
-                img_bytes = download_bytes(header_url, timeout_s)
+                img_bytes = read_cached(header_url, cache_dir)
+                if img_bytes is None:
+                    img_bytes = download_to_cache(header_url, cache_dir, timeout_s)
 
+                # Placeholders are kept in the cache but not offered
                 if len(img_bytes) > 1000:
-                    cache_path.write_bytes(img_bytes)
                     return (img_bytes, f"steam:{matched_name}")
 
             except Exception:
@@ -3046,6 +4923,92 @@ def fetch_art_from_custom_http(*, timeout_s: int, platform_key: str, title: str)
     return None
 
 
+# ==========================
+# Metadata-based candidate ranking (automatic mode)
+# ==========================
+# Approximate delivered size of an IGDB cover (portrait, about 264:374) per size name
+IGDB_COVER_DIMS = {
+    "cover_small": (90, 128),
+    "cover_big": (264, 374),
+    "720p": (508, 720),
+    "1080p": (762, 1080),
+}
+
+# Relative weight of each signal in score_art_candidate
+AUTO_PICK_WEIGHTS = {
+    "resolution": 0.35,  # short side relative to the icon size, capped at 1
+    "aspect": 0.20,      # closeness to square (the icon is a square crop)
+    "votes": 0.15,       # SteamGridDB community score
+    "style": 0.10,       # position of the SteamGridDB style in square_styles
+    "format": 0.05,      # lossless source
+    "provider": 0.15,    # position of the provider in the configured order
+}
+
+def parse_resolution(text: Any) -> Optional[Tuple[int, int]]:
+    """Parse a "WxH" resolution string (TheGamesDB image records), or None."""
+    m = re.fullmatch(r"\s*(\d+)\s*x\s*(\d+)\s*", str(text or ""))
+    return (int(m.group(1)), int(m.group(2))) if m else None
+
+def art_candidate(provider: str, source: str, *, url: Optional[str] = None, fetch=None,
+                  width: Optional[int] = None, height: Optional[int] = None,
+                  mime: Optional[str] = None, style: Optional[str] = None,
+                  votes: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Artwork candidate described by provider metadata only. It is downloaded from url,
+    or, for providers that cannot be looked up without downloading (Libretro, Steam),
+    by calling fetch() -> Optional[(bytes, source_tag)].
+    """
+    return {"provider": provider, "source": source, "url": url, "fetch": fetch,
+            "width": width, "height": height, "mime": mime, "style": style, "votes": votes}
+
+def score_art_candidate(candidate: Dict[str, Any], out_size: int, provider_rank: int, provider_count: int,
+                        square_styles: List[str], weights: Optional[Dict[str, float]] = None) -> float:
+    """Expected quality of a candidate in [0, 1]; signals the metadata does not provide count as 0.5."""
+    weights = weights or AUTO_PICK_WEIGHTS
+    w, h = candidate.get("width"), candidate.get("height")
+    signals = {"resolution": 0.5, "aspect": 0.5, "votes": 0.5, "style": 0.5, "format": 0.5}
+    if w and h:
+        signals["resolution"] = min(1.0, min(w, h) / max(1, out_size))
+        signals["aspect"] = max(0.0, 1.0 - abs(math.log(w / h)) / math.log(2))
+    if candidate.get("votes") is not None:
+        votes = max(0.0, float(candidate["votes"]))
+        signals["votes"] = 0.25 + 0.75 * votes / (votes + 5.0)
+    if candidate.get("style") and square_styles:
+        style = candidate["style"]
+        signals["style"] = 1.0 - square_styles.index(style) / len(square_styles) if style in square_styles else 0.0
+    if candidate.get("mime"):
+        signals["format"] = 1.0 if candidate["mime"] == "image/png" else 0.6
+    signals["provider"] = 1.0 - provider_rank / max(1, provider_count - 1)
+    return sum(weights.get(k, 0.0) * v for k, v in signals.items())
+
+def rank_art_candidates(candidates: List[Dict[str, Any]], out_size: int, provider_order: List[str],
+                        square_styles: List[str], weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+    """Sort candidates best first (ties keep provider order), storing each one's 'rank_score'."""
+    ranks = {prov: i for i, prov in enumerate(provider_order)}
+    for c in candidates:
+        c["rank_score"] = score_art_candidate(c, out_size, ranks.get(c["provider"], len(provider_order)),
+                                              len(provider_order), square_styles, weights)
+    order = sorted(range(len(candidates)),
+                   key=lambda i: (-candidates[i]["rank_score"], ranks.get(candidates[i]["provider"], len(provider_order)), i))
+    return [candidates[i] for i in order]
+
+def fetch_art_candidate(candidate: Dict[str, Any], cache_dir: Path, timeout_s: int) -> Optional[Tuple[bytes, str]]:
+    """Download a ranked candidate. Returns (bytes, source_tag), or None if a deferred lookup finds nothing."""
+    if candidate.get("url"):
+        return read_or_download(candidate["url"], cache_dir, timeout_s), candidate["source"]
+    return candidate["fetch"]()
+
+def image_decodes(data) -> bool:
+    """True if data decodes as an image (JPEGs are checked at a reduced DCT scale)."""
+    try:
+        img = open_image(data)
+        img.draft("RGB", (64, 64))
+        img.load()
+        return True
+    except Exception:
+        return False
+
+
 # ==========================
 # Config Migration
 # ==========================
@@ -3086,6 +5049,72 @@ def migrate_legacy_art_sources(art_sources: dict) -> dict:
     return {"providers": providers, "mode": mode}  # Keep mode for reference
 
 
+def resolve_border_path(
+    platform_key: str,
+    pconf: dict,
+    borders_dir: Path,
+    custom_border_settings: Optional[Dict[str, Any]] = None,
+    border_path_override: Optional[str] = None,
+    callbacks=None
+) -> Optional[Path]:
+    """Pick the border for a platform. Returns None (and logs) when it is missing."""
+    # Check for border_path_override first (used for re-scrape from existing assets)
+    if border_path_override and Path(border_path_override).exists():
+        _emit_log(callbacks, f"[INFO] Using border override for {platform_key}")
+        return Path(border_path_override)
+
+    # Check for custom border override - now supports per-platform borders
+    custom_border_enabled = custom_border_settings.get("enabled", False) if custom_border_settings else False
+    custom_border_path_str = custom_border_settings.get("path", "") if custom_border_settings else ""
+    per_platform_borders = custom_border_settings.get("per_platform", {}) if custom_border_settings else {}
+
+    # Priority: 1) Per-platform custom border, 2) Global custom border, 3) Platform default border
+    if platform_key in per_platform_borders and per_platform_borders[platform_key] and Path(per_platform_borders[platform_key]).exists():
+        # Use per-platform custom border
+        _emit_log(callbacks, f"[INFO] Using per-platform custom border for {platform_key}")
+        return Path(per_platform_borders[platform_key])
+    if custom_border_enabled and custom_border_path_str and Path(custom_border_path_str).exists():
+        # Use global custom border for all platforms
+        _emit_log(callbacks, f"[INFO] Using global custom border for {platform_key}")
+        return Path(custom_border_path_str)
+
+    # Use platform-specific border (default)
+    border_file = pconf.get("border_file")
+    # For custom platforms, the border_file might be an absolute path
+    if border_file and Path(border_file).is_absolute() and Path(border_file).exists():
+        border_path = Path(border_file)
+    else:
+        border_path = borders_dir / border_file if border_file else None
+    if not border_path or not border_path.exists():
+        _emit_log(callbacks, f"[WARN] Missing border for {platform_key}: {border_path}")
+        return None
+    return border_path
+
+
+def run_batch_job(
+    config_path: Path,
+    items: List[tuple],
+    workers: int,
+    cancel: CancelToken,
+    callbacks=None,
+    **options
+) -> Tuple[bool, str]:
+    """
+    Run one job over an explicit list of (platform_key, title[, output_path[, border_path]])
+    items, e.g. the ROMs selected in the ROM browser or icons picked for re-scraping.
+
+    Config, dataset and providers are loaded once for the whole list and the
+    items are processed in parallel (in order, with look-ahead, in interactive
+    mode). An item with an output path is processed under its own title and
+    written there; without one, its title is matched against the platform's
+    dataset titles like run_job's search_term. Existing icons are skipped unless
+    force_rescrape is set. Other keyword options are passed to run_job.
+    """
+    items = [tuple(item) for item in items]
+    platforms = list(dict.fromkeys(item[0] for item in items))
+    return run_job(config_path, platforms, workers, 0, cancel, callbacks, items=items, **options)
+
+
 def run_job(
     config_path: Path,
     platforms: List[str],
@@ -3112,8 +5141,15 @@ def run_job(
     custom_border_settings: Optional[Dict[str, Any]] = None,
     force_rescrape: bool = False,
     output_path_override: Optional[str] = None,
-    border_path_override: Optional[str] = None
+    border_path_override: Optional[str] = None,
+    rebuild_offline: bool = False,
+    items: Optional[List[tuple]] = None
 ) -> Tuple[bool, str]:
+    """
+    Generate icons (and optional title/hero/screenshot images) for the dataset
+    titles of the given platforms, or, with items, for an explicit list of
+    titles (see run_batch_job). Returns (ok, message).
+    """
 
     config_path = Path(config_path)
     root = config_path.resolve().parent
@@ -3123,9 +5159,12 @@ def run_job(
     except Exception as e:
         return False, f"Failed to read config: {e}"
 
-    out_size = int(cfg.get("output_size", 1024))
-    export_format = str(cfg.get("export_format", "JPEG")).upper()
-    jpeg_quality = int(cfg.get("jpeg_quality", 95))
+    # Per-asset output settings (device profile over the global export settings)
+    output_profile = load_output_profile(cfg)
+    out_size = output_profile["icon"]["size"]
+    export_format = output_profile["icon"]["format"]
+    jpeg_quality = output_profile["icon"]["quality"]
+    export_preset = str(cfg.get("export_preset", DEFAULT_EXPORT_PRESET)).lower()
 
     paths = cfg.get("paths", {}) or {}
     borders_dir = root / paths.get("borders_dir", "./borders")
@@ -3137,10 +5176,39 @@ def run_job(
     for d in [borders_dir, output_dir, review_dir, cache_dir, dataset_cache_dir]:
         ensure_dir(d)
 
+    # Downloaded artwork cache (sharded, LRU-evicted beyond the budget)
+    artwork_cache_cfg = cfg.get("artwork_cache", {}) or {}
+    artwork_cache = get_artwork_cache(cache_dir, max_bytes=int(float(artwork_cache_cfg.get("max_size_mb", 2048)) * 1024 * 1024))
+    set_max_download_bytes(int(float(artwork_cache_cfg.get("max_download_mb", 64)) * 1024 * 1024))
+    if artwork_cache.migrated:
+        _emit_log(callbacks, f"[CACHE] Moved {artwork_cache.migrated} cached files into sharded folders")
+        artwork_cache.migrated = 0
+
+    device_profile = cfg.get("device_profile") or ""
+    if device_profile:
+        if device_profile in (cfg.get("device_profiles", {}) or {}):
+            _emit_log(callbacks, f"[PROFILE] Using device profile '{device_profile}' (icon {out_size}px {export_format})")
+        else:
+            _emit_log(callbacks, f"[PROFILE] Device profile '{device_profile}' not found in device_profiles, using defaults")
+
     platforms_cfg = cfg.get("platforms", {}) or {}
     platform_aliases = cfg.get("platform_aliases", {}) or {}
     platform_hints_cfg = cfg.get("sgdb_platform_hints", {}) or {}
 
+    # Offline rebuild: re-render existing icons from cached sources, no dataset or providers needed
+    if rebuild_offline:
+        return rebuild_icons_offline(
+            cfg=cfg,
+            platforms=platforms,
+            output_dir=output_dir,
+            cache_dir=cache_dir,
+            borders_dir=borders_dir,
+            cancel=cancel,
+            callbacks=callbacks,
+            custom_border_settings=custom_border_settings,
+            border_path_override=border_path_override
+        )
+
     # Dataset
     dataset_cfg = cfg.get("dataset", {}) or {}
     repo_zip_url = dataset_cfg.get("repo_zip_url")
@@ -3245,23 +5313,9 @@ def run_job(
     steam_timeout = int(steam_cfg.get("request_timeout_seconds", 30))
     steam_delay = float(steam_cfg.get("delay_seconds", 0.25))
 
-    # Auto-centering config
-    ac = cfg.get("auto_centering", {}) or {}
-    ac_enabled = bool(ac.get("enabled", True))
-    ac_sources = set(ac.get("sources", ["libretro_boxart"]))
-    ac_tolerance = float(ac.get("tolerance", 0.06))
-    ac_steps = int(ac.get("search_steps", 5))
-    ac_span = float(ac.get("search_span", 0.22))
-    ac_alpha_threshold = int(ac.get("alpha_threshold", 16))
-    ac_margin_pct = float(ac.get("margin_pct", 0.06))
-
-    # Logo detection config
-    ld = cfg.get("logo_detection", {}) or {}
-    ld_enabled = bool(ld.get("enabled", False))
-    ld_method = str(ld.get("method", "auto"))
-    ld_sources = set(ld.get("sources", ["libretro_boxart", "steamgriddb_square"]))
-    ld_min_content = float(ld.get("min_content_ratio", 0.15))
-    ld_max_crop = float(ld.get("max_crop_ratio", 0.85))
+    # Auto-centering and logo detection config
+    render_settings = load_render_settings(cfg)
+    ac_tolerance = render_settings["ac_tolerance"]
 
     # Fallback icon config (from UI or config)
     fallback_cfg = fallback_settings or cfg.get("fallback_icons", {}) or {}
@@ -3303,140 +5357,167 @@ def run_job(
     if cancel.is_cancelled:
         return False, "Cancelled."
 
-    # Load dataset
-    _emit_log(callbacks, "[DATASET] Loading game database...")
-    dataset_root = download_and_extract_zip(repo_zip_url, dataset_cache_dir, log_cb=callbacks)
-    dataset_platform_to_titles = load_dataset_platform_titles(dataset_root, gamesdb_subdir)
-    _emit_log(callbacks, f"[DATASET] Found {len(dataset_platform_to_titles)} platform JSONs.")
+    # Load dataset (not needed when every item already names its output file)
+    dataset_platform_to_titles: Mapping[str, List[str]] = {}
+    if items is None or any(len(item) < 3 or not item[2] for item in items):
+        _emit_log(callbacks, "[DATASET] Loading game database...")
+        dataset_zip = download_dataset_zip(
+            repo_zip_url, dataset_cache_dir, log_cb=callbacks,
+            refresh_hours=float(dataset_cfg.get("refresh_hours", DATASET_REFRESH_HOURS)),
+        )
+        dataset_platform_to_titles = load_dataset(dataset_zip, gamesdb_subdir, dataset_cache_dir, log_cb=callbacks)
+        _emit_log(callbacks, f"[DATASET] Found {len(dataset_platform_to_titles)} platform JSONs.")
+    wikipedia_cache_hours = float(dataset_cfg.get("wikipedia_cache_hours", WIKIPEDIA_CACHE_HOURS))
 
     # Build task list
     tasks = []
 
-    for platform_key in platforms:
-        if cancel.is_cancelled:
-            return False, "Cancelled."
-
-        pconf = platforms_cfg.get(platform_key, {})
+    # Get the correct file extension for the export format
+    file_ext = get_export_extension(export_format)
+
+    if items is not None:
+        # Explicit (platform_key, title[, output_path[, border_path]]) items. Borders and
+        # dataset titles are resolved once per platform; an item without an output path
+        # is matched against its platform's titles like search_term
+        item_borders: Dict[Tuple[str, Optional[str]], Optional[Path]] = {}
+        item_titles: Dict[str, List[str]] = {}
+        planned_paths = set()
+        skipped_existing = 0
+        for item in items:
+            if cancel.is_cancelled:
+                return False, "Cancelled."
+            platform_key, title, item_output, item_border = (tuple(item) + (None, None))[:4]
+            pconf = platforms_cfg.get(platform_key, {})
+
+            border_key = (platform_key, item_border or border_path_override)
+            if border_key not in item_borders:
+                item_borders[border_key] = resolve_border_path(
+                    platform_key, pconf, borders_dir,
+                    custom_border_settings=custom_border_settings,
+                    border_path_override=border_key[1],
+                    callbacks=callbacks
+                )
+            border_path = item_borders[border_key]
+            if border_path is None:
+                continue
 
-        # Check for border_path_override first (used for re-scrape from existing assets)
-        if border_path_override and Path(border_path_override).exists():
-            border_path = Path(border_path_override)
-            _emit_log(callbacks, f"[INFO] Using border override for {platform_key}")
-        else:
-            # Check for custom border override - now supports per-platform borders
-            custom_border_enabled = custom_border_settings.get("enabled", False) if custom_border_settings else False
-            custom_border_path_str = custom_border_settings.get("path", "") if custom_border_settings else ""
-            per_platform_borders = custom_border_settings.get("per_platform", {}) if custom_border_settings else {}
-
-            # Priority: 1) Per-platform custom border, 2) Global custom border, 3) Platform default border
-            if platform_key in per_platform_borders and per_platform_borders[platform_key] and Path(per_platform_borders[platform_key]).exists():
-                # Use per-platform custom border
-                border_path = Path(per_platform_borders[platform_key])
-                _emit_log(callbacks, f"[INFO] Using per-platform custom border for {platform_key}")
-            elif custom_border_enabled and custom_border_path_str and Path(custom_border_path_str).exists():
-                # Use global custom border for all platforms
-                border_path = Path(custom_border_path_str)
-                _emit_log(callbacks, f"[INFO] Using global custom border for {platform_key}")
+            if item_output:
+                out_path = Path(item_output)
+                rev_plat = out_path.parent  # Use same folder for review
             else:
-                # Use platform-specific border (default)
-                border_file = pconf.get("border_file")
-                # For custom platforms, the border_file might be an absolute path
-                if border_file and Path(border_file).is_absolute() and Path(border_file).exists():
-                    border_path = Path(border_file)
-                else:
-                    border_path = borders_dir / border_file if border_file else None
-                if not border_path or not border_path.exists():
-                    _emit_log(callbacks, f"[WARN] Missing border for {platform_key}: {border_path}")
-                    continue
+                if platform_key not in item_titles:
+                    try:
+                        _, item_titles[platform_key] = resolve_platform_titles(
+                            dataset_platform_to_titles,
+                            platform_aliases,
+                            platform_key,
+                            platform_config=pconf,
+                            callbacks=callbacks,
+                            cache_dir=dataset_cache_dir,
+                            wikipedia_cache_hours=wikipedia_cache_hours,
+                        )
+                    except Exception as e:
+                        _emit_log(callbacks, f"[WARN] {e}")
+                        item_titles[platform_key] = []
+                title = match_search_title(title, item_titles[platform_key], platform_key, callbacks)
+                iisu_folder_name = get_iisu_folder_name(platform_key)
+                rev_plat = review_dir / iisu_folder_name
+                ensure_dir(output_dir / iisu_folder_name)
+                ensure_dir(rev_plat)
+                out_path = output_dir / iisu_folder_name / safe_slug(title) / f"icon.{file_ext}"
+
+            # Two items resolving to the same icon (e.g. ROM dumps of one game) are processed once
+            if out_path in planned_paths:
+                continue
+            planned_paths.add(out_path)
 
-        try:
-            _, titles = resolve_platform_titles(
-                dataset_platform_to_titles,
-                platform_aliases,
-                platform_key,
-                platform_config=pconf,
+            # Skip if already exists (unless force_rescrape is True)
+            if out_path.exists() and not force_rescrape:
+                skipped_existing += 1
+                continue
+            tasks.append((platform_key, title, border_path, out_path, rev_plat))
+        if skipped_existing:
+            _emit_log(callbacks, f"[PLAN] Skipped {skipped_existing} of {len(items)} items that already have icons")
+    else:
+        for platform_key in platforms:
+            if cancel.is_cancelled:
+                return False, "Cancelled."
+
+            pconf = platforms_cfg.get(platform_key, {})
+
+            border_path = resolve_border_path(
+                platform_key, pconf, borders_dir,
+                custom_border_settings=custom_border_settings,
+                border_path_override=border_path_override,
                 callbacks=callbacks
             )
-        except Exception as e:
-            _emit_log(callbacks, f"[WARN] {e}")
-            # If we have a search_term, we can still proceed without a database match
-            if search_term:
-                titles = []
-                _emit_log(callbacks, f"[INFO] Platform {platform_key} not in database, will use search term directly")
-            else:
+            if border_path is None:
                 continue
 
-        # For re-scrape with output_path_override, use search_term directly as title
-        # This bypasses database lookup for existing assets
-        if output_path_override and search_term:
-            titles = [search_term]
-            _emit_log(callbacks, f"[INFO] Re-scrape mode: using search term '{search_term}' directly")
-        # Apply search/filter before limit
-        elif search_term:
-            # When user explicitly searches for something, only return that specific game
-            # Don't return multiple fuzzy matches - user wants exactly what they searched for
-            if titles:
-                # Try to find an exact or near-exact match in the database
-                fuzzy_matches = fuzzy_match_title(search_term, titles, threshold=0.7)  # Higher threshold for explicit search
-
-                if fuzzy_matches:
-                    # Only use the BEST match, not multiple - user searched for a specific game
-                    best_match, best_score = fuzzy_matches[0]
-                    # Only use database match if it's a very good match (>= 0.85)
-                    # Otherwise use the search term directly to let the API find it
-                    if best_score >= 0.85:
-                        titles = [best_match]
-                        _emit_log(callbacks, f"[FILTER] Search '{search_term}' on {platform_key}: Found exact match '{best_match}' (score: {best_score:.2f})")
-                    else:
-                        # Score not high enough - use search term directly
-                        titles = [search_term]
-                        _emit_log(callbacks, f"[FILTER] Search '{search_term}' on {platform_key}: No exact match (best: {best_score:.2f}), using search term directly")
+            try:
+                _, titles = resolve_platform_titles(
+                    dataset_platform_to_titles,
+                    platform_aliases,
+                    platform_key,
+                    platform_config=pconf,
+                    callbacks=callbacks,
+                    cache_dir=dataset_cache_dir,
+                    wikipedia_cache_hours=wikipedia_cache_hours,
+                )
+            except Exception as e:
+                _emit_log(callbacks, f"[WARN] {e}")
+                # If we have a search_term, we can still proceed without a database match
+                if search_term:
+                    titles = []
+                    _emit_log(callbacks, f"[INFO] Platform {platform_key} not in database, will use search term directly")
                 else:
-                    # No fuzzy matches - use search term directly
-                    titles = [search_term]
-                    _emit_log(callbacks, f"[FILTER] Search '{search_term}' on {platform_key}: No database match, using search term directly")
-            else:
-                # No database titles available - use search term directly
+                    continue
+
+            # For re-scrape with output_path_override, use search_term directly as title
+            # This bypasses database lookup for existing assets
+            if output_path_override and search_term:
                 titles = [search_term]
-                _emit_log(callbacks, f"[FILTER] Search '{search_term}' on {platform_key}: No database, using search term directly")
-        elif letter_filter and letter_filter != "All":
-            # Filter by starting letter
-            if letter_filter == "0-9":
-                titles = [t for t in titles if t[0].isdigit()]
-            elif letter_filter == "#":
-                titles = [t for t in titles if not t[0].isalnum()]
-            else:
-                titles = [t for t in titles if t[0].upper() == letter_filter.upper()]
-            _emit_log(callbacks, f"[FILTER] Letter '{letter_filter}' on {platform_key}: {len(titles)} matches")
-
-        if per_platform_limit > 0:
-            titles = titles[:per_platform_limit]
-
-        # Use iiSU folder naming convention (lowercase shorthand like "gb", "gc", "n3ds")
-        iisu_folder_name = get_iisu_folder_name(platform_key)
-        out_plat = output_dir / iisu_folder_name
-        rev_plat = review_dir / iisu_folder_name
-        ensure_dir(out_plat)
-        ensure_dir(rev_plat)
-
-        # Get the correct file extension for the export format
-        file_ext = get_export_extension(export_format)
-
-        for title in titles:
-            # If output_path_override is provided, use it directly (for re-scrape of existing assets)
-            if output_path_override:
-                out_path = Path(output_path_override)
-                rev_plat = out_path.parent  # Use same folder for review
-                _emit_log(callbacks, f"[DEBUG] Using output_path_override: {out_path}")
-            else:
-                # Create folder per game with icon and title images
-                game_folder = out_plat / safe_slug(title)
-                out_path = game_folder / f"icon.{file_ext}"
+                _emit_log(callbacks, f"[INFO] Re-scrape mode: using search term '{search_term}' directly")
+            # Apply search/filter before limit
+            elif search_term:
+                # When user explicitly searches for something, only return that specific game
+                # Don't return multiple fuzzy matches - user wants exactly what they searched for
+                titles = [match_search_title(search_term, titles, platform_key, callbacks)]
+            elif letter_filter and letter_filter != "All":
+                # Filter by starting letter
+                if letter_filter == "0-9":
+                    titles = [t for t in titles if t[0].isdigit()]
+                elif letter_filter == "#":
+                    titles = [t for t in titles if not t[0].isalnum()]
+                else:
+                    titles = [t for t in titles if t[0].upper() == letter_filter.upper()]
+                _emit_log(callbacks, f"[FILTER] Letter '{letter_filter}' on {platform_key}: {len(titles)} matches")
+
+            if per_platform_limit > 0:
+                titles = titles[:per_platform_limit]
+
+            # Use iiSU folder naming convention (lowercase shorthand like "gb", "gc", "n3ds")
+            iisu_folder_name = get_iisu_folder_name(platform_key)
+            out_plat = output_dir / iisu_folder_name
+            rev_plat = review_dir / iisu_folder_name
+            ensure_dir(out_plat)
+            ensure_dir(rev_plat)
+
+            for title in titles:
+                # If output_path_override is provided, use it directly (for re-scrape of existing assets)
+                if output_path_override:
+                    out_path = Path(output_path_override)
+                    rev_plat = out_path.parent  # Use same folder for review
+                    _emit_log(callbacks, f"[DEBUG] Using output_path_override: {out_path}")
+                else:
+                    # Create folder per game with icon and title images
+                    game_folder = out_plat / safe_slug(title)
+                    out_path = game_folder / f"icon.{file_ext}"
 
-            # Skip if already exists (unless force_rescrape is True)
-            if out_path.exists() and not force_rescrape:
-                continue
-            tasks.append((platform_key, title, border_path, out_path, rev_plat))
+                # Skip if already exists (unless force_rescrape is True)
+                if out_path.exists() and not force_rescrape:
+                    continue
+                tasks.append((platform_key, title, border_path, out_path, rev_plat))
 
     total = len(tasks)
     _emit_log(callbacks, f"[DEBUG] Total tasks: {total}, force_rescrape={force_rescrape}, output_path_override={output_path_override}")
@@ -3446,63 +5527,119 @@ def run_job(
     _emit_progress(callbacks, 0, total)
     _emit_log(callbacks, f"[PLAN] Queued {total} images. Workers={workers}")
 
+    # Manifest of generated assets (output_dir/manifest.sqlite)
+    try:
+        manifest = open_manifest(output_dir)
+    except Exception as e:
+        manifest = None
+        _emit_log(callbacks, f"[MANIFEST] Could not open manifest: {e}")
+
+    # Rendering and encoding run here, so the download workers can move on to
+    # the next request while images are being compressed
+    encode_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="encode")
+    # Completion stage: waits for a title's encodes, then writes the title image,
+    # preview and manifest row. Download workers hand a title over and move on.
+    finish_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="finish")
+    # Titles handed over but not finished; bounds the downloaded images held in memory
+    finish_slots = threading.Semaphore(max(2, 2 * max(1, int(workers))))
+
+    def abandon_item(out_path: Path, icon_future: Optional[Future], logo_future: Optional[Future],
+                     pending_encodes: List[Tuple[Future, str, str]]) -> None:
+        """Drop the encodes of a title that will not reach the manifest.
+
+        Queued encodes are cancelled. An icon that is already being written is
+        removed once done, so the next run retries the title instead of skipping
+        a folder the manifest does not know about.
+        """
+        for fut in [logo_future] + [f for f, _, _ in pending_encodes]:
+            if fut is not None:
+                fut.cancel()
+        if icon_future is None or icon_future.cancel():
+            return
+
+        def remove_icon(f: Future) -> None:
+            if not f.cancelled() and f.exception() is None:
+                try:
+                    out_path.unlink()
+                except OSError:
+                    pass
+
+        icon_future.add_done_callback(remove_icon)
+
+    def encode_file(img_bytes, path: Path, spec: Dict[str, Any]) -> List[str]:
+        """Write one downloaded image (plus its size variants); returns the file names."""
+        w, h = open_image(img_bytes).size
+        # Already in the export format and size: keep the downloaded file as served
+        passthrough = not needs_reencode(img_bytes, spec["format"], spec["max_size"])
+        if passthrough:
+            write_bytes_atomic(img_bytes, path)
+            if not spec["variants"]:
+                return [path.name]
+            scale = min(1.0, spec["variants"][0] / float(max(w, h)))
+        else:
+            scale = fit_scale((w, h), spec["max_size"])
+        # Decode no larger than the largest output needs
+        img = decode_image(img_bytes, min_short_side=int(math.ceil(min(w, h) * scale)))
+        img = ImageOps.exif_transpose(img).convert("RGBA")
+        if not passthrough:
+            img = export_image(img, path, spec, preset=export_preset)
+        return [path.name] + export_variants(img, path, spec, preset=export_preset)
+
+    def encode_icon_variants(icon_img: Optional[Image.Image], icon_path: Path) -> List[str]:
+        if icon_img is None:
+            with Image.open(icon_path) as im:
+                icon_img = im.convert("RGBA")
+        return export_variants(icon_img, icon_path, output_profile["icon"], preset=export_preset)
+
+    border_hashes: Dict[str, str] = {}
+    border_hash_lock = threading.Lock()
+
+    def get_border_hash(border_path: Path) -> Optional[str]:
+        key = str(border_path)
+        with border_hash_lock:
+            if key not in border_hashes:
+                try:
+                    border_hashes[key] = sha256_file(border_path)
+                except Exception:
+                    return None
+            return border_hashes[key]
+
     done = 0
     done_lock = threading.Lock()
     errors = 0
 
-    # Prefetch cache for interactive mode - DISABLED to reduce memory usage
-    # With large ROM collections (1000+), prefetching doubles memory consumption
-    # as it holds artwork for the next game while current game is being processed
-    prefetch_cache: Dict[str, List[Dict[str, Any]]] = {}
-    prefetch_lock = threading.Lock()
-    prefetch_thread: Optional[threading.Thread] = None
-    PREFETCH_ENABLED = False  # Set to True to re-enable prefetching
-
-    def prefetch_artwork(platform_key: str, title: str, hints: List[str], cache_key: str):
-        """Prefetch artwork in background and store in cache."""
-        if not PREFETCH_ENABLED:
-            return
-        try:
-            options = fetch_all_artwork_options_impl(platform_key, title, hints)
-            with prefetch_lock:
-                prefetch_cache[cache_key] = options
-        except Exception as e:
-            _emit_log(callbacks, f"[PREFETCH] Failed for {title}: {e}")
-
-    def start_prefetch(platform_key: str, title: str, hints: List[str]):
-        """Start prefetching artwork for a game in the background."""
-        if not PREFETCH_ENABLED:
-            return  # Prefetching disabled for memory optimization
-        nonlocal prefetch_thread
-        cache_key = f"{platform_key}:{title}"
-        with prefetch_lock:
-            if cache_key in prefetch_cache:
-                return  # Already cached
-        prefetch_thread = threading.Thread(
-            target=prefetch_artwork,
-            args=(platform_key, title, hints, cache_key),
-            daemon=True
+    auto_pick_cfg = cfg.get("auto_pick", {}) or {}
+    auto_pick_enabled = bool(auto_pick_cfg.get("enabled", True))
+    auto_pick_fallbacks = max(0, int(auto_pick_cfg.get("fallback_candidates", 2)))
+    auto_pick_weights = dict(AUTO_PICK_WEIGHTS, **(auto_pick_cfg.get("weights", {}) or {}))
+
+    dedupe_cfg = cfg.get("artwork_dedupe", {}) or {}
+    dedupe_enabled = bool(dedupe_cfg.get("enabled", True))
+    dedupe_distance = int(dedupe_cfg.get("max_distance", DEDUPE_MAX_DISTANCE))
+
+    # Interactive mode looks ahead: options for the next titles are fetched in the
+    # background while the user picks, spilling their images to the artwork cache
+    prefetch_cfg = cfg.get("interactive_prefetch", {}) or {}
+    prefetcher: Optional[ArtworkPrefetcher] = None
+    if interactive_mode and not skip_scraping and int(prefetch_cfg.get("depth", 2) or 0) > 0:
+        prefetcher = ArtworkPrefetcher(
+            lambda platform_key, title, hints: fetch_all_artwork_options_impl(platform_key, title, hints),
+            cache_dir,
+            depth=int(prefetch_cfg.get("depth", 2)),
+            max_memory_bytes=int(float(prefetch_cfg.get("max_memory_mb", 16)) * 1024 * 1024),
+            max_disk_bytes=int(float(prefetch_cfg.get("max_disk_mb", 256)) * 1024 * 1024),
+            log=lambda m: _emit_log(callbacks, m),
         )
-        prefetch_thread.start()
 
     def get_prefetched_or_fetch(platform_key: str, title: str, hints: List[str]) -> List[Dict[str, Any]]:
         """Get prefetched artwork if available, otherwise fetch now."""
-        nonlocal prefetch_thread
-        cache_key = f"{platform_key}:{title}"
-
-        # Check if prefetch is in progress for this game
-        if prefetch_thread is not None and prefetch_thread.is_alive():
-            # Wait for prefetch to complete (with timeout)
-            prefetch_thread.join(timeout=35)
-
-        # Check cache
-        with prefetch_lock:
-            if cache_key in prefetch_cache:
-                options = prefetch_cache.pop(cache_key)
-                _emit_log(callbacks, f"[PREFETCH] Using cached artwork for {title} ({len(options)} options)")
+        if prefetcher is not None:
+            options = prefetcher.take(f"{platform_key}:{title}", timeout=35)
+            if options is not None:
+                _emit_log(callbacks, f"[PREFETCH] Using prefetched artwork for {title} ({len(options)} options)")
                 return options
 
-        # Not in cache, fetch now
+        # Not prefetched, fetch now
         return fetch_all_artwork_options_impl(platform_key, title, hints)
 
     def fetch_all_artwork_options(platform_key: str, title: str, hints: List[str]) -> List[Dict[str, Any]]:
@@ -3512,7 +5649,11 @@ def run_job(
     def fetch_all_artwork_options_impl(platform_key: str, title: str, hints: List[str]) -> List[Dict[str, Any]]:
         """
         Fetch ALL artwork options from ALL providers IN PARALLEL (doesn't stop at first match).
-        Returns list of dicts with keys: 'image_data' (bytes), 'source' (str), 'provider' (str)
+        Returns list of dicts with keys: 'image_data' (bytes), 'source' (str), 'provider' (str),
+        'full_url' (str or None) and 'width'/'height' (int) when known.
+
+        SteamGridDB, IGDB and TheGamesDB options carry thumbnails only; the chosen
+        option is downloaded at full size via download_selected_artwork().
         """
         options = []
         options_lock = threading.Lock()
@@ -3522,7 +5663,7 @@ def run_job(
                 return
             try:
                 _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - Fetching from steamgriddb...")
-                results = fetch_multiple_art_from_steamgriddb(
+                results = fetch_previews_from_steamgriddb(
                     api_key=api_key,
                     base_url=base_url,
                     timeout_s=timeout_s,
@@ -3537,13 +5678,10 @@ def run_job(
                     platform_hints=hints,
                     callbacks=callbacks,
                 )
-                with options_lock:
-                    for img_bytes, source_tag in results:
-                        options.append({
-                            'image_data': img_bytes,
-                            'source': source_tag,
-                            'provider': 'steamgriddb'
-                        })
+                with options_lock:
+                    for opt in results:
+                        opt['provider'] = 'steamgriddb'
+                        options.append(opt)
                 _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - Found {len(results)} from steamgriddb")
             except Exception as e:
                 _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - steamgriddb failed: {type(e).__name__}: {e}")
@@ -3582,7 +5720,7 @@ def run_job(
                 return
             try:
                 _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - Fetching from igdb...")
-                got = fetch_art_from_igdb(
+                got = fetch_preview_from_igdb(
                     client_id=igdb_client_id,
                     client_secret=igdb_client_secret,
                     base_url=igdb_base_url,
@@ -3596,13 +5734,9 @@ def run_job(
                     debug_log=lambda m: _emit_log(callbacks, m),
                 )
                 if got:
-                    img_bytes, source_tag = got
+                    got['provider'] = 'igdb'
                     with options_lock:
-                        options.append({
-                            'image_data': img_bytes,
-                            'source': source_tag,
-                            'provider': 'igdb'
-                        })
+                        options.append(got)
                     _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - Found 1 from igdb")
             except Exception as e:
                 _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - igdb failed: {type(e).__name__}: {e}")
@@ -3612,7 +5746,7 @@ def run_job(
                 return
             try:
                 _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - Fetching from thegamesdb...")
-                got = fetch_art_from_thegamesdb(
+                got = fetch_preview_from_thegamesdb(
                     api_key=tgdb_api_key,
                     base_url=tgdb_base_url,
                     timeout_s=tgdb_timeout,
@@ -3625,13 +5759,9 @@ def run_job(
                     debug_log=lambda m: _emit_log(callbacks, m),
                 )
                 if got:
-                    img_bytes, source_tag = got
+                    got['provider'] = 'thegamesdb'
                     with options_lock:
-                        options.append({
-                            'image_data': img_bytes,
-                            'source': source_tag,
-                            'provider': 'thegamesdb'
-                        })
+                        options.append(got)
                     _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - Found 1 from thegamesdb")
             except Exception as e:
                 _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - thegamesdb failed: {type(e).__name__}: {e}")
@@ -3704,8 +5834,148 @@ def run_job(
         for t in threads:
             t.join(timeout=30)  # 30 second timeout per provider
 
+        # Dimensions from the cache index, so callers can filter without decoding
+        # (previews already carry the provider-reported full-size dimensions)
+        with options_lock:
+            for opt in options:
+                if 'width' in opt or opt.get('full_url'):
+                    continue
+                info = cached_image_info(cache_dir, opt['image_data'])
+                if info:
+                    opt['width'] = info['width']
+                    opt['height'] = info['height']
+
+        if dedupe_enabled and len(options) > 1:
+            before = len(options)
+            options = dedupe_artwork_options(options, max_distance=dedupe_distance)
+            if len(options) < before:
+                _emit_log(callbacks, f"[INTERACTIVE] {platform_key}: {title} - Collapsed {before - len(options)} near-duplicate option(s)")
+
         return options
 
+    def list_art_candidates(platform_key: str, title: str, hints: List[str]) -> List[Dict[str, Any]]:
+        """
+        Look up every enabled provider IN PARALLEL for candidate metadata (no image downloads).
+        Libretro, Steam and custom HTTP expose nothing to rank before downloading, so they
+        contribute one deferred candidate each that runs their normal fetch when tried.
+        """
+        candidates: List[Dict[str, Any]] = []
+        candidates_lock = threading.Lock()
+        dbg = lambda m: _emit_log(callbacks, m)
+
+        def add(*items):
+            with candidates_lock:
+                candidates.extend(c for c in items if c)
+
+        def from_steamgriddb():
+            grids = _select_steamgriddb_grids(
+                api_key=api_key, base_url=base_url, timeout_s=timeout_s, delay_s=delay_s,
+                allow_animated=allow_animated, prefer_dim=prefer_dim, square_styles=square_styles,
+                square_only=sg_square_only, title=title, platform_hints=hints, callbacks=callbacks,
+            )
+            add(*(art_candidate("steamgriddb", "steamgriddb_square", url=g.get("url"),
+                                width=g.get("width"), height=g.get("height"), mime=g.get("mime"),
+                                style=g.get("style"), votes=g.get("score", 0))
+                  for g in grids if g.get("url")))
+
+        def from_igdb():
+            image_id = _find_igdb_cover_id(
+                client_id=igdb_client_id, client_secret=igdb_client_secret, base_url=igdb_base_url,
+                timeout_s=igdb_timeout, delay_s=igdb_delay, platform_map=igdb_platform_map,
+                platform_key=platform_key, title=title, log=dbg,
+            )
+            if image_id:
+                w, h = IGDB_COVER_DIMS.get(igdb_cover_size, (None, None))
+                add(art_candidate("igdb", "igdb_cover", url=igdb_image_url(image_id, igdb_cover_size),
+                                  width=w, height=h, mime="image/jpeg"))
+
+        def from_thegamesdb():
+            found = _find_thegamesdb_image(
+                api_key=tgdb_api_key, base_url=tgdb_base_url, timeout_s=tgdb_timeout, delay_s=tgdb_delay,
+                platform_map=tgdb_platform_map, prefer_image_type=tgdb_image_type,
+                platform_key=platform_key, title=title, log=dbg,
+            )
+            if found:
+                base_urls, image = found
+                w, h = parse_resolution(image.get("resolution")) or (None, None)
+                add(art_candidate("thegamesdb", "thegamesdb_boxart",
+                                  url=f"{base_urls['original']}{image.get('filename')}", width=w, height=h))
+
+        def deferred_libretro():
+            if not lr_playlist_map.get(platform_key):
+                return None
+            return art_candidate("libretro", "libretro_boxart", mime="image/png", fetch=lambda: fetch_art_from_libretro(
+                lr_base=lr_base, lr_type_dir=lr_type_dir, lr_playlist_map=lr_playlist_map, timeout_s=timeout_s,
+                platform_key=platform_key, title=title, cache_dir=cache_dir, use_index_matching=use_index_matching,
+                index_cache_hours=index_cache_hours, debug_log=dbg))
+
+        def deferred_steam():
+            # Steam headers are always 460x215
+            return art_candidate("steam", "steam_header", width=460, height=215, mime="image/jpeg", fetch=lambda: fetch_art_from_steam(
+                timeout_s=steam_timeout, delay_s=steam_delay, platform_key=platform_key, title=title,
+                cache_dir=cache_dir, debug_log=dbg))
+
+        def deferred_custom_http():
+            return art_candidate("custom_http", "custom_http", fetch=lambda: fetch_art_from_custom_http(
+                timeout_s=timeout_s, platform_key=platform_key, title=title))
+
+        deferred = {"libretro": deferred_libretro, "steam": deferred_steam, "custom_http": deferred_custom_http}
+        lookups = {"steamgriddb": from_steamgriddb, "igdb": from_igdb, "thegamesdb": from_thegamesdb}
+
+        def run_lookup(prov):
+            try:
+                lookups[prov]()
+            except Exception as e:
+                _emit_log(callbacks, f"[DB] {platform_key}: {title} - {prov} lookup failed: {type(e).__name__}: {e}")
+
+        threads = []
+        for prov in provider_order:
+            if prov in lookups:
+                t = threading.Thread(target=run_lookup, args=(prov,), daemon=True)
+                threads.append(t)
+                t.start()
+            elif prov in deferred:
+                add(deferred[prov]())
+        for t in threads:
+            t.join(timeout=30)
+
+        with candidates_lock:
+            return list(candidates)
+
+    def auto_pick_artwork(platform_key: str, title: str, hints: List[str]) -> Optional[Tuple[bytes, str]]:
+        """
+        Rank every provider's candidates by metadata and download only the best one,
+        moving on to the next after a download or decode failure (at most
+        auto_pick_fallbacks times; deferred lookups that find nothing do not count).
+        """
+        ranked = rank_art_candidates(list_art_candidates(platform_key, title, hints), out_size,
+                                     provider_order, square_styles, auto_pick_weights)
+        if not ranked:
+            return None
+        top = [(c["source"], round(c["rank_score"], 3)) for c in ranked[:3]]
+        _emit_log(callbacks, f"[DB] {platform_key}: {title} - Ranked {len(ranked)} candidates, top: {top}")
+
+        failures = 0
+        for cand in ranked:
+            if cancel.is_cancelled or failures > auto_pick_fallbacks:
+                break
+            try:
+                got = fetch_art_candidate(cand, cache_dir, timeout_s)
+            except Exception as e:
+                _emit_log(callbacks, f"[DB] {platform_key}: {title} - {cand['source']} download failed: {type(e).__name__}: {e}")
+                failures += 1
+                continue
+            if not got:
+                _emit_log(callbacks, f"[DB] {platform_key}: {title} - Not found in {cand['provider']}")
+                continue
+            if not image_decodes(got[0]):
+                _emit_log(callbacks, f"[DB] {platform_key}: {title} - {cand['source']} image does not decode, trying next candidate")
+                failures += 1
+                continue
+            _emit_log(callbacks, f"[DB] {platform_key}: {title} - Picked {got[1]} (score {cand['rank_score']:.3f})")
+            return got
+        return None
+
     def find_fallback_icon(platform_key: str) -> Optional[bytes]:
         """
         Find and load a fallback icon for the given platform.
@@ -3747,17 +6017,20 @@ def run_job(
 
         return None
 
-    def work_item(platform_key: str, title: str, border_path: Path, out_path: Path, rev_dir: Path) -> bool:
+    def work_item(platform_key: str, title: str, border_path: Path, out_path: Path, rev_dir: Path) -> Any:
+        """Fetch one title's artwork and hand it to finish_item; returns False or the completion future."""
         nonlocal errors
 
         if cancel.is_cancelled:
             return False
 
+        _emit_current_item(callbacks, title, platform_key)
         slug = safe_slug(title)
         hints = platform_hints_cfg.get(platform_key, []) or []
 
         img_bytes = None
         source_tag = None
+        source_url = None
 
         # Skip scraping mode - just use platform icon directly
         if skip_scraping:
@@ -3847,15 +6120,40 @@ def run_job(
                 elif 0 <= selected_index < len(artwork_options):
                     # User selected an option
                     selected = artwork_options[selected_index]
-                    img_bytes = selected['image_data']
                     source_tag = selected['source']
                     _emit_log(callbacks, f"[SELECTED] {platform_key}: {title} - User selected from {source_tag}")
+                    try:
+                        img_bytes = download_selected_artwork(selected, cache_dir, timeout_s)
+                    except Exception as e:
+                        _emit_log(callbacks, f"[ERROR] {platform_key}: {title} - Full-size download failed: {type(e).__name__}: {e}")
+                        (rev_dir / f"{slug}__download_error.json").write_text(
+                            json.dumps({
+                                "title": title,
+                                "platform": platform_key,
+                                "source": source_tag,
+                                "url": selected.get('full_url'),
+                                "error": str(e)
+                            }, indent=2),
+                            encoding="utf-8"
+                        )
+                        return False
                 else:
                     _emit_log(callbacks, f"[ERROR] {platform_key}: {title} - Invalid selection index")
                     return False
 
+        # Automatic mode, ranked: compare all providers' metadata, download only the winner
+        elif not skip_scraping and auto_pick_enabled:
+            _note_source_url(None)
+            got = auto_pick_artwork(platform_key, title, hints)
+            if cancel.is_cancelled:
+                return False
+            if got:
+                img_bytes, source_tag = got
+                source_url = get_last_source_url()
+
         # Automatic mode: try each provider in order until one works
         elif not skip_scraping:
+            _note_source_url(None)
             for prov in provider_order:
                 if cancel.is_cancelled:
                     return False
@@ -3979,6 +6277,9 @@ def run_job(
                     else:
                         _emit_log(callbacks, f"[DB] {platform_key}: {title} - Not found in Custom HTTP")
 
+            if img_bytes is not None:
+                source_url = get_last_source_url()
+
         if img_bytes is None:
             # Try fallback icon if enabled
             if use_fallback:
@@ -4012,54 +6313,25 @@ def run_job(
                 )
                 return False
 
+        icon_future = None
+        logo_future = None
+        pending_encodes = []
         try:
-            src_img = Image.open(BytesIO(img_bytes))
-
-            # Logo detection and cropping if enabled and source matches
-            if ld_enabled and source_tag in ld_sources:
-                src_img = detect_and_crop_logo(
-                    src_img,
-                    method=ld_method,
-                    min_content_ratio=ld_min_content,
-                    max_crop_ratio=ld_max_crop,
-                    debug_log=lambda m: _emit_log(callbacks, m)
-                )
-
-            # Auto-centering if enabled and source is in configured sources
-            centering = (0.5, 0.5)
-            if ac_enabled and source_tag in ac_sources:
-                centering, (mx, my, cnt) = _best_centering_for_img(
-                    src_img, out_size,
-                    steps=ac_steps, span=ac_span,
-                    alpha_threshold=ac_alpha_threshold, margin_pct=ac_margin_pct
-                )
-                dx, dy = abs(mx - 0.5), abs(my - 0.5)
-                if dx > ac_tolerance or dy > ac_tolerance:
-                    (rev_dir / f"{slug}__offcenter.json").write_text(
-                        json.dumps({
-                            "title": title,
-                            "platform": platform_key,
-                            "source": source_tag,
-                            "centering": [centering[0], centering[1]],
-                            "content_centroid": [mx, my],
-                            "deviation": [dx, dy],
-                            "count": cnt
-                        }, indent=2),
-                        encoding="utf-8"
-                    )
-                    _emit_log(callbacks, f"[ALIGN] Off-center: {platform_key}: {title} centroid=({mx:.3f},{my:.3f})")
-
-            out_img = compose_with_border(src_img, border_path, out_size, centering=centering)
             # Ensure game folder exists
             ensure_dir(out_path.parent)
-            # Save as icon
-            save_image_for_export(out_img, out_path, export_format, jpeg_quality)
+            # Save as icon (reusing a previous render when source, border and settings match)
+            source_hash = sha256_bytes(img_bytes)
+            icon_future = encode_pool.submit(
+                render_icon_cached,
+                img_bytes, source_hash, source_tag, border_path, get_border_hash(border_path),
+                out_size, export_format, jpeg_quality, render_settings, cache_dir, out_path,
+                debug_log=lambda m: _emit_log(callbacks, m), export_preset=export_preset
+            )
 
             # Handle title image - either scrape logo or duplicate boxart
-            file_ext = get_export_extension(export_format)
-            title_path = out_path.parent / f"title.{file_ext}"
-            logo_saved = False
+            title_path = out_path.parent / f"title.{get_export_extension(output_profile['title']['format'])}"
 
+            # Look up the logo while the icon renders
             if scrape_logos and api_key:
                 # Try to fetch logo from SteamGridDB
                 try:
@@ -4081,32 +6353,13 @@ def run_job(
                         platform_hints=hints,
                         callbacks=callbacks
                     )
-
                     if logo_result:
                         logo_bytes, _ = logo_result
-                        try:
-                            logo_img = Image.open(BytesIO(logo_bytes))
-                            logo_img = ImageOps.exif_transpose(logo_img).convert("RGBA")
-                            save_image_for_export(logo_img, title_path, export_format, jpeg_quality)
-                            logo_saved = True
-                            _emit_log(callbacks, f"[LOGO] Saved logo as title for {title}")
-                        except Exception as le:
-                            _emit_log(callbacks, f"[LOGO] Failed to save logo: {le}")
+                        logo_future = encode_pool.submit(encode_file, logo_bytes, title_path, output_profile["title"])
                 except Exception as logo_err:
                     _emit_log(callbacks, f"[LOGO] Error fetching logo for {title}: {logo_err}")
 
-            # If no logo was saved and fallback is enabled, use boxart duplicate
-            if not logo_saved and (logo_fallback_to_boxart or not scrape_logos):
-                save_image_for_export(out_img, title_path, export_format, jpeg_quality)
-                if scrape_logos:
-                    _emit_log(callbacks, f"[LOGO] No logo found, using boxart as fallback for title")
-
-            _emit_preview(callbacks, out_path, title, platform_key)
-            if source_tag:
-                _emit_log(callbacks, f"[OK] {platform_key}: {title} ({source_tag}) -> {out_path.parent.name}/")
-            else:
-                _emit_log(callbacks, f"[OK] {platform_key}: {title} -> {out_path.parent.name}/")
-
+            # Hero and screenshot encodes queued while the next downloads run
             # Download hero images if enabled
             if download_heroes and api_key:
                 try:
@@ -4131,14 +6384,10 @@ def run_job(
                     )
 
                     for hero_bytes, hero_filename in heroes:
-                        hero_path = out_path.parent / f"{hero_filename}.{file_ext}"
-                        try:
-                            hero_img = Image.open(BytesIO(hero_bytes))
-                            hero_img = ImageOps.exif_transpose(hero_img).convert("RGBA")
-                            save_image_for_export(hero_img, hero_path, export_format, jpeg_quality)
-                            _emit_log(callbacks, f"[HERO] Saved {hero_filename} for {title}")
-                        except Exception as he:
-                            _emit_log(callbacks, f"[HERO] Failed to save {hero_filename}: {he}")
+                        hero_path = out_path.parent / f"{hero_filename}.{get_export_extension(output_profile['hero']['format'])}"
+                        pending_encodes.append(
+                            (encode_pool.submit(encode_file, hero_bytes, hero_path, output_profile["hero"]), "HERO", hero_filename)
+                        )
 
                 except Exception as hero_err:
                     _emit_log(callbacks, f"[HERO] Error downloading heroes for {title}: {hero_err}")
@@ -4194,18 +6443,140 @@ def run_job(
 
                     # Save screenshots with slide_Y naming
                     for screenshot_bytes, screenshot_filename in screenshots:
-                        screenshot_path = out_path.parent / f"{screenshot_filename}.{file_ext}"
-                        try:
-                            screenshot_img = Image.open(BytesIO(screenshot_bytes))
-                            screenshot_img = ImageOps.exif_transpose(screenshot_img).convert("RGBA")
-                            save_image_for_export(screenshot_img, screenshot_path, export_format, jpeg_quality)
-                            _emit_log(callbacks, f"[SCREENSHOT] Saved {screenshot_filename} for {title}")
-                        except Exception as se:
-                            _emit_log(callbacks, f"[SCREENSHOT] Failed to save {screenshot_filename}: {se}")
+                        screenshot_path = out_path.parent / f"{screenshot_filename}.{get_export_extension(output_profile['slide']['format'])}"
+                        pending_encodes.append(
+                            (encode_pool.submit(encode_file, screenshot_bytes, screenshot_path, output_profile["slide"]), "SCREENSHOT", screenshot_filename)
+                        )
 
                 except Exception as screenshot_err:
                     _emit_log(callbacks, f"[SCREENSHOT] Error downloading screenshots for {title}: {screenshot_err}")
 
+            # Wait for a completion slot, then hand the title over and return to downloading
+            while not finish_slots.acquire(timeout=0.5):
+                if cancel.is_cancelled:
+                    abandon_item(out_path, icon_future, logo_future, pending_encodes)
+                    return False
+            try:
+                finished = finish_pool.submit(
+                    finish_item, platform_key, title, slug, out_path, rev_dir, border_path,
+                    img_bytes, source_hash, source_tag, source_url,
+                    icon_future, logo_future, title_path, pending_encodes
+                )
+            except Exception:
+                finish_slots.release()
+                raise
+
+            def on_finished(f: Future) -> None:
+                finish_slots.release()
+                # Dropped from the queue on cancel: nothing will record this title
+                if f.cancelled():
+                    abandon_item(out_path, icon_future, logo_future, pending_encodes)
+
+            finished.add_done_callback(on_finished)
+            return finished
+        except Exception as e:
+            abandon_item(out_path, icon_future, logo_future, pending_encodes)
+            _emit_log(callbacks, f"[ERROR] {platform_key}: {title} - Compose error: {e}")
+            (rev_dir / f"{slug}__compose_error.json").write_text(
+                json.dumps({"title": title, "platform": platform_key, "source": source_tag, "error": str(e)}, indent=2),
+                encoding="utf-8"
+            )
+            return False
+
+    def finish_item(platform_key: str, title: str, slug: str, out_path: Path, rev_dir: Path, border_path: Path,
+                    img_bytes, source_hash: str, source_tag: Optional[str], source_url: Optional[str],
+                    icon_future: Future, logo_future: Optional[Future], title_path: Path,
+                    pending_encodes: List[Tuple[Future, str, str]]) -> bool:
+        """Completion stage for one title (runs on finish_pool); returns whether it succeeded."""
+        try:
+            icon_img, centering, centroid, cache_hit = icon_future.result()
+            if cache_hit:
+                _emit_log(callbacks, f"[CACHE] Reused render for {platform_key}: {title}")
+            written_files = [out_path.name]
+            logo_saved = False
+            title_source = None
+
+            # Smaller icon sizes, derived from the composed icon
+            icon_variants_future = None
+            if output_profile["icon"]["variants"]:
+                icon_variants_future = encode_pool.submit(encode_icon_variants, icon_img, out_path)
+
+            if centroid is not None:
+                mx, my, cnt = centroid
+                dx, dy = abs(mx - 0.5), abs(my - 0.5)
+                if dx > ac_tolerance or dy > ac_tolerance:
+                    (rev_dir / f"{slug}__offcenter.json").write_text(
+                        json.dumps({
+                            "title": title,
+                            "platform": platform_key,
+                            "source": source_tag,
+                            "centering": [centering[0], centering[1]],
+                            "content_centroid": [mx, my],
+                            "deviation": [dx, dy],
+                            "count": cnt
+                        }, indent=2),
+                        encoding="utf-8"
+                    )
+                    _emit_log(callbacks, f"[ALIGN] Off-center: {platform_key}: {title} centroid=({mx:.3f},{my:.3f})")
+
+            if logo_future is not None:
+                try:
+                    written_files.extend(logo_future.result())
+                    logo_saved = True
+                    title_source = "logo"
+                    _emit_log(callbacks, f"[LOGO] Saved logo as title for {title}")
+                except Exception as le:
+                    _emit_log(callbacks, f"[LOGO] Failed to save logo: {le}")
+
+            # If no logo was saved and fallback is enabled, use boxart duplicate
+            if not logo_saved and (logo_fallback_to_boxart or not scrape_logos):
+                if icon_variants_future is not None:
+                    written_files.extend(icon_variants_future.result())
+                    icon_variants_future = None
+                written_files.extend(
+                    export_boxart_title(out_path, title_path, output_profile, preset=export_preset, icon_img=icon_img)
+                )
+                title_source = "boxart"
+                if scrape_logos:
+                    _emit_log(callbacks, f"[LOGO] No logo found, using boxart as fallback for title")
+
+            _emit_preview(callbacks, out_path, title, platform_key)
+            if source_tag:
+                _emit_log(callbacks, f"[OK] {platform_key}: {title} ({source_tag}) -> {out_path.parent.name}/")
+            else:
+                _emit_log(callbacks, f"[OK] {platform_key}: {title} -> {out_path.parent.name}/")
+
+            if icon_variants_future is not None:
+                pending_encodes = [(icon_variants_future, "ICON", "size variants")] + pending_encodes
+            for fut, tag, name in pending_encodes:
+                try:
+                    written_files.extend(fut.result())
+                    _emit_log(callbacks, f"[{tag}] Saved {name} for {title}")
+                except Exception as ee:
+                    _emit_log(callbacks, f"[{tag}] Failed to save {name}: {ee}")
+
+            if manifest is not None:
+                try:
+                    store_source_bytes(cache_dir, img_bytes, source_hash)
+                    manifest.record_asset(
+                        game_dir=out_path.parent,
+                        platform=platform_key,
+                        title=title,
+                        slug=slug,
+                        files=written_files,
+                        source_tag=source_tag,
+                        source_url=source_url,
+                        source_hash=source_hash,
+                        border_path=border_path,
+                        border_hash=get_border_hash(border_path),
+                        centering=centering,
+                        out_size=out_size,
+                        export_format=export_format,
+                        title_source=title_source,
+                    )
+                except Exception as me:
+                    _emit_log(callbacks, f"[MANIFEST] Failed to record {title}: {me}")
+
             return True
         except Exception as e:
             _emit_log(callbacks, f"[ERROR] {platform_key}: {title} - Compose error: {e}")
@@ -4217,6 +6588,23 @@ def run_job(
 
     max_workers = max(1, int(workers))
 
+    def count_item(ok: bool) -> None:
+        nonlocal done, errors
+        with done_lock:
+            if not ok:
+                errors += 1
+            done += 1
+            _emit_progress(callbacks, done, total)
+
+    def track_item(result) -> None:
+        """Count a title now, or when its completion stage finishes."""
+        if isinstance(result, Future):
+            result.add_done_callback(
+                lambda f: count_item(not f.cancelled() and f.exception() is None and bool(f.result()))
+            )
+        else:
+            count_item(bool(result))
+
     # For interactive mode, process sequentially but with prefetching
     if interactive_mode:
         _emit_log(callbacks, "[INTERACTIVE] Using sequential processing with prefetching")
@@ -4225,11 +6613,12 @@ def run_job(
                 _emit_log(callbacks, "[STOP] Cancelled by user.")
                 break
 
-            # Start prefetching next game's artwork while processing current
-            if i + 1 < len(tasks):
-                next_p, next_t, _, _, _ = tasks[i + 1]
-                next_hints = platform_hints_cfg.get(next_p, []) or []
-                start_prefetch(next_p, next_t, next_hints)
+            # Prefetch the next titles' artwork while the user picks for this one
+            if prefetcher is not None:
+                prefetcher.schedule([
+                    (f"{next_p}:{next_t}", (next_p, next_t, platform_hints_cfg.get(next_p, []) or []))
+                    for next_p, next_t, _, _, _ in tasks[i + 1:i + 1 + prefetcher.depth]
+                ])
 
             ok = False
             try:
@@ -4238,12 +6627,12 @@ def run_job(
                 _emit_log(callbacks, f"[ERROR] {p}: {t} - {e}")
                 ok = False
 
-            if not ok:
-                errors += 1
+            # Titles skipped before fetching (existing output, no providers, ...) never take
+            # their prefetched options
+            if prefetcher is not None:
+                prefetcher.discard(f"{p}:{t}")
 
-            with done_lock:
-                done += 1
-                _emit_progress(callbacks, done, total)
+            track_item(ok)
     else:
         # Non-interactive mode: use parallel processing
         with ThreadPoolExecutor(max_workers=max_workers) as ex:
@@ -4265,12 +6654,28 @@ def run_job(
                 except Exception:
                     ok = False
 
-                if not ok:
-                    errors += 1
+                track_item(ok)
 
-                with done_lock:
-                    done += 1
-                    _emit_progress(callbacks, done, total)
+    if prefetcher is not None:
+        prefetcher.close()
+    # Completion waits on encodes, so it is drained first. On cancel, queued titles
+    # are dropped but running ones still finish and reach the manifest.
+    finish_pool.shutdown(wait=True, cancel_futures=cancel.is_cancelled)
+    encode_pool.shutdown(wait=True, cancel_futures=cancel.is_cancelled)
+
+    if manifest is not None:
+        if not cancel.is_cancelled:
+            try:
+                pruned = prune_source_cache(cache_dir, manifest.source_hashes())
+                if pruned:
+                    _emit_log(callbacks, f"[MANIFEST] Removed {pruned} cached sources no longer used by any icon")
+            except Exception as pe:
+                _emit_log(callbacks, f"[MANIFEST] Could not prune cached sources: {pe}")
+        manifest.close()
+
+    freed = prune_render_cache(cache_dir, render_cache_max_bytes(cfg))
+    if freed:
+        _emit_log(callbacks, f"[CACHE] Removed {freed // (1024 * 1024)} MB of least recently used renders")
 
     if cancel.is_cancelled:
         return False, f"Cancelled. Completed {done}/{total} (errors={errors})."
@@ -4291,6 +6696,250 @@ def run_job(
     return True, f"Finished. Completed {done}/{total} (errors={errors})."
 
 
+# ==========================
+# Offline Rebuild
+# ==========================
+# Icons per worker task in the offline rebuild; a task shares one border
+REBUILD_BATCH_SIZE = 8
+
+def _rebuild_icon_batch_worker(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Re-render game folders that share a border from their cached source images
+    (runs in a worker process). Icons are composited as one batch; the rest of
+    each folder is then finished by _finish_rebuild_job.
+    """
+    first = jobs[0]
+    profile = first["output_profile"]
+    export_format = profile["icon"]["format"]
+    file_ext = get_export_extension(export_format)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    items = []
+    item_jobs = []
+    for i, job in enumerate(jobs):
+        try:
+            game_dir = Path(job["game_dir"])
+            ensure_dir(game_dir)
+            items.append({
+                "img_bytes": Path(job["source_path"]).read_bytes(),
+                "source_hash": job["source_hash"],
+                "source_tag": job["source_tag"],
+                "out_path": game_dir / f"icon.{file_ext}",
+            })
+            item_jobs.append(i)
+        except Exception as e:
+            results[i] = {"ok": False, "error": str(e)}
+
+    rendered = render_icons_cached_batch(
+        items, Path(first["border_path"]), first["border_hash"], profile["icon"]["size"], export_format,
+        profile["icon"]["quality"], first["render_settings"], Path(first["cache_dir"]),
+        export_preset=first["export_preset"]
+    )
+    for i, item, result in zip(item_jobs, items, rendered):
+        if isinstance(result, Exception):
+            results[i] = {"ok": False, "error": str(result)}
+            continue
+        icon_img, centering, _, _ = result
+        results[i] = _finish_rebuild_job(jobs[i], item["out_path"], icon_img, centering)
+    return results
+
+
+def _finish_rebuild_job(job: Dict[str, Any], icon_path: Path, icon_img: Optional[Image.Image],
+                        centering: Tuple[float, float]) -> Dict[str, Any]:
+    """
+    Complete one rebuilt game folder after its icon was written: icon variants,
+    the title when it was a copy of the icon, and re-encoding of remaining images
+    whose format or size no longer match the output profile (old files removed).
+    """
+    game_dir = Path(job["game_dir"])
+    profile = job["output_profile"]
+    try:
+        files = {icon_path.name}
+        if profile["icon"]["variants"]:
+            if icon_img is None:
+                with Image.open(icon_path) as im:
+                    icon_img = im.convert("RGBA")
+            files.update(export_variants(icon_img, icon_path, profile["icon"], preset=job["export_preset"]))
+
+        title_path = game_dir / f"title.{get_export_extension(profile['title']['format'])}"
+        if job["title_source"] == "boxart":
+            files.update(export_boxart_title(icon_path, title_path, profile, preset=job["export_preset"], icon_img=icon_img))
+
+        for name in job["files"]:
+            old_path = game_dir / name
+            stem = old_path.stem
+            base_stem = variant_base_stem(name)
+            if base_stem == "icon" or (base_stem == "title" and job["title_source"] == "boxart"):
+                if name not in files and old_path.exists():
+                    old_path.unlink()
+                continue
+            if not old_path.exists():
+                continue
+            spec = profile[asset_type_for_file(name)]
+            ext = get_export_extension(spec["format"])
+            with Image.open(old_path) as im:
+                if old_path.suffix.lstrip(".").lower() == ext and fit_scale(im.size, spec["max_size"]) >= 1.0:
+                    files.add(name)
+                    continue
+                im = ImageOps.exif_transpose(im).convert("RGBA")
+            new_path = game_dir / f"{stem}.{ext}"
+            export_image(im, new_path, spec, preset=job["export_preset"])
+            if new_path != old_path:
+                old_path.unlink()
+            files.add(new_path.name)
+
+        return {"ok": True, "files": sorted(files), "centering": centering}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+def rebuild_icons_offline(
+    cfg: dict,
+    platforms: List[str],
+    output_dir: Path,
+    cache_dir: Path,
+    borders_dir: Path,
+    cancel: CancelToken,
+    callbacks=None,
+    custom_border_settings: Optional[Dict[str, Any]] = None,
+    border_path_override: Optional[str] = None
+) -> Tuple[bool, str]:
+    """
+    Re-render every icon in the manifest from its cached source image.
+
+    Uses the current border, output size, export format and auto-centering /
+    logo detection settings. Makes no network requests; folders whose source
+    image is not in the cache (e.g. generated before sources were kept) are
+    skipped. Rendering runs in a process pool sized to the CPU count.
+    """
+    output_profile = load_output_profile(cfg)
+    export_preset = str(cfg.get("export_preset", DEFAULT_EXPORT_PRESET)).lower()
+    render_settings = load_render_settings(cfg)
+    platforms_cfg = cfg.get("platforms", {}) or {}
+
+    try:
+        manifest = open_manifest(output_dir)
+    except Exception as e:
+        return False, f"Failed to open manifest: {e}"
+
+    try:
+        rows = [a for a in manifest.assets() if not platforms or a["platform"] in platforms]
+        _emit_log(callbacks, f"[REBUILD] {len(rows)} assets in manifest for selected platforms")
+
+        borders: Dict[str, Optional[Path]] = {}
+        border_hashes: Dict[str, Optional[str]] = {}
+        jobs = []
+        missing = 0
+        for row in rows:
+            platform_key = row["platform"]
+            if platform_key not in borders:
+                borders[platform_key] = resolve_border_path(
+                    platform_key, platforms_cfg.get(platform_key, {}) or {}, borders_dir,
+                    custom_border_settings=custom_border_settings,
+                    border_path_override=border_path_override,
+                    callbacks=callbacks
+                )
+            border_path = borders[platform_key]
+            source_path = get_source_cache_path(cache_dir, row["source_hash"]) if row["source_hash"] else None
+            if border_path is None or source_path is None or not source_path.exists():
+                missing += 1
+                continue
+            if str(border_path) not in border_hashes:
+                try:
+                    border_hashes[str(border_path)] = sha256_file(border_path)
+                except Exception:
+                    border_hashes[str(border_path)] = None
+            jobs.append((row, border_path, {
+                "game_dir": str(row["path"]),
+                "cache_dir": str(cache_dir),
+                "source_path": str(source_path),
+                "source_hash": row["source_hash"],
+                "source_tag": row["source_tag"],
+                "border_path": str(border_path),
+                "border_hash": border_hashes[str(border_path)],
+                "output_profile": output_profile,
+                "export_preset": export_preset,
+                "render_settings": render_settings,
+                "title_source": row["title_source"],
+                "files": row["files"],
+            }))
+
+        if missing:
+            _emit_log(callbacks, f"[REBUILD] Skipping {missing} assets without a cached source or border")
+
+        total = len(jobs)
+        if total == 0:
+            return True, "Nothing to rebuild (no cached sources)."
+
+        max_workers = os.cpu_count() or 1
+        _emit_log(callbacks, f"[PLAN] Rebuilding {total} icons offline. Processes={max_workers}")
+        _emit_progress(callbacks, 0, total)
+
+        # Batches of icons sharing a border, small enough to keep every process busy
+        by_border: Dict[str, List[Tuple[Dict[str, Any], Path, Dict[str, Any]]]] = {}
+        for row, border_path, job in jobs:
+            by_border.setdefault(str(border_path), []).append((row, border_path, job))
+        batch_size = max(1, min(REBUILD_BATCH_SIZE, math.ceil(total / max_workers)))
+        batches = [
+            group[i:i + batch_size]
+            for group in by_border.values()
+            for i in range(0, len(group), batch_size)
+        ]
+
+        done = 0
+        errors = 0
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(_rebuild_icon_batch_worker, [job for _, _, job in batch]): batch for batch in batches}
+
+            for fut in as_completed(futures):
+                if cancel.is_cancelled:
+                    _emit_log(callbacks, "[STOP] Cancelled by user. Cancelling remaining tasks...")
+                    ex.shutdown(wait=False, cancel_futures=True)
+                    break
+
+                batch = futures[fut]
+                try:
+                    batch_results = fut.result()
+                except Exception as e:
+                    batch_results = [{"ok": False, "error": str(e)}] * len(batch)
+
+                for (row, border_path, _), result in zip(batch, batch_results):
+                    if result["ok"]:
+                        manifest.record_asset(
+                            game_dir=row["path"],
+                            platform=row["platform"],
+                            title=row["title"],
+                            slug=row["slug"],
+                            files=result["files"],
+                            source_tag=row["source_tag"],
+                            source_url=row["source_url"],
+                            source_hash=row["source_hash"],
+                            border_path=border_path,
+                            border_hash=border_hashes[str(border_path)],
+                            centering=result["centering"],
+                            out_size=output_profile["icon"]["size"],
+                            export_format=output_profile["icon"]["format"],
+                            replace_files=True,
+                        )
+                        _emit_log(callbacks, f"[OK] {row['platform']}: {row['title']} (rebuilt) -> {row['name']}/")
+                    else:
+                        errors += 1
+                        _emit_log(callbacks, f"[ERROR] {row['platform']}: {row['title']} - Rebuild error: {result['error']}")
+
+                    done += 1
+                    _emit_progress(callbacks, done, total)
+    finally:
+        manifest.close()
+
+    freed = prune_render_cache(cache_dir, render_cache_max_bytes(cfg))
+    if freed:
+        _emit_log(callbacks, f"[CACHE] Removed {freed // (1024 * 1024)} MB of least recently used renders")
+
+    if cancel.is_cancelled:
+        return False, f"Cancelled. Rebuilt {done}/{total} (errors={errors})."
+    return True, f"Finished. Rebuilt {done}/{total} (errors={errors}, skipped={missing})."
+
+
 def copy_output_to_device(
     output_dir: Path,
     device_base_path: str,
@@ -4345,64 +6994,65 @@ def copy_output_to_device(
         _emit_log(callbacks, f"[DEVICE] Failed to check devices: {e}")
         return 0, 1
 
-    # Iterate through platform folders in output directory
     output_dir = Path(output_dir)
     if not output_dir.exists():
         _emit_log(callbacks, f"[DEVICE] Output directory not found: {output_dir}")
         return 0, 1
 
-    for platform_folder in output_dir.iterdir():
-        if not platform_folder.is_dir():
-            continue
+    # The manifest lists every generated game folder and its files, so no tree walk is needed
+    try:
+        with open_manifest(output_dir, import_existing=True) as manifest:
+            assets = manifest.assets()
+    except Exception as e:
+        _emit_log(callbacks, f"[DEVICE] Failed to read asset manifest: {e}")
+        return 0, 1
 
-        platform_name = platform_folder.name
-        _emit_log(callbacks, f"[DEVICE] Processing platform: {platform_name}")
+    current_platform = None
+    for asset in assets:
+        platform_name = asset["folder"]
+        if platform_name != current_platform:
+            current_platform = platform_name
+            _emit_log(callbacks, f"[DEVICE] Processing platform: {platform_name}")
 
-        # Iterate through game folders
-        for game_folder in platform_folder.iterdir():
-            if not game_folder.is_dir():
-                continue
+        game_folder = asset["path"]
+        game_name = asset["name"]
+        device_game_path = f"{device_base_path}/{platform_name}/{game_name}"
 
-            game_name = game_folder.name
-            device_game_path = f"{device_base_path}/{platform_name}/{game_name}"
+        # Create directory on device
+        try:
+            subprocess.run(
+                [adb_path, "shell", "mkdir", "-p", device_game_path],
+                capture_output=True, timeout=30,
+                **_get_subprocess_flags()
+            )
+        except Exception as e:
+            _emit_log(callbacks, f"[DEVICE] Failed to create directory for {game_name}: {e}")
+            errors += 1
+            continue
+
+        # Copy the files recorded for this game folder (size variants stay local)
+        for file_name in asset["device_files"]:
+            file_path = game_folder / file_name
+            device_file_path = f"{device_game_path}/{file_name}"
 
-            # Create directory on device
             try:
-                subprocess.run(
-                    [adb_path, "shell", "mkdir", "-p", device_game_path],
-                    capture_output=True, timeout=30,
+                result = subprocess.run(
+                    [adb_path, "push", str(file_path), device_file_path],
+                    capture_output=True, text=True, timeout=60,
                     **_get_subprocess_flags()
                 )
-            except Exception as e:
-                _emit_log(callbacks, f"[DEVICE] Failed to create directory for {game_name}: {e}")
-                errors += 1
-                continue
 
-            # Copy all files in game folder
-            for file_path in game_folder.iterdir():
-                if not file_path.is_file():
-                    continue
-
-                device_file_path = f"{device_game_path}/{file_path.name}"
-
-                try:
-                    result = subprocess.run(
-                        [adb_path, "push", str(file_path), device_file_path],
-                        capture_output=True, text=True, timeout=60,
-                        **_get_subprocess_flags()
-                    )
-
-                    if result.returncode == 0:
-                        copied += 1
-                    else:
-                        _emit_log(callbacks, f"[DEVICE] Failed to copy {file_path.name}: {result.stderr}")
-                        errors += 1
-
-                except subprocess.TimeoutExpired:
-                    _emit_log(callbacks, f"[DEVICE] Timeout copying {file_path.name}")
-                    errors += 1
-                except Exception as e:
-                    _emit_log(callbacks, f"[DEVICE] Error copying {file_path.name}: {e}")
+                if result.returncode == 0:
+                    copied += 1
+                else:
+                    _emit_log(callbacks, f"[DEVICE] Failed to copy {file_name}: {result.stderr}")
                     errors += 1
 
+            except subprocess.TimeoutExpired:
+                _emit_log(callbacks, f"[DEVICE] Timeout copying {file_name}")
+                errors += 1
+            except Exception as e:
+                _emit_log(callbacks, f"[DEVICE] Error copying {file_name}: {e}")
+                errors += 1
+
     return copied, errors
@@ -34,6 +34,10 @@ def setup_working_directory():
 
 
 if __name__ == "__main__":
+    # Needed for the offline rebuild process pool in frozen builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     # Set working directory before importing other modules
     setup_working_directory()
 
@@ -0,0 +1,51 @@
+"""
+Manifest reconciliation with the output folder.
+
+Folders removed by hand must drop out of the manifest when it is read, and an
+explicit rescan must pick up folders that were written without a row.
+"""
+import shutil
+
+from asset_manifest import open_manifest
+
+
+def _write_game(output_dir, key, files=("icon.png", "title.png")):
+    game_dir = output_dir / key
+    game_dir.mkdir(parents=True)
+    for name in files:
+        (game_dir / name).write_bytes(b"x")
+    return game_dir
+
+
+def _record(manifest, game_dir, files=("icon.png", "title.png")):
+    manifest.record_asset(game_dir=game_dir, platform="SNES", title=game_dir.name, slug=game_dir.name, files=files)
+
+
+def test_deleted_folders_and_files_are_pruned(tmp_path):
+    kept = _write_game(tmp_path, "snes/Kept")
+    gone = _write_game(tmp_path, "snes/Gone")
+    no_icon = _write_game(tmp_path, "snes/No_Icon")
+    with open_manifest(tmp_path, import_existing=True) as manifest:
+        for game_dir in (kept, gone, no_icon):
+            _record(manifest, game_dir)
+
+    shutil.rmtree(gone)
+    (kept / "title.png").unlink()
+    (no_icon / "icon.png").unlink()
+
+    with open_manifest(tmp_path, import_existing=True) as manifest:
+        assets = manifest.assets()
+    assert [a["game_dir"] for a in assets] == ["snes/Kept"]
+    assert assets[0]["files"] == ["icon.png"]
+
+
+def test_rescan_imports_folders_without_a_row(tmp_path):
+    with open_manifest(tmp_path, import_existing=True) as manifest:
+        _record(manifest, _write_game(tmp_path, "snes/Recorded"))
+    _write_game(tmp_path, "snes/Unrecorded")
+
+    # The one-time back-fill already ran, so a plain open does not walk the folder
+    with open_manifest(tmp_path, import_existing=True) as manifest:
+        assert manifest.count() == 1
+    with open_manifest(tmp_path, import_existing=True, rescan=True) as manifest:
+        assert [a["game_dir"] for a in manifest.assets()] == ["snes/Recorded", "snes/Unrecorded"]
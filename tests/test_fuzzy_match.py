@@ -0,0 +1,59 @@
+"""
+Fuzzy title matching against a golden corpus.
+
+fixtures/fuzzy_corpus.json holds a few hundred game titles, ROM-style and
+free-form queries, and the top 20 matches the linear scan returned for each
+query at thresholds 0.5, 0.6 and 0.7 before titles were indexed and
+normalization moved to title_normalize. Both the plain-list path and the
+indexed PlatformTitles path (read from a dataset snapshot) must reproduce it.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+import dataset_snapshot
+import run_backend
+
+CORPUS_PATH = Path(__file__).parent / "fixtures" / "fuzzy_corpus.json"
+THRESHOLDS = (0.5, 0.6, 0.7)
+TOP = 20
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return json.loads(CORPUS_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def snapshot_titles(corpus, tmp_path_factory):
+    path = tmp_path_factory.mktemp("snapshot") / "snapshot.sqlite"
+    dataset_snapshot.build_snapshot(
+        path, {"Test Platform": corpus["titles"]}, run_backend.fuzzy_title_keys, str.lower, dataset_hash="golden"
+    )
+    snap = dataset_snapshot.DatasetSnapshot(path)
+    yield snap["Test Platform"]
+    snap.close()
+
+
+def _ranked(results):
+    return [[title, score] for title, score in results]
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+def test_plain_list_matches_golden(corpus, threshold):
+    for query in corpus["queries"]:
+        got = _ranked(run_backend.fuzzy_match_title(query, list(corpus["titles"]), threshold=threshold))
+        assert got[:TOP] == corpus["expected"][f"{threshold}|{query}"], query
+
+
+@pytest.mark.parametrize("threshold", THRESHOLDS)
+def test_indexed_titles_match_plain_list(corpus, snapshot_titles, threshold):
+    assert isinstance(snapshot_titles, dataset_snapshot.PlatformTitles)
+    for query in corpus["queries"]:
+        indexed = run_backend.fuzzy_match_title(query, snapshot_titles, threshold=threshold)
+        plain = run_backend.fuzzy_match_title(query, list(corpus["titles"]), threshold=threshold)
+        assert indexed == plain, query
+        assert _ranked(indexed)[:TOP] == corpus["expected"][f"{threshold}|{query}"], query
+    # The index was built and used, not the fallback scan
+    assert "fuzzy_index" in snapshot_titles.derived
@@ -0,0 +1,130 @@
+"""
+Logo detection against recorded full-resolution output.
+
+The fixtures are generated from fixed seeds: solid logos and logos made of
+separate glyphs, on opaque background art or on transparency, at 1-2k pixels.
+logo_detection_expected.json holds the boxes the full-resolution detector
+produced for them before the proxy existed. Both the full-resolution path
+(logo_detection.proxy_max_edge: 0) and the default proxy path must reproduce
+them exactly.
+
+Regenerate the expected boxes from the repository root with
+`python -m tests.test_logo_detection`.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+import run_backend
+
+pytest.importorskip("cv2")
+
+EXPECTED_PATH = Path(__file__).parent / "fixtures" / "logo_detection_expected.json"
+
+# (name, seed, width, height, kind, opaque background)
+FIXTURES = [
+    ("solid_square_opaque", 1, 1536, 1536, "solid", True),
+    ("solid_wide_opaque", 2, 2048, 1024, "solid", True),
+    ("solid_tall_alpha", 3, 1024, 1792, "solid", False),
+    ("solid_offset_opaque", 4, 1800, 1800, "solid", True),
+    ("glyphs_square_alpha", 5, 1536, 1536, "glyphs", False),
+    ("glyphs_wide_opaque", 6, 2048, 1152, "glyphs", True),
+    ("glyphs_small_opaque", 7, 1024, 1024, "glyphs", True),
+    ("solid_small_alpha", 8, 1024, 1024, "solid", False),
+]
+
+# More glyph logos on transparency, where the proxy's largest region is often
+# not the full-resolution one (thin outlines have almost no contour area)
+PARITY_CASES = [
+    (100, 2400, 768, "glyphs", False),
+    (110, 1024, 1024, "glyphs", False),
+    (125, 1024, 1024, "glyphs", False),
+    (138, 1024, 1800, "glyphs", False),
+    (139, 2048, 1536, "glyphs", False),
+    (140, 2048, 1024, "glyphs", False),
+]
+
+
+def make_fixture(seed: int, width: int, height: int, kind: str, opaque: bool) -> Image.Image:
+    rng = np.random.RandomState(seed)
+    if opaque:
+        # Smooth low-contrast background art
+        yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+        base = 90 + 40 * np.sin(xx / (width / 3.0) + seed) * np.cos(yy / (height / 2.5))
+        rgb = np.stack([base, base * 0.8 + 20, base * 0.6 + 40], axis=-1)
+        arr = np.dstack([np.clip(rgb, 0, 255).astype(np.uint8), np.full((height, width), 255, np.uint8)])
+    else:
+        arr = np.zeros((height, width, 4), np.uint8)
+    img = Image.fromarray(arr, "RGBA")
+    draw = ImageDraw.Draw(img)
+
+    lw = int(width * rng.uniform(0.35, 0.6))
+    lh = int(height * rng.uniform(0.25, 0.45))
+    x0 = int(rng.uniform(0.05, 0.95) * (width - lw))
+    y0 = int(rng.uniform(0.05, 0.95) * (height - lh))
+    color = tuple(int(c) for c in rng.randint(180, 256, 3)) + (255,)
+    if kind == "solid":
+        draw.rounded_rectangle((x0, y0, x0 + lw, y0 + lh), radius=lh // 6, fill=color,
+                               outline=(20, 20, 20, 255), width=max(2, lw // 80))
+        # Some inner detail
+        draw.ellipse((x0 + lw // 4, y0 + lh // 4, x0 + lw // 2, y0 + 3 * lh // 4), fill=(30, 60, 160, 255))
+    else:
+        count = int(rng.randint(4, 7))
+        gap = lw // (count * 3)
+        gw = (lw - gap * (count - 1)) // count
+        for i in range(count):
+            gx = x0 + i * (gw + gap)
+            gh = int(lh * rng.uniform(0.6, 1.0))
+            gy = y0 + (lh - gh) // 2
+            draw.rectangle((gx, gy, gx + gw, gy + gh), fill=color)
+            draw.rectangle((gx + gw // 3, gy + gh // 4, gx + 2 * gw // 3, gy + gh // 2), fill=(20, 20, 20, 255))
+    return img
+
+
+def _expected():
+    return json.loads(EXPECTED_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def fixtures():
+    return {name: make_fixture(seed, w, h, kind, opaque) for name, seed, w, h, kind, opaque in FIXTURES}
+
+
+def test_full_resolution_matches_recorded_output(fixtures):
+    expected = _expected()
+    for name, img in fixtures.items():
+        bbox = run_backend._detect_logo_region_cv2(img)
+        assert list(bbox) == expected[name], name
+
+
+def test_default_render_settings_use_the_proxy():
+    rs = run_backend.load_render_settings({"logo_detection": {"enabled": True}})
+    assert rs["ld_proxy_max_edge"] == run_backend.LOGO_DETECT_MAX_EDGE
+    rs = run_backend.load_render_settings({"logo_detection": {"enabled": True, "proxy_max_edge": 0}})
+    assert rs["ld_proxy_max_edge"] == 0
+
+
+def test_proxy_matches_recorded_output(fixtures):
+    expected = _expected()
+    for name, img in fixtures.items():
+        bbox = run_backend._detect_logo_region_cv2(img, max_edge=run_backend.LOGO_DETECT_MAX_EDGE)
+        assert list(bbox) == expected[name], name
+
+
+@pytest.mark.parametrize("seed, width, height, kind, opaque", PARITY_CASES)
+def test_proxy_matches_full_resolution(seed, width, height, kind, opaque):
+    img = make_fixture(seed, width, height, kind, opaque)
+    full = run_backend._detect_logo_region_cv2(img)
+    assert run_backend._detect_logo_region_cv2(img, max_edge=run_backend.LOGO_DETECT_MAX_EDGE) == full
+
+
+if __name__ == "__main__":
+    boxes = {}
+    for name, seed, w, h, kind, opaque in FIXTURES:
+        bbox = run_backend._detect_logo_region_cv2(make_fixture(seed, w, h, kind, opaque))
+        boxes[name] = list(bbox)
+        print(name, bbox)
+    EXPECTED_PATH.write_text(json.dumps(boxes, indent=2) + "\n", encoding="utf-8")
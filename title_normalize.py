@@ -0,0 +1,171 @@
+"""
+Game title normalization for iiSU Asset Tool.
+
+ROM names are cleaned (region/version/dump tags and extensions removed) and
+normalized for searching many times over: per ROM while scanning, per provider
+and search variant for each title, and per candidate while matching. All
+patterns here are compiled once, and the single-name functions remember their
+last results, so repeating a title costs a dictionary lookup.
+
+normalize_titles() is the batch form for long lists (dataset titles, app
+lists, device folders): each distinct name is normalized once, without going
+through the per-title memo so a bulk list does not push out the titles
+currently being processed.
+
+rom_parser re-exports clean_game_title and normalize_for_search from here.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Iterable, List
+
+# Per-function memo size; a scan or job touches a few thousand distinct names
+_MEMO_SIZE = 8192
+
+# Built on first use from rom_parser.ROM_EXTENSIONS (rom_parser imports this module)
+_extension_re = None
+
+_ARCHIVE_RE = re.compile(r'\.(zip|7z|rar)$', re.IGNORECASE)
+_BRACKET_TAG_RE = re.compile(r'\s*\[[^\]]*\]')
+_FILE_SIZE_RE = re.compile(r'\s*\(\s*\d+\.?\d*\s*(GB|MB|KB|B|bytes?)?\s*\)', re.IGNORECASE)
+_BARE_SIZE_RE = re.compile(r'\s*\(\s*\d{6,}\s*\)')
+_REGION_TAG_RE = re.compile(
+    r'\s*\((USA|US|Europe|EU|Japan|JP|World|WLD|En|Fr|De|Es|It|Ja|Ko|Zh|Rev\s*[A-Z0-9]*|v\d+[.\d]*|Proto|Beta|Alpha|Demo|Sample|Unl|Pirate|Virtual Console|Switch|NSW|PS4|PS5|Xbox|XB1|PC|[A-Za-z]{2}(,[A-Za-z]{2})*)\)',
+    re.IGNORECASE,
+)
+_VERSION_RE = re.compile(r'\s*v\d+(\.\d+)*', re.IGNORECASE)
+_VERSION_WORD_RE = re.compile(r'\s*version\s*\d+(\.\d+)*', re.IGNORECASE)
+_DISC_RE = re.compile(r'\s*\(Disc\s*\d+[^)]*\)', re.IGNORECASE)
+_UPDATE_TAG_RE = re.compile(r'\s*\+?\s*(Update|DLC|Patch|Fix|Hotfix)\s*v?\d*(\.\d+)*', re.IGNORECASE)
+_EMPTY_PARENS_RE = re.compile(r'\s*\(\s*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r"[^\w\s'-]")
+_PAREN_TAG_RE = re.compile(r'\s*\([^)]*\)\s*')
+_SPACED_BRACKET_TAG_RE = re.compile(r'\s*\[[^\]]*\]\s*')
+
+# Character substitutions applied after accents are stripped
+_SEARCH_TRANSLATION = str.maketrans({
+    '&': 'and',
+    '+': 'plus',
+    '@': 'at',
+    '™': '',     # trade mark
+    '®': '',     # registered
+    '©': '',     # copyright
+    '–': '-',    # en dash
+    '—': '-',    # em dash
+    '…': '...',  # ellipsis
+})
+
+
+def _rom_extension_re() -> "re.Pattern":
+    global _extension_re
+    if _extension_re is None:
+        try:
+            from rom_parser import ROM_EXTENSIONS
+            extensions = sorted({ext.strip('.') for exts in ROM_EXTENSIONS.values() for ext in exts})
+        except ImportError:
+            extensions = []
+        _extension_re = re.compile(r'\.(' + '|'.join(['zip', '7z', 'rar'] + extensions) + r')$', re.IGNORECASE)
+    return _extension_re
+
+
+def _clean_game_title(name: str) -> str:
+    # Remove file extension if present, then a remaining archive suffix
+    name = _rom_extension_re().sub('', name)
+    name = _ARCHIVE_RE.sub('', name)
+
+    # Square bracket tags like [!], [U], [h], [b]
+    name = _BRACKET_TAG_RE.sub('', name)
+
+    # File sizes like (6.01 GB), (500 KB), and bare numbers in parens (123456789)
+    name = _FILE_SIZE_RE.sub('', name)
+    name = _BARE_SIZE_RE.sub('', name)
+
+    # Region/version tags like (USA), (Rev A), (v1.0), (En,Fr,De)
+    name = _REGION_TAG_RE.sub('', name)
+
+    # Version patterns like v1.0.1, V2.3, version 1.0
+    name = _VERSION_RE.sub('', name)
+    name = _VERSION_WORD_RE.sub('', name)
+
+    # Disc numbers, update/DLC/patch tags, leftover empty parentheses
+    name = _DISC_RE.sub('', name)
+    name = _UPDATE_TAG_RE.sub('', name)
+    name = _EMPTY_PARENS_RE.sub('', name)
+
+    name = _WHITESPACE_RE.sub(' ', name).strip()
+
+    # Trailing dashes, underscores, or dots
+    return name.rstrip('-_. ')
+
+
+def _normalize_for_search(name: str) -> str:
+    name = _clean_game_title(name)
+
+    # Strip accents: NFD splits é into e + combining mark, then marks are dropped
+    if not name.isascii():
+        name = ''.join(c for c in unicodedata.normalize('NFD', name) if unicodedata.category(c) != 'Mn')
+
+    name = name.translate(_SEARCH_TRANSLATION)
+
+    # Remove most punctuation but keep apostrophes and hyphens for names
+    name = _PUNCTUATION_RE.sub(' ', name)
+    return _WHITESPACE_RE.sub(' ', name).strip()
+
+
+def _normalize_game_name(name: str) -> str:
+    # Region/revision tags in () and dump tags in [] become spaces
+    normalized = _PAREN_TAG_RE.sub(' ', name)
+    normalized = _SPACED_BRACKET_TAG_RE.sub(' ', normalized)
+    normalized = normalized.replace('_', ' ')
+    return ' '.join(normalized.split()).lower().strip()
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def clean_game_title(name: str) -> str:
+    """
+    Clean a ROM filename/folder name to extract a clean game title.
+    Removes region tags, version info, dump info, file extensions, file sizes, etc.
+    """
+    return _clean_game_title(name)
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def normalize_for_search(name: str) -> str:
+    """
+    Normalize a game title for search - handles accented characters,
+    special characters, and common variations.
+    Returns a search-friendly version of the name.
+    """
+    return _normalize_for_search(name)
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def normalize_game_name(name: str) -> str:
+    """Normalize a game folder name for comparing local and device folders (tags removed, lowercase)."""
+    return _normalize_game_name(name)
+
+
+def normalize_titles(names: Iterable[str], normalize: Callable[[str], str] = normalize_for_search) -> List[str]:
+    """
+    Apply one of this module's normalizations to every name, in order.
+
+    Each distinct name is normalized once, bypassing the per-title memo so a
+    long list does not evict the entries in it.
+    """
+    impl = _BATCH_IMPLS.get(normalize, normalize)
+    done = {}
+    out = []
+    for name in names:
+        result = done.get(name)
+        if result is None:
+            result = done[name] = impl(name)
+        out.append(result)
+    return out
+
+
+_BATCH_IMPLS = {
+    clean_game_title: _clean_game_title,
+    normalize_for_search: _normalize_for_search,
+    normalize_game_name: _normalize_game_name,
+}
@@ -433,7 +433,8 @@ class MainWindowWithTabs(QMainWindow):
                     processing_settings = cfg.get("processing", {})
                     export_settings = {
                         "format": cfg.get("export_format", "PNG"),
-                        "jpeg_quality": cfg.get("jpeg_quality", 95)
+                        "jpeg_quality": cfg.get("jpeg_quality", 95),
+                        "preset": cfg.get("export_preset", "balanced")
                     }
             except Exception:
                 pass
@@ -588,6 +589,7 @@ class MainWindowWithTabs(QMainWindow):
             if export_settings:
                 cfg["export_format"] = export_settings.get("format", "PNG")
                 cfg["jpeg_quality"] = export_settings.get("jpeg_quality", 95)
+                cfg["export_preset"] = export_settings.get("preset", "balanced")
 
             # Custom platforms
             if custom_platforms: